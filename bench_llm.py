@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga de las rutas LLM contra el servidor simulado
+
+Arranca src/llm/fake_server.py en el propio proceso (sin red ni API key)
+y mide, con noticias sintéticas:
+1. La validación (NewsValidatorAgent.validate_batch) en secuencia, con
+   concurrencia, con lotes, y repetida con la caché de respuestas
+2. El scoring en paralelo (OpenAIProvider.score_many)
+3. La generación de threads (AITweetGenerator.generate_all)
+
+Uso:
+    python bench_llm.py [--news 100] [--latency-ms 200] [--error-rate 0.02] [--rpm 600]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.resolve() / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+from agents.news_validator_agent import NewsValidatorAgent  # noqa: E402
+from generators.ai_tweet_generator import AITweetGenerator  # noqa: E402
+from llm.backends import create_llm_client  # noqa: E402
+from llm.fake_server import FakeChatServer  # noqa: E402
+from llm.openai_provider import OpenAIProvider  # noqa: E402
+from llm.response_cache import LLMResponseCache  # noqa: E402
+from llm.scheduler import LLMScheduler  # noqa: E402
+
+
+def make_news(count):
+    """Noticias sintéticas (cada una distinta)."""
+    return [{
+        'title': f"Benchmark news {i}: new release of framework {i % 17}",
+        'summary': f"Resumen sintético de la noticia {i} con detalles técnicos " * 3,
+        'source': f"Source {i % 5}",
+        'published': '2026-01-01T00:00:00Z',
+        'link': f"https://example.com/news/{i}"
+    } for i in range(count)]
+
+
+def run_case(name, func, server):
+    """Ejecuta un caso sin su salida por consola y muestra tiempos y requests."""
+    before = dict(server.stats)
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        scheduler = func()
+    elapsed = time.perf_counter() - start
+
+    requests = server.stats['requests'] - before['requests']
+    stats = scheduler.stats()
+    print(f"   {name:<32} {elapsed:7.2f} s  {requests:4d} requests  "
+          f"{stats['calls'] / elapsed if elapsed else 0:6.1f} llamadas/s  "
+          f"p95 {stats['latency_p95_ms']:5.0f} ms  reintentos {stats['retries']:3d}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga de las rutas LLM sin red")
+    parser.add_argument('--news', type=int, default=100, help='Noticias sintéticas')
+    parser.add_argument('--latency-ms', type=float, default=200, help='Latencia del servidor')
+    parser.add_argument('--error-rate', type=float, default=0.02, help='Probabilidad de error 5xx')
+    parser.add_argument('--rpm', type=int, default=None, help='Rate limit del servidor (requests/min)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Llamadas simultáneas')
+    args = parser.parse_args()
+
+    news = make_news(args.news)
+
+    with FakeChatServer(
+        latency_ms=args.latency_ms,
+        error_rate=args.error_rate,
+        requests_per_minute=args.rpm
+    ) as server, tempfile.TemporaryDirectory() as workdir:
+        client = create_llm_client(backend='http', base_url=server.url)
+
+        def scheduler(concurrency, cache=None):
+            return LLMScheduler(max_concurrency=concurrency, base_backoff=0.1, cache=cache)
+
+        def validate(concurrency, batch_size, cache=None):
+            def run():
+                agent = NewsValidatorAgent(scheduler=scheduler(concurrency, cache), client=client)
+                agent.validate_batch([dict(item) for item in news], batch_size=batch_size)
+                return agent.scheduler
+            return run
+
+        print(f"\n🧪 Servidor simulado: {server.url} (latencia {args.latency_ms:.0f} ms, "
+              f"errores {args.error_rate:.0%}, rpm {args.rpm or 'sin límite'})")
+        print(f"\n🤖 Validación de {args.news} noticias:")
+        run_case("secuencial, 1 por request", validate(1, 1), server)
+        run_case(f"concurrencia {args.concurrency}, 1 por request", validate(args.concurrency, 1), server)
+        run_case(f"concurrencia {args.concurrency}, lotes de 10", validate(args.concurrency, 10), server)
+
+        cache = LLMResponseCache(str(Path(workdir) / "llm_cache.db"))
+        run_case("lotes de 10, caché fría", validate(args.concurrency, 10, cache), server)
+        run_case("lotes de 10, caché caliente", validate(args.concurrency, 10, cache), server)
+
+        def score():
+            provider = OpenAIProvider(None, scheduler=scheduler(args.concurrency), client=client)
+            provider.score_many(news)
+            return provider.scheduler
+
+        def generate():
+            news_file = Path(workdir) / "selected_news.json"
+            with open(news_file, 'w', encoding='utf-8') as f:
+                json.dump(news[:20], f)
+            provider = OpenAIProvider(None, scheduler=scheduler(args.concurrency), client=client)
+            generator = AITweetGenerator(str(news_file), provider=provider)
+            generator.generate_all()
+            return generator.provider.scheduler
+
+        print(f"\n🧠 Scoring y generación:")
+        run_case(f"score_many ({args.news} noticias)", score, server)
+        run_case("generate_all (20 threads)", generate, server)
+
+        print(f"\n📊 Servidor: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Benchmark de arranque de la CLI (src/main.py)
+
+Mide, en procesos nuevos:
+1. El tiempo total de `python src/main.py list` y de `review` (saliendo
+   en la primera noticia), con un directorio de datos temporal
+2. El tiempo de importar cada módulo que usan los comandos
+3. Los módulos que más tardan en importarse al cargar main.py
+   (python -X importtime)
+
+Uso:
+    python bench_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.resolve() / "src"
+MAIN = SRC_DIR / "main.py"
+
+# Módulo que importa cada comando de main.py
+COMMAND_MODULES = {
+    'main': 'main',
+    'collect': 'utils.collection_orchestrator',
+    'select': 'agent',
+    'review': 'ml.news_selector_model',
+    'generate': 'generators.ai_tweet_generator',
+    'validate': 'agents.news_validator_agent',
+}
+
+SAMPLE_NEWS = [{
+    'title': 'Benchmark news item',
+    'link': 'https://example.com/news',
+    'source': 'Benchmark',
+    'summary': 'Noticia de ejemplo para medir el arranque',
+    'relevance_score': 42.0
+}]
+
+
+def time_process(args, cwd, stdin_text='', env=None):
+    """Ejecuta un proceso y devuelve su duración en ms."""
+    start = time.perf_counter()
+    subprocess.run(
+        args,
+        cwd=cwd,
+        input=stdin_text,
+        text=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_commands(runs, env):
+    """Tiempo total de los comandos rápidos de la CLI."""
+    with tempfile.TemporaryDirectory() as workdir:
+        data_dir = Path(workdir) / "data"
+        data_dir.mkdir()
+        with open(data_dir / "selected_news.json", 'w', encoding='utf-8') as f:
+            json.dump(SAMPLE_NEWS, f)
+
+        cases = {
+            'python (vacío)': ([sys.executable, '-c', 'pass'], ''),
+            'main.py list': ([sys.executable, str(MAIN), 'list'], ''),
+            # 'x' termina la revisión en la primera noticia
+            'main.py review': ([sys.executable, str(MAIN), 'review'], 'x\n'),
+        }
+
+        print(f"\n⏱️  Comandos (mediana de {runs} ejecuciones):")
+        for name, (args, stdin_text) in cases.items():
+            times = [time_process(args, workdir, stdin_text, env) for _ in range(runs)]
+            print(f"   {name:<20} {statistics.median(times):8.1f} ms")
+
+
+def bench_imports(runs, env):
+    """Tiempo de importar el módulo de cada comando en un proceso nuevo."""
+    print(f"\n📦 Import por comando (mediana de {runs} ejecuciones):")
+    for command, module in COMMAND_MODULES.items():
+        code = (
+            "import sys, time; sys.path.insert(0, %r); t = time.perf_counter(); "
+            "import %s; print((time.perf_counter() - t) * 1000)" % (str(SRC_DIR), module)
+        )
+        times = []
+        for _ in range(runs):
+            result = subprocess.run(
+                [sys.executable, '-c', code],
+                capture_output=True,
+                text=True,
+                env=env
+            )
+            if result.returncode != 0:
+                times = None
+                break
+            times.append(float(result.stdout.strip().splitlines()[-1]))
+
+        if times is None:
+            print(f"   {command:<10} {module:<35} (no se pudo importar)")
+        else:
+            print(f"   {command:<10} {module:<35} {statistics.median(times):8.1f} ms")
+
+
+def top_imports(limit, env):
+    """Módulos más lentos de importar al cargar main.py (-X importtime)."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import main'],
+        cwd=SRC_DIR,
+        capture_output=True,
+        text=True,
+        env=env
+    )
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), name.strip()))
+
+    print("\n🐢 Imports más lentos de main.py (acumulado):")
+    for cumulative_us, name in sorted(rows, reverse=True)[:limit]:
+        print(f"   {cumulative_us / 1000:8.1f} ms  {name}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de arranque de src/main.py")
+    parser.add_argument('--runs', type=int, default=10, help='Ejecuciones por medida')
+    parser.add_argument('--top', type=int, default=10, help='Imports lentos a mostrar')
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    bench_commands(args.runs, env)
+    bench_imports(args.runs, env)
+    top_imports(args.top, env)
+
+
+if __name__ == "__main__":
+    main()
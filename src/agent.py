@@ -13,6 +13,7 @@ from typing import List, Dict
 
 from utils.news_filter import NewsFilter
 from utils.news_scorer import NewsScorer
+from utils.news_item import json_default, to_news_items
 
 
 class NewsAgent:
@@ -99,7 +100,7 @@ class NewsAgent:
         output_file.parent.mkdir(exist_ok=True)
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(news_list, f, ensure_ascii=False, indent=2)
+            json.dump(news_list, f, ensure_ascii=False, indent=2, default=json_default)
         
         print(f"💾 Noticias seleccionadas guardadas en: {output_path}")
 
@@ -108,7 +109,7 @@ class NewsAgent:
 if __name__ == "__main__":
     # Cargar noticias recopiladas
     with open("data/news.json", 'r', encoding='utf-8') as f:
-        all_news = json.load(f)
+        all_news = to_news_items(json.load(f))
     
     # Crear agente
     agent = NewsAgent()
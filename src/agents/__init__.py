@@ -6,7 +6,19 @@ Este paquete contiene agentes especializados:
 - ContinuousCollectorAgent: Recopila noticias continuamente
 """
 
-from .news_validator_agent import NewsValidatorAgent
-from .continuous_collector_agent import ContinuousCollectorAgent
+from importlib import import_module
+
+# Import perezoso: importar un submódulo (p.ej. `from agents.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'NewsValidatorAgent': 'news_validator_agent',
+    'ContinuousCollectorAgent': 'continuous_collector_agent'
+}
 
 __all__ = ['NewsValidatorAgent', 'ContinuousCollectorAgent']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
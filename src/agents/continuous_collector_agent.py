@@ -8,12 +8,29 @@ Este agente:
 4. Evita duplicados
 """
 
+import sys
 import time
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-import hashlib
+from typing import List, Dict, Optional
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.seen_store import SeenURLStore
+from utils.bloom_filter import ScalableBloomFilter
+from utils.date_normalizer import ensure_published_ts
+from utils.near_duplicates import DEFAULT_THRESHOLD, NearDuplicateIndex
+from utils.news_item import json_default, to_news_items
+from utils.news_filter import NewsFilter
+
+# El Bloom filter se reconstruye si tiene este múltiplo de las claves
+# vigentes, o si con al menos BLOOM_MIN_CHECKS consultas la tasa de falsos
+# positivos observada supera BLOOM_MAX_FPR_FACTOR veces la objetivo
+BLOOM_MAX_STALE_RATIO = 2
+BLOOM_MIN_CHECKS = 1000
+BLOOM_MAX_FPR_FACTOR = 10
 
 
 class ContinuousCollectorAgent:
@@ -31,7 +48,13 @@ class ContinuousCollectorAgent:
         self,
         interval_minutes: int = 30,
         max_age_hours: int = 4,
-        storage_path: str = "data/realtime_news.json"
+        storage_path: str = "data/realtime_news.json",
+        seen_db_path: str = "data/seen_urls.db",
+        seen_ttl_days: int = 30,
+        use_bloom_filter: bool = True,
+        bloom_error_rate: float = 0.001,
+        bloom_path: str = "data/seen_bloom",
+        near_duplicate_threshold: Optional[float] = DEFAULT_THRESHOLD
     ):
         """
         Inicializa el agente recopilador continuo.
@@ -40,29 +63,142 @@ class ContinuousCollectorAgent:
             interval_minutes: Minutos entre recopilaciones
             max_age_hours: Máxima antigüedad de noticias (horas)
             storage_path: Ruta para guardar noticias
+            seen_db_path: Base SQLite con las URLs/títulos ya vistos
+            seen_ttl_days: Días que se recuerda una noticia vista
+            use_bloom_filter: Usar Bloom filter como pre-filtro de duplicados
+            bloom_error_rate: Tasa de falsos positivos objetivo del Bloom filter
+            bloom_path: Carpeta donde se guarda el Bloom filter (mmap)
+            near_duplicate_threshold: Similitud para descartar casi duplicados
+                de otras fuentes (None para desactivarlo)
         """
         self.interval_minutes = interval_minutes
         self.max_age_hours = max_age_hours
         self.storage_path = Path(storage_path)
-        self.seen_urls: Set[str] = set()
         
-        # Cargar URLs vistas si existen
-        self._load_seen_urls()
+        # URLs vistas: SQLite con lookups por índice (no se carga en memoria)
+        self.seen_store = SeenURLStore(
+            db_path=seen_db_path,
+            ttl_days=seen_ttl_days
+        )
+        
+        # Pre-filtro opcional: "seguro que no lo vi" sin tocar SQLite
+        self.bloom: Optional[ScalableBloomFilter] = None
+        if use_bloom_filter:
+            self.bloom = ScalableBloomFilter(
+                directory=bloom_path,
+                error_rate=bloom_error_rate
+            )
+            self._sync_bloom_filter()
+        
+        # Casi duplicados (misma historia, otro titular) entre iteraciones
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.near_duplicates: Optional[NearDuplicateIndex] = None
+        if near_duplicate_threshold is not None:
+            # Solo hace falta recordar noticias que aún pasarían el filtro de antigüedad
+            self.near_duplicates = NearDuplicateIndex(
+                threshold=near_duplicate_threshold,
+                ttl_hours=max_age_hours
+            )
     
-    def _load_seen_urls(self):
-        """Carga las URLs ya vistas para evitar duplicados."""
-        seen_file = Path("data/seen_urls.txt")
-        if seen_file.exists():
-            with open(seen_file, 'r') as f:
-                self.seen_urls = set(line.strip() for line in f)
+    def _sync_bloom_filter(self):
+        """
+        Añade al Bloom filter las claves que el almacén exacto tiene y el
+        filtro no (filtro recién creado o iteraciones ejecutadas sin él).
+        Un filtro desactualizado daría falsos negativos.
+        """
+        reason = self._bloom_rebuild_reason()
+        if reason:
+            self._rebuild_bloom_filter(reason)
+            return
+        
+        synced_at = self.seen_store.get_meta('bloom_synced_at')
+        since = 0 if self.bloom.is_new or synced_at is None else int(synced_at)
+        
+        for key in self.seen_store.iter_keys(since=since):
+            self.bloom.add(key)
+        
+        self.bloom.flush()
+        self.seen_store.set_meta('bloom_synced_at', str(int(time.time())))
+        self.seen_store.commit()
+    
+    def _bloom_rebuild_reason(self) -> Optional[str]:
+        """
+        Decide si el Bloom filter debe reconstruirse desde el almacén exacto.
+        
+        El filtro no olvida claves, así que las expiradas en el almacén
+        siguen dando "quizás" (consultas a SQLite de más).
+        
+        Returns:
+            Motivo de la reconstrucción o None si no hace falta
+        """
+        built_at = self.seen_store.get_meta('bloom_built_at')
+        if built_at is None:
+            return "sin fecha de construcción"
+        
+        # Así como mucho la mitad del TTL en claves expiradas
+        if time.time() - float(built_at) > self.seen_store.ttl_seconds / 2:
+            return "antigüedad"
+        
+        stats = self.bloom.stats()
+        if stats['keys'] > BLOOM_MAX_STALE_RATIO * max(len(self.seen_store), 1):
+            return "claves expiradas"
+        
+        if (stats['checks'] >= BLOOM_MIN_CHECKS
+                and stats['observed_fpr'] > BLOOM_MAX_FPR_FACTOR * stats['target_fpr']):
+            return "falsos positivos"
+        
+        return None
+    
+    def _rebuild_bloom_filter(self, reason: str):
+        """
+        Vacía el Bloom filter y lo llena solo con las claves vigentes.
+        
+        Args:
+            reason: Motivo (se muestra en consola)
+        """
+        self.bloom.clear()
+        count = 0
+        for key in self.seen_store.iter_keys():
+            self.bloom.add(key)
+            count += 1
+        
+        self.bloom.flush()
+        now = str(int(time.time()))
+        self.seen_store.set_meta('bloom_built_at', now)
+        self.seen_store.set_meta('bloom_synced_at', now)
+        self.seen_store.commit()
+        print(f"   🌸 Bloom filter reconstruido ({reason}): {count} claves vigentes")
     
     def _save_seen_urls(self):
-        """Guarda las URLs vistas."""
-        seen_file = Path("data/seen_urls.txt")
-        seen_file.parent.mkdir(exist_ok=True)
-        with open(seen_file, 'w') as f:
-            for url in self.seen_urls:
-                f.write(f"{url}\n")
+        """Guarda las URLs vistas (solo escribe las nuevas)."""
+        if self.bloom:
+            self.bloom.flush()
+            self.seen_store.set_meta('bloom_synced_at', str(int(time.time())))
+        self.seen_store.commit()
+        
+        # El commit acaba de expirar claves del almacén
+        if self.bloom:
+            reason = self._bloom_rebuild_reason()
+            if reason:
+                self._rebuild_bloom_filter(reason)
+    
+    def _is_seen(self, key: bytes) -> bool:
+        """
+        Verifica una clave: primero en el Bloom filter, luego en el almacén exacto.
+        
+        Args:
+            key: Clave de 16 bytes
+            
+        Returns:
+            True si ya fue vista
+        """
+        if self.bloom and not self.bloom.might_contain(key):
+            return False
+        
+        seen = self.seen_store.contains(key)
+        if self.bloom and not seen:
+            self.bloom.record_false_positive()
+        return seen
     
     def _is_duplicate(self, news_item: Dict) -> bool:
         """
@@ -78,12 +214,11 @@ class ContinuousCollectorAgent:
         title = news_item.get('title', '')
         
         # Verificar por URL
-        if url and url in self.seen_urls:
+        if url and self._is_seen(SeenURLStore.make_key(url)):
             return True
         
         # Verificar por hash del título
-        title_hash = hashlib.md5(title.encode()).hexdigest()
-        if title_hash in self.seen_urls:
+        if self._is_seen(SeenURLStore.make_key(title)):
             return True
         
         return False
@@ -93,11 +228,14 @@ class ContinuousCollectorAgent:
         url = news_item.get('link', '')
         title = news_item.get('title', '')
         
+        keys = [SeenURLStore.make_key(title)]
         if url:
-            self.seen_urls.add(url)
+            keys.append(SeenURLStore.make_key(url))
         
-        title_hash = hashlib.md5(title.encode()).hexdigest()
-        self.seen_urls.add(title_hash)
+        for key in keys:
+            self.seen_store.add(key)
+            if self.bloom:
+                self.bloom.add(key)
     
     def collect_realtime_news(self) -> List[Dict]:
         """
@@ -217,11 +355,18 @@ class ContinuousCollectorAgent:
         )
         print(f"      ✅ {len(devto_news)} artículos nuevos")
         all_news.extend(devto_news)
+        all_news = to_news_items(all_news)
         
         # Filtrar por antigüedad y duplicados
-        cutoff_time = datetime.now() - timedelta(hours=self.max_age_hours)
+        cutoff_ts = int(time.time()) - self.max_age_hours * 3600
         fresh_news = []
-        stats = {'total': len(all_news), 'duplicates': 0, 'old': 0, 'new': 0}
+        stats = {'total': len(all_news), 'duplicates': 0, 'near_duplicates': 0, 'old': 0, 'new': 0}
+        
+        # Misma historia desde varias fuentes en esta iteración: quedarse con una
+        if self.near_duplicates:
+            merged_news = NewsFilter.remove_near_duplicates(all_news, self.near_duplicate_threshold)
+            stats['near_duplicates'] += len(all_news) - len(merged_news)
+            all_news = merged_news
         
         for news in all_news:
             # Verificar duplicado
@@ -229,17 +374,17 @@ class ContinuousCollectorAgent:
                 stats['duplicates'] += 1
                 continue
             
-            # Verificar antigüedad
-            published = news.get('published', '')
-            if published:
-                try:
-                    from dateutil import parser
-                    pub_date = parser.parse(published)
-                    if pub_date.timestamp() < cutoff_time.timestamp():
-                        stats['old'] += 1
-                        continue
-                except:
-                    pass
+            # Verificar antigüedad (epoch UTC calculado al recopilar)
+            published_ts = ensure_published_ts(news)
+            if published_ts is not None and published_ts < cutoff_ts:
+                stats['old'] += 1
+                continue
+            
+            # Verificar casi duplicado de iteraciones anteriores (al final:
+            # solo se indexan noticias que pasaron los demás filtros)
+            if self.near_duplicates and self.near_duplicates.check_and_add(news):
+                stats['near_duplicates'] += 1
+                continue
             
             # Noticia válida
             fresh_news.append(news)
@@ -250,7 +395,15 @@ class ContinuousCollectorAgent:
         print(f"      Total recopiladas: {stats['total']}")
         print(f"      🆕 Nuevas: {stats['new']}")
         print(f"      🔄 Duplicadas: {stats['duplicates']}")
+        print(f"      🧬 Casi duplicadas: {stats['near_duplicates']}")
         print(f"      ⏰ Antiguas: {stats['old']}")
+        if self.bloom:
+            bloom_stats = self.bloom.stats()
+            print(f"      🌸 Bloom filter: {bloom_stats['negatives']}/{bloom_stats['checks']} "
+                  f"descartes sin consultar SQLite, "
+                  f"FPR observada {bloom_stats['observed_fpr']:.4%} "
+                  f"(estimada {bloom_stats['estimated_fpr']:.4%}, "
+                  f"objetivo {bloom_stats['target_fpr']:.4%})")
         
         # Guardar URLs vistas
         self._save_seen_urls()
@@ -281,7 +434,7 @@ class ContinuousCollectorAgent:
         
         # Guardar
         with open(self.storage_path, 'w', encoding='utf-8') as f:
-            json.dump(existing_news, f, ensure_ascii=False, indent=2)
+            json.dump(existing_news, f, ensure_ascii=False, indent=2, default=json_default)
         
         print(f"   💾 Guardadas en: {self.storage_path}")
     
@@ -343,7 +496,11 @@ class ContinuousCollectorAgent:
         except KeyboardInterrupt:
             print(f"\n\n🛑 Agente detenido por el usuario")
             print(f"   Total iteraciones: {iteration}")
-            print(f"   URLs vistas: {len(self.seen_urls)}")
+            print(f"   URLs vistas: {len(self.seen_store)}")
+        finally:
+            self.seen_store.close()
+            if self.bloom:
+                self.bloom.close()
 
 
 # Ejemplo de uso
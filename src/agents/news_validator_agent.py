@@ -9,14 +9,74 @@ Este agente usa OpenAI GPT para:
 """
 
 import os
+import sys
+import time
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Dict, List, Optional
-from openai import OpenAI
 import json
 from dotenv import load_dotenv
 
-# Cargar variables de entorno
-load_dotenv()
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from llm.backends import create_llm_client
+from llm.prompts import PromptTemplate, count_tokens
+from llm.scheduler import LLMScheduler, get_llm_scheduler
+from utils.date_normalizer import ensure_published_ts
+from utils.news_item import json_default, to_news_items
+
+# Validación por lotes: noticias por request, presupuesto de tokens de las
+# noticias de cada request y tokens de respuesta reservados por noticia
+BATCH_SIZE = 10
+MAX_BATCH_TOKENS = 2500
+OUTPUT_TOKENS_PER_ITEM = 120
+
+# Antigüedad máxima (horas) de una noticia "reciente"
+RECENT_HOURS = 24
+
+VALIDATOR_ROLE = "Eres un experto analista de noticias tech que evalúa relevancia y calidad."
+
+# Formato de respuesta de cada prompt (van al final del prefijo estático)
+SINGLE_RESPONSE_FORMAT = """TAREA: Analiza la noticia tech que recibirás y determina su relevancia TÉCNICA.
+
+RESPONDE SOLO CON JSON (sin markdown, sin explicaciones extra):
+{
+  "is_recent": true,
+  "relevance_score": 85,
+  "quality_score": 90,
+  "reason": "Next.js 15 release con Turbopack - muy relevante para frameworks",
+  "topics_matched": ["Frameworks/Frontend"]
+}
+
+IMPORTANTE:
+- is_recent: true si <24h, false si más antiguo
+- Sé ESTRICTO con relevance_score (solo 80+ si es realmente importante)
+- Penaliza clickbait, tutoriales básicos, noticias genéricas
+- Prioriza: official releases, breaking changes, benchmarks, technical decisions"""
+
+BATCH_RESPONSE_FORMAT = """TAREA: Analiza las noticias tech que recibirás (cada una con su id) y determina la relevancia TÉCNICA de cada una.
+
+RESPONDE SOLO CON JSON (sin markdown, sin explicaciones extra), un resultado por noticia con su id:
+{
+  "results": [
+    {
+      "id": 0,
+      "is_recent": true,
+      "relevance_score": 85,
+      "quality_score": 90,
+      "reason": "Next.js 15 release con Turbopack - muy relevante para frameworks",
+      "topics_matched": ["Frameworks/Frontend"]
+    }
+  ]
+}
+
+IMPORTANTE:
+- Evalúa cada noticia por separado
+- is_recent: true si <24h, false si más antiguo
+- Sé ESTRICTO con relevance_score (solo 80+ si es realmente importante)
+- Penaliza clickbait, tutoriales básicos, noticias genéricas
+- Prioriza: official releases, breaking changes, benchmarks, technical decisions"""
 
 
 class NewsValidatorAgent:
@@ -30,18 +90,22 @@ class NewsValidatorAgent:
     - ¿Es duplicada?
     """
     
-    def __init__(self, model: str = "gpt-3.5-turbo"):
+    def __init__(self, model: str = "gpt-3.5-turbo", scheduler: LLMScheduler = None, client=None):
         """
         Inicializa el agente validador.
         
         Args:
             model: Modelo de OpenAI a usar
+            scheduler: Planificador de llamadas LLM (por defecto el compartido)
+            client: Cliente de chat completions (por defecto el del backend
+                configurado, ver llm.backends)
         """
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY no encontrada en variables de entorno")
+        # Cargar variables de entorno (al crear el agente, no al importar el módulo)
+        load_dotenv()
         
-        self.client = OpenAI(api_key=self.api_key)
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.client = client or create_llm_client(self.api_key)
+        self.scheduler = scheduler or get_llm_scheduler()
         self.model = model
         
         # Temas prioritarios ULTRA ESPECÍFICOS
@@ -101,30 +165,22 @@ class NewsValidatorAgent:
             "Celebrity tech news",
             "Product marketing sin sustancia técnica"
         ]
-    
-    def validate_news(self, news_item: Dict) -> Dict:
-        """
-        Valida una noticia individual usando LLM.
-        
-        Args:
-            news_item: Diccionario con la información de la noticia
-            
-        Returns:
-            Dict con validación: {
-                'is_valid': bool,
-                'is_recent': bool,
-                'relevance_score': float (0-100),
-                'quality_score': float (0-100),
-                'reason': str,
-                'topics_matched': List[str]
-            }
-        """
-        title = news_item.get('title', '')
-        summary = news_item.get('summary', '')
-        source = news_item.get('source', '')
-        published = news_item.get('published', '')
         
-        # Prompt MEJORADO para el LLM
+        # Prompts precompilados: el prefijo estático (rol + criterios +
+        # formato) se construye una vez y es idéntico en cada request, así
+        # el proveedor puede reutilizarlo (prompt caching)
+        self.criteria_text = self._criteria_text()
+        self.single_prompt = PromptTemplate(
+            system=f"{VALIDATOR_ROLE}\n\n{self.criteria_text}\n\n{SINGLE_RESPONSE_FORMAT}",
+            user_template="NOTICIA:\n{news}"
+        )
+        self.batch_prompt = PromptTemplate(
+            system=f"{VALIDATOR_ROLE}\n\n{self.criteria_text}\n\n{BATCH_RESPONSE_FORMAT}",
+            user_template="NOTICIAS ({count}):\n{news_blocks}"
+        )
+    
+    def _criteria_text(self) -> str:
+        """Intereses, exclusiones y criterios de evaluación (comunes a todos los prompts)."""
         topics_text = "\n".join([
             f"{category}:\n" + "\n".join(f"  - {item}" for item in items)
             for category, items in self.priority_topics.items()
@@ -132,15 +188,7 @@ class NewsValidatorAgent:
         
         exclude_text = "\n".join(f"- {topic}" for topic in self.exclude_topics)
         
-        prompt = f"""Analiza esta noticia tech y determina su relevancia TÉCNICA.
-
-NOTICIA:
-Título: {title}
-Resumen: {summary}
-Fuente: {source}
-Publicada: {published}
-
-INTERESES ULTRA ESPECÍFICOS (en orden de prioridad):
+        return f"""INTERESES ULTRA ESPECÍFICOS (en orden de prioridad):
 {topics_text}
 
 NO ME INTERESA:
@@ -160,75 +208,290 @@ CALIDAD (0-100):
 - 70-89: Contenido técnico sólido, bien documentado
 - 50-69: Información correcta pero no profunda
 - 30-49: Superficial o marketing-heavy
-- 0-29: Clickbait, sin sustancia técnica
-
-RESPONDE SOLO CON JSON (sin markdown, sin explicaciones extra):
-{{
-  "is_recent": true,
-  "relevance_score": 85,
-  "quality_score": 90,
-  "reason": "Next.js 15 release con Turbopack - muy relevante para frameworks",
-  "topics_matched": ["Frameworks/Frontend"]
-}}
-
-IMPORTANTE:
-- is_recent: true si <24h, false si más antiguo
-- Sé ESTRICTO con relevance_score (solo 80+ si es realmente importante)
-- Penaliza clickbait, tutoriales básicos, noticias genéricas
-- Prioriza: official releases, breaking changes, benchmarks, technical decisions
-"""
+- 0-29: Clickbait, sin sustancia técnica"""
+    
+    @staticmethod
+    def _news_text(news_item: Dict) -> str:
+        """Bloque con los datos de una noticia para el prompt."""
+        return (
+            f"Título: {news_item.get('title', '')}\n"
+            f"Resumen: {news_item.get('summary', '')}\n"
+            f"Fuente: {news_item.get('source', '')}\n"
+            f"Publicada: {news_item.get('published', '')}"
+        )
+    
+    @staticmethod
+    def _finalize_validation(validation: Dict) -> Dict:
+        """Agrega el campo is_valid a una validación del LLM."""
+        validation['is_valid'] = (
+            validation.get('is_recent', False) and 
+            validation.get('relevance_score', 0) >= 50 and
+            validation.get('quality_score', 0) >= 50
+        )
+        return validation
+    
+    def _verdict_request(self, news_item: Dict) -> Dict:
+        """
+        Clave del veredicto de una noticia en la caché de respuestas.
+        
+        Incluye el modelo y los criterios, así cambiar los intereses
+        invalida los veredictos guardados.
+        """
+        return {
+            'kind': 'news_verdict',
+            'model': self.model,
+            'temperature': 0.3,
+            'criteria': self.criteria_text,
+            'news': self._news_text(news_item)
+        }
+    
+    def _cache_verdict(self, news_item: Dict, validation: Dict):
+        """Guarda el veredicto del LLM de una noticia (si hay caché)."""
+        if self.scheduler.cache is not None:
+            self.scheduler.cache.put(self._verdict_request(news_item), validation)
+    
+    def _cached_verdict(self, news_item: Dict) -> Optional[Dict]:
+        """
+        Veredicto guardado de una noticia, o None.
+        
+        `is_recent` se recalcula con la fecha de la noticia: el guardado
+        era cierto cuando se validó y puede haber caducado. Sin fecha no
+        se puede recalcular, así que un "reciente" guardado no se reutiliza.
+        """
+        if self.scheduler.cache is None:
+            return None
+        verdict = self.scheduler.cache.get(self._verdict_request(news_item))
+        if verdict is None:
+            return None
         
+        published_ts = ensure_published_ts(news_item)
+        if published_ts is None:
+            return None if verdict.get('is_recent') else verdict
+        verdict['is_recent'] = time.time() - published_ts < RECENT_HOURS * 3600
+        return verdict
+    
+    @staticmethod
+    def _error_validation(error: Exception) -> Dict:
+        """Validación por defecto cuando el LLM falla."""
+        return {
+            'is_valid': False,
+            'is_recent': False,
+            'relevance_score': 0,
+            'quality_score': 0,
+            'reason': f'Error: {str(error)}',
+            'topics_matched': []
+        }
+    
+    def validate_news(self, news_item: Dict) -> Dict:
+        """
+        Valida una noticia individual usando LLM.
+        
+        Args:
+            news_item: Diccionario con la información de la noticia
+            
+        Returns:
+            Dict con validación: {
+                'is_valid': bool,
+                'is_recent': bool,
+                'relevance_score': float (0-100),
+                'quality_score': float (0-100),
+                'reason': str,
+                'topics_matched': List[str]
+            }
+        """
         try:
-            response = self.client.chat.completions.create(
+            # Sin caché de prompts: la reutilización va por `_cached_verdict`,
+            # que recalcula `is_recent` (la respuesta cruda lo congelaría)
+            response = self.scheduler.call(
+                self.client,
+                use_cache=False,
+                parse=self._parse_single_response,
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "Eres un experto analista de noticias tech que evalúa relevancia y calidad."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=self.single_prompt.messages(news=self._news_text(news_item)),
                 temperature=0.3,
                 max_tokens=200
             )
+            validation = response['parsed']
             
-            result_text = response.choices[0].message.content.strip()
+            self._cache_verdict(news_item, validation)
+            return self._finalize_validation(validation)
             
-            # Parsear JSON
-            validation = json.loads(result_text)
+        except Exception as e:
+            print(f"⚠️  Error validando noticia: {str(e)}")
+            return self._error_validation(e)
+    
+    def estimate_tokens(self, text: str) -> int:
+        """Tokens de un texto con el tokenizador del modelo (o estimados)."""
+        return count_tokens(text, self.model)
+    
+    def split_batches(
+        self,
+        news_list: List[Dict],
+        batch_size: int = BATCH_SIZE,
+        max_batch_tokens: int = MAX_BATCH_TOKENS
+    ) -> List[List[int]]:
+        """
+        Agrupa noticias en lotes que caben en el presupuesto de tokens.
+        
+        Args:
+            news_list: Noticias a validar
+            batch_size: Máximo de noticias por lote
+            max_batch_tokens: Máximo de tokens de noticias por lote
+                (una noticia más grande que el presupuesto va sola)
             
-            # Agregar campo is_valid
-            validation['is_valid'] = (
-                validation.get('is_recent', False) and 
-                validation.get('relevance_score', 0) >= 50 and
-                validation.get('quality_score', 0) >= 50
-            )
+        Returns:
+            Lotes de índices de news_list, en orden
+        """
+        batches = []
+        current, current_tokens = [], 0
+        
+        for index, news_item in enumerate(news_list):
+            tokens = self.estimate_tokens(self._news_text(news_item))
+            if current and (len(current) >= batch_size or current_tokens + tokens > max_batch_tokens):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(index)
+            current_tokens += tokens
+        
+        if current:
+            batches.append(current)
+        return batches
+    
+    @staticmethod
+    def _parse_single_response(result_text: str) -> Dict:
+        """
+        Extrae el veredicto de la respuesta de una noticia.
+        
+        Raises:
+            ValueError: Si no es JSON o le faltan los scores
+        """
+        validation = json.loads(result_text.strip())
+        if not isinstance(validation, dict):
+            raise ValueError("La respuesta no es un objeto JSON")
+        for field in ('relevance_score', 'quality_score'):
+            if not isinstance(validation.get(field), (int, float)):
+                raise ValueError(f"Falta {field} en la respuesta")
+        return validation
+    
+    @staticmethod
+    def _parse_batch_response(result_text: str, expected_ids: List[int]) -> Dict[int, Dict]:
+        """
+        Extrae los veredictos de la respuesta de un lote.
+        
+        Args:
+            result_text: Texto devuelto por el LLM
+            expected_ids: IDs enviados en el lote
             
-            return validation
+        Returns:
+            Dict id -> validación (solo las que vienen completas y bien formadas)
+        """
+        text = result_text.strip()
+        # Tolerar ```json ... ``` alrededor del JSON
+        if text.startswith("```"):
+            text = text.strip("`")
+            if text.startswith("json"):
+                text = text[4:]
+        
+        data = json.loads(text)
+        results = data.get('results', []) if isinstance(data, dict) else data
+        
+        expected = set(expected_ids)
+        verdicts = {}
+        for result in results:
+            if not isinstance(result, dict):
+                continue
+            news_id = result.pop('id', None)
+            if news_id not in expected or news_id in verdicts:
+                continue
+            if not isinstance(result.get('relevance_score'), (int, float)):
+                continue
+            if not isinstance(result.get('quality_score'), (int, float)):
+                continue
+            result.setdefault('is_recent', False)
+            result.setdefault('reason', '')
+            result.setdefault('topics_matched', [])
+            verdicts[news_id] = result
+        return verdicts
+    
+    def validate_news_batch(self, news_items: List[Dict]) -> List[Dict]:
+        """
+        Valida varias noticias con una sola llamada al LLM.
+        
+        Las noticias que el LLM no devuelve (o devuelve mal formadas) se
+        validan de nuevo individualmente con `validate_news`.
+        
+        Args:
+            news_items: Noticias del lote
+            
+        Returns:
+            Lista de validaciones, en el mismo orden que news_items
+        """
+        if len(news_items) == 1:
+            return [self.validate_news(news_items[0])]
+        
+        news_blocks = "\n\n".join(
+            f"[id={news_id}]\n{self._news_text(news_item)}"
+            for news_id, news_item in enumerate(news_items)
+        )
+        
+        verdicts = {}
+        try:
+            news_ids = list(range(len(news_items)))
+            # Sin caché de prompts (ver validate_news)
+            response = self.scheduler.call(
+                self.client,
+                use_cache=False,
+                parse=lambda result_text: self._parse_batch_response(result_text, news_ids),
+                model=self.model,
+                messages=self.batch_prompt.messages(count=len(news_items), news_blocks=news_blocks),
+                temperature=0.3,
+                max_tokens=OUTPUT_TOKENS_PER_ITEM * len(news_items) + 50
+            )
+            verdicts = response['parsed']
             
         except Exception as e:
-            print(f"⚠️  Error validando noticia: {str(e)}")
-            return {
-                'is_valid': False,
-                'is_recent': False,
-                'relevance_score': 0,
-                'quality_score': 0,
-                'reason': f'Error: {str(e)}',
-                'topics_matched': []
-            }
+            print(f"⚠️  Error validando lote, se valida noticia a noticia: {str(e)}")
+        
+        validations = []
+        missing = 0
+        for news_id, news_item in enumerate(news_items):
+            if news_id in verdicts:
+                self._cache_verdict(news_item, verdicts[news_id])
+                validations.append(self._finalize_validation(verdicts[news_id]))
+            else:
+                missing += 1
+                validations.append(self.validate_news(news_item))
+        
+        if missing and verdicts:
+            print(f"      ⚠️  {missing} noticias sin veredicto en el lote, validadas individualmente")
+        
+        return validations
     
     def validate_batch(
         self, 
         news_list: List[Dict],
         min_relevance: int = 50,
         min_quality: int = 50,
-        require_recent: bool = True
+        require_recent: bool = True,
+        batch_size: int = BATCH_SIZE,
+        max_batch_tokens: int = MAX_BATCH_TOKENS
     ) -> List[Dict]:
         """
         Valida un lote de noticias.
         
+        Las noticias se envían al LLM en grupos (varias por request), así
+        el prompt común se paga una vez por grupo y no por noticia. Los
+        grupos se validan en paralelo a través del planificador LLM.
+        Las noticias ya validadas (veredicto en la caché de respuestas)
+        no se vuelven a enviar.
+        
         Args:
             news_list: Lista de noticias
             min_relevance: Score mínimo de relevancia
             min_quality: Score mínimo de calidad
             require_recent: Si requiere que sean recientes
+            batch_size: Noticias por request (1 = una request por noticia)
+            max_batch_tokens: Presupuesto de tokens de noticias por request
             
         Returns:
             Lista de noticias validadas con metadata
@@ -246,10 +509,36 @@ IMPORTANTE:
             'rejected_low_quality': 0
         }
         
-        for i, news in enumerate(news_list, 1):
-            print(f"\n   [{i}/{len(news_list)}] Validando: {news.get('title', '')[:60]}...")
-            
-            validation = self.validate_news(news)
+        # Veredictos ya conocidos: no hace falta llamar al LLM
+        validations_by_index = {}
+        for index, news_item in enumerate(news_list):
+            cached = self._cached_verdict(news_item)
+            if cached is not None:
+                validations_by_index[index] = self._finalize_validation(cached)
+        pending = [index for index in range(len(news_list)) if index not in validations_by_index]
+        if validations_by_index:
+            print(f"   Caché: {len(validations_by_index)}/{len(news_list)} veredictos sin llamar al LLM")
+        
+        pending_news = [news_list[index] for index in pending]
+        batches = [
+            [pending[position] for position in batch]
+            for batch in self.split_batches(pending_news, max(batch_size, 1), max_batch_tokens)
+        ]
+        if batch_size > 1:
+            print(f"   Lotes: {len(batches)} requests (hasta {batch_size} noticias por request)")
+        print(f"   Concurrencia: hasta {self.scheduler.max_concurrency} requests a la vez")
+        print(f"   Prompt: prefijo estático de {self.batch_prompt.prefix_tokens(self.model)} tokens "
+              f"(idéntico en cada request)")
+        
+        # Todos los lotes en paralelo; los resultados se procesan en orden
+        batch_news_list = [[news_list[index] for index in batch] for batch in batches]
+        batch_validations = self.scheduler.map(self.validate_news_batch, batch_news_list)
+        for batch, validations in zip(batches, batch_validations):
+            validations_by_index.update(zip(batch, validations))
+        
+        for index, news in enumerate(news_list):
+            validation = validations_by_index[index]
+            print(f"\n   [{index + 1}/{len(news_list)}] {news.get('title', '')[:60]}...")
             
             # Agregar validación a la noticia
             news['validation'] = validation
@@ -283,6 +572,7 @@ IMPORTANTE:
         print(f"      ❌ Rechazadas antiguas: {stats['rejected_old']}")
         print(f"      ❌ Rechazadas irrelevantes: {stats['rejected_irrelevant']}")
         print(f"      ❌ Rechazadas baja calidad: {stats['rejected_low_quality']}")
+        self.scheduler.print_stats()
         
         return validated_news
 
@@ -296,7 +586,7 @@ if __name__ == "__main__":
     news_file = Path("../../data/news.json")
     if news_file.exists():
         with open(news_file, 'r', encoding='utf-8') as f:
-            all_news = json.load(f)
+            all_news = to_news_items(json.load(f))
         
         print(f"📰 Cargadas {len(all_news)} noticias")
         
@@ -316,6 +606,6 @@ if __name__ == "__main__":
         # Guardar resultado
         output_file = Path("../../data/validated_news.json")
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(validated, f, ensure_ascii=False, indent=2)
+            json.dump(validated, f, ensure_ascii=False, indent=2, default=json_default)
         
         print(f"💾 Guardadas en: {output_file}")
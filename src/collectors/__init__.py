@@ -1,7 +1,18 @@
 """Módulo de recolectores de noticias."""
 
-from .rss_collector import RSSCollector
-from .news_api_collector import NewsAPICollector
+from importlib import import_module
+
+# Import perezoso: importar un submódulo (p.ej. `from collectors.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'RSSCollector': 'rss_collector',
+    'NewsAPICollector': 'news_api_collector'
+}
 
 __all__ = ['RSSCollector', 'NewsAPICollector']
 
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -10,10 +10,18 @@ Algolia HN API proporciona:
 Documentación: https://hn.algolia.com/api
 """
 
+import sys
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime, timedelta
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class AlgoliaHNCollector:
     """
@@ -26,8 +34,14 @@ class AlgoliaHNCollector:
     - 100% gratuito
     """
     
-    def __init__(self):
-        """Inicializa el collector de Algolia HN."""
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el collector de Algolia HN.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
         self.base_url = "https://hn.algolia.com/api/v1"
     
     def search(
@@ -64,7 +78,7 @@ class AlgoliaHNCollector:
         }
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 f"{self.base_url}/search_by_date",
                 params=params,
                 timeout=30
@@ -88,6 +102,7 @@ class AlgoliaHNCollector:
                     'summary': hit.get('story_text', '') or f"HN Story | {hit.get('points', 0)} points | {hit.get('num_comments', 0)} comments",
                     'full_content': hit.get('story_text', ''),
                     'published': created_at,
+                    'published_ts': to_epoch(hit.get('created_at_i')),
                     'source': 'Hacker News (Algolia)',
                     'score': hit.get('points', 0),
                     'comments': hit.get('num_comments', 0)
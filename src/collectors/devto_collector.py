@@ -7,20 +7,31 @@ Excelente fuente de tutoriales y noticias de desarrollo.
 API Docs: https://developers.forem.com/api
 """
 
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class DevToCollector:
     """Recolector de artículos desde Dev.to API."""
     
     BASE_URL = "https://dev.to/api"
     
-    def __init__(self):
-        """Inicializa el recolector de Dev.to."""
-        pass
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el recolector de Dev.to.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
     
     def collect(
         self,
@@ -82,7 +93,7 @@ class DevToCollector:
         if top:
             params['top'] = top
         
-        response = requests.get(url, params=params, timeout=10)
+        response = self.http.get(url, params=params, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"API error: {response.status_code}")
@@ -113,6 +124,7 @@ class DevToCollector:
                 'link': article.get('url', ''),
                 'summary': article.get('description', ''),
                 'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(published),
                 'source': 'Dev.to',
                 'author': article.get('user', {}).get('name', ''),
                 'author_username': article.get('user', {}).get('username', ''),
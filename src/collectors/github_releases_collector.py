@@ -9,12 +9,20 @@ Este collector obtiene los últimos releases/tags de repositorios clave:
 100% GRATIS (GitHub API pública)
 """
 
+import sys
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import os
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 load_dotenv()
 
 
@@ -29,13 +37,15 @@ class GitHubReleasesCollector:
     - 100% gratuito
     """
     
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, http_client: HTTPClient = None):
         """
         Inicializa el collector.
         
         Args:
             github_token: GitHub token (opcional, aumenta rate limit)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         self.base_url = "https://api.github.com"
         
@@ -87,7 +97,7 @@ class GitHubReleasesCollector:
         url = f"{self.base_url}/repos/{repo}/releases"
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 url,
                 headers=self.get_headers(),
                 params={"per_page": max_releases},
@@ -96,16 +106,13 @@ class GitHubReleasesCollector:
             response.raise_for_status()
             releases = response.json()
             
-            cutoff_date = datetime.now() - timedelta(days=max_age_days)
+            cutoff_ts = int((datetime.now() - timedelta(days=max_age_days)).timestamp())
             recent_releases = []
             
             for release in releases:
-                published = datetime.strptime(
-                    release['published_at'],
-                    '%Y-%m-%dT%H:%M:%SZ'
-                )
+                published_ts = to_epoch(release['published_at'])
                 
-                if published < cutoff_date:
+                if published_ts is None or published_ts < cutoff_ts:
                     continue
                 
                 # Detectar breaking changes
@@ -121,6 +128,7 @@ class GitHubReleasesCollector:
                     'summary': (release.get('body', '') or release['name'])[:500],
                     'full_content': release.get('body', '') or release['name'],
                     'published': release['published_at'],
+                    'published_ts': published_ts,
                     'source': f"GitHub Releases ({repo.split('/')[0]})",
                     'repo': repo,
                     'tag': release['tag_name'],
@@ -10,10 +10,18 @@ Recopila repos que están trending en GitHub:
 Nota: GitHub no tiene API oficial de trending, usamos proxies públicos
 """
 
+import sys
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import now_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class GitHubTrendingCollector:
     """
@@ -25,8 +33,14 @@ class GitHubTrendingCollector:
     - 100% gratuito
     """
     
-    def __init__(self):
-        """Inicializa el collector de GitHub Trending."""
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el collector de GitHub Trending.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
         self.base_url = "https://gh-trending-api.gainor.xyz/repositories"
     
     def collect(
@@ -54,7 +68,7 @@ class GitHubTrendingCollector:
             params['language'] = language
         
         try:
-            response = requests.get(
+            response = self.http.get(
                 self.base_url,
                 params=params,
                 timeout=30
@@ -80,6 +94,7 @@ class GitHubTrendingCollector:
                     'summary': f"{repo.get('description', '')} | +{stars_today} stars hoy | {repo.get('stars', 0)} total",
                     'full_content': repo.get('description', ''),
                     'published': datetime.now().isoformat(),
+                    'published_ts': now_epoch(),
                     'source': 'GitHub Trending',
                     'score': stars_today,
                     'language': repo.get('language', ''),
@@ -7,26 +7,34 @@ Es una de las APIs más generosas disponibles.
 Obtén tu API key gratis en: https://open-platform.theguardian.com/access/
 """
 
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict
 import os
 from dotenv import load_dotenv
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class GuardianCollector:
     """Recolector de noticias desde The Guardian API."""
     
     BASE_URL = "https://content.guardianapis.com/search"
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: HTTPClient = None):
         """
         Inicializa el recolector de The Guardian.
         
         Args:
             api_key: API key de The Guardian (opcional, se carga de .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         if api_key:
             self.api_key = api_key
         else:
@@ -101,7 +109,7 @@ class GuardianCollector:
             'api-key': self.api_key
         }
         
-        response = requests.get(self.BASE_URL, params=params, timeout=10)
+        response = self.http.get(self.BASE_URL, params=params, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"API error: {response.status_code} - {response.text}")
@@ -134,6 +142,7 @@ class GuardianCollector:
                 'summary': fields.get('trailText', ''),
                 'content': fields.get('body', '')[:500],  # Primeros 500 chars
                 'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(published),
                 'source': 'The Guardian',
                 'author': fields.get('byline', ''),
                 'category': article.get('sectionName', section),
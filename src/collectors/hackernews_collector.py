@@ -7,10 +7,18 @@ Es una de las mejores fuentes de noticias tech.
 API Docs: https://github.com/HackerNews/API
 """
 
-import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.hn_item_cache import get_hn_item_cache
+from utils.http_client import HTTPClient, get_http_client
 
 
 class HackerNewsCollector:
@@ -18,9 +26,19 @@ class HackerNewsCollector:
     
     BASE_URL = "https://hacker-news.firebaseio.com/v0"
     
-    def __init__(self):
-        """Inicializa el recolector de Hacker News."""
-        pass
+    def __init__(self, max_workers: int = 16, http_client: HTTPClient = None):
+        """
+        Inicializa el recolector de Hacker News.
+        
+        Args:
+            max_workers: Máximo de items descargados en paralelo
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.max_workers = max_workers
+        # Cliente compartido: reutiliza conexiones TCP/TLS entre requests
+        self.http = http_client or get_http_client()
+        # Caché compartida con las otras pasadas y con ContentEnricher
+        self.item_cache = get_hn_item_cache()
     
     def collect(
         self,
@@ -68,68 +86,97 @@ class HackerNewsCollector:
         """
         # Obtener IDs de las top stories
         stories_url = f"{self.BASE_URL}/{story_type}stories.json"
-        response = requests.get(stories_url, timeout=10)
+        response = self.http.get(stories_url, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"API error: {response.status_code}")
         
         story_ids = response.json()[:max_items * 2]  # Pedimos más para filtrar
         
+        # Descargar todos los items en paralelo (~1 round trip en total)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            items = list(executor.map(self._fetch_item, story_ids))
+        
         stories = []
         
-        for story_id in story_ids:
+        # Procesar en el orden original de la API
+        for story_id, item in zip(story_ids, items):
             if len(stories) >= max_items:
                 break
             
-            try:
-                # Obtener detalles de cada historia
-                item_url = f"{self.BASE_URL}/item/{story_id}.json"
-                item_response = requests.get(item_url, timeout=5)
-                
-                if item_response.status_code != 200:
-                    continue
-                
-                item = item_response.json()
-                
-                # Filtrar solo stories (no jobs, polls, etc.)
-                if item.get('type') != 'story':
-                    continue
-                
-                # Filtrar por score
-                score = item.get('score', 0)
-                if score < min_score:
-                    continue
-                
-                # Parsear fecha
-                published = None
-                if item.get('time'):
-                    published = datetime.fromtimestamp(item['time'])
-                
-                # Extraer información relevante
-                story = {
-                    'title': item.get('title', ''),
-                    'link': item.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
-                    'summary': item.get('text', '')[:500] if item.get('text') else '',
-                    'published': published.isoformat() if published else None,
-                    'source': 'Hacker News',
-                    'author': item.get('by', ''),
-                    'score': score,
-                    'num_comments': item.get('descendants', 0),
-                    'category': 'tech',
-                    'collected_at': datetime.now().isoformat(),
-                    'collector': 'hackernews',
-                    'hn_id': story_id,
-                    'hn_url': f"https://news.ycombinator.com/item?id={story_id}"
-                }
-                
-                stories.append(story)
-                
-            except Exception as e:
-                print(f"  ⚠️  Error obteniendo item {story_id}: {str(e)}")
+            if not item:
                 continue
+            
+            # Filtrar solo stories (no jobs, polls, etc.)
+            if item.get('type') != 'story':
+                continue
+            
+            # Filtrar por score
+            score = item.get('score', 0)
+            if score < min_score:
+                continue
+            
+            # Parsear fecha
+            published = None
+            if item.get('time'):
+                published = datetime.fromtimestamp(item['time'])
+            
+            # Extraer información relevante
+            story = {
+                'title': item.get('title', ''),
+                'link': item.get('url', f"https://news.ycombinator.com/item?id={story_id}"),
+                'summary': item.get('text', '')[:500] if item.get('text') else '',
+                'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(item.get('time')),
+                'source': 'Hacker News',
+                'author': item.get('by', ''),
+                'score': score,
+                'num_comments': item.get('descendants', 0),
+                'category': 'tech',
+                'collected_at': datetime.now().isoformat(),
+                'collector': 'hackernews',
+                'hn_id': story_id,
+                'hn_url': f"https://news.ycombinator.com/item?id={story_id}"
+            }
+            
+            stories.append(story)
         
         return stories
     
+    def _fetch_item(self, item_id: int) -> Optional[Dict]:
+        """
+        Obtiene un item individual de Hacker News (desde caché si ya se descargó).
+        
+        Args:
+            item_id: ID del item
+            
+        Returns:
+            Item como diccionario, o None si falla
+        """
+        return self.item_cache.get_or_fetch(item_id, self._download_item)
+    
+    def _download_item(self, item_id: int) -> Optional[Dict]:
+        """
+        Descarga un item individual de Hacker News.
+        
+        Args:
+            item_id: ID del item
+            
+        Returns:
+            Item como diccionario, o None si falla
+        """
+        try:
+            item_url = f"{self.BASE_URL}/item/{item_id}.json"
+            item_response = self.http.get(item_url, timeout=5)
+            
+            if item_response.status_code != 200:
+                return None
+            
+            return item_response.json()
+        except Exception as e:
+            print(f"  ⚠️  Error obteniendo item {item_id}: {str(e)}")
+            return None
+    
     def collect_multiple_types(
         self,
         story_types: List[str] = None,
@@ -7,7 +7,7 @@ Plan gratuito: 100 requests por día.
 Obtén tu API key gratis en: https://newsapi.org/register
 """
 
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict
@@ -15,20 +15,33 @@ import yaml
 import os
 from dotenv import load_dotenv
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class NewsAPICollector:
     """Recolector de noticias desde News API."""
     
     BASE_URL = "https://newsapi.org/v2/everything"
     
-    def __init__(self, config_path: str = "config/sources.yaml", api_key: str = None):
+    def __init__(
+        self,
+        config_path: str = "config/sources.yaml",
+        api_key: str = None,
+        http_client: HTTPClient = None
+    ):
         """
         Inicializa el recolector de News API.
         
         Args:
             config_path: Ruta al archivo de configuración
             api_key: API key de News API (opcional, se carga de .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         self.config_path = Path(config_path)
         self.queries = self._load_queries()
         
@@ -118,7 +131,7 @@ class NewsAPICollector:
             'apiKey': self.api_key
         }
         
-        response = requests.get(self.BASE_URL, params=params, timeout=10)
+        response = self.http.get(self.BASE_URL, params=params, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"API error: {response.status_code} - {response.text}")
@@ -149,6 +162,7 @@ class NewsAPICollector:
                 'summary': article.get('description', ''),
                 'content': article.get('content', ''),
                 'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(published),
                 'source': article.get('source', {}).get('name', 'News API'),
                 'author': article.get('author', ''),
                 'category': 'tech',  # Podemos categorizarlo mejor después
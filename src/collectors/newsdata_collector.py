@@ -7,26 +7,34 @@ Soporta 50+ idiomas incluido español.
 Obtén tu API key gratis en: https://newsdata.io/register
 """
 
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict
 import os
 from dotenv import load_dotenv
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class NewsDataCollector:
     """Recolector de noticias desde NewsData.io API."""
     
     BASE_URL = "https://newsdata.io/api/1/news"
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: HTTPClient = None):
         """
         Inicializa el recolector de NewsData.io.
         
         Args:
             api_key: API key de NewsData.io (opcional, se carga de .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         if api_key:
             self.api_key = api_key
         else:
@@ -100,7 +108,7 @@ class NewsDataCollector:
         if category:
             params['category'] = category
         
-        response = requests.get(self.BASE_URL, params=params, timeout=10)
+        response = self.http.get(self.BASE_URL, params=params, timeout=10)
         
         if response.status_code != 200:
             raise Exception(f"API error: {response.status_code} - {response.text}")
@@ -131,6 +139,7 @@ class NewsDataCollector:
                 'summary': article.get('description', ''),
                 'content': article.get('content', '')[:500] if article.get('content') else '',
                 'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(published),
                 'source': article.get('source_id', 'NewsData.io'),
                 'author': ', '.join(article.get('creator', [])) if article.get('creator') else '',
                 'category': ', '.join(article.get('category', [])) if article.get('category') else 'tech',
@@ -10,11 +10,19 @@ Product Hunt API proporciona:
 Documentación: https://api.producthunt.com/v2/docs
 """
 
+import sys
 import os
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import now_epoch, to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class ProductHuntCollector:
     """
@@ -26,13 +34,15 @@ class ProductHuntCollector:
     - 100% gratuito
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: HTTPClient = None):
         """
         Inicializa el collector de Product Hunt.
         
         Args:
             api_key: API key de PH (o usa PRODUCTHUNT_API_KEY del .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         self.api_key = api_key or os.getenv("PRODUCTHUNT_API_KEY")
         if not self.api_key:
             print("⚠️  No se encontró PRODUCTHUNT_API_KEY. Este collector no funcionará.")
@@ -88,7 +98,7 @@ class ProductHuntCollector:
         }
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.base_url,
                 headers=headers,
                 json={'query': query},
@@ -116,6 +126,7 @@ class ProductHuntCollector:
                     'summary': node.get('description', '')[:500],
                     'full_content': node.get('description', ''),
                     'published': node.get('createdAt', datetime.now().isoformat()),
+                    'published_ts': to_epoch(node['createdAt']) if node.get('createdAt') else now_epoch(),
                     'source': 'Product Hunt',
                     'score': node.get('votesCount', 0),
                     'comments': node.get('commentsCount', 0),
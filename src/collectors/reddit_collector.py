@@ -144,6 +144,7 @@ class RedditCollector:
                 'link': submission.url,
                 'summary': submission.selftext[:500] if submission.selftext else '',
                 'published': published.isoformat(),
+                'published_ts': int(submission.created_utc),
                 'source': f"Reddit - r/{sub_config['subreddit']}",
                 'author': str(submission.author) if submission.author else '[deleted]',
                 'score': submission.score,
@@ -7,20 +7,32 @@ NO requiere API keys ni autenticación.
 Endpoint: https://old.reddit.com/r/subreddit/.json
 """
 
-import requests
+import sys
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import List, Dict
 import time
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 
 class RedditScraper:
     """Scraper de posts de Reddit usando JSON público."""
     
     BASE_URL = "https://old.reddit.com"
     
-    def __init__(self):
-        """Inicializa el scraper de Reddit."""
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el scraper de Reddit.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (compatible; TechNewsBot/1.0)'
         }
@@ -83,7 +95,7 @@ class RedditScraper:
             'limit': limit * 2  # Pedimos más para filtrar
         }
         
-        response = requests.get(
+        response = self.http.get(
             url,
             headers=self.headers,
             params=params,
@@ -126,6 +138,7 @@ class RedditScraper:
                 'link': post_data.get('url', ''),
                 'summary': post_data.get('selftext', '')[:500] if post_data.get('selftext') else '',
                 'published': published.isoformat() if published else None,
+                'published_ts': to_epoch(post_data.get('created_utc')),
                 'source': f"Reddit - r/{subreddit}",
                 'author': post_data.get('author', '[deleted]'),
                 'score': score,
@@ -5,35 +5,79 @@ Este módulo es el MÁS FÁCIL de implementar y no requiere API keys.
 Perfecto para empezar a aprender Python.
 """
 
-import feedparser
-import yaml
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Tuple
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config_registry import ConfigRegistry, get_config_registry
+from utils.date_normalizer import ensure_published_ts, to_epoch
+from utils.http_client import HTTPClient, get_http_client
+from utils.feed_cache import FeedValidatorCache
+from utils.feed_stream import iter_feed_entries
 
 
 class RSSCollector:
     """Recolector de noticias desde RSS feeds."""
     
-    def __init__(self, config_path: str = "config/sources.yaml"):
+    # Entradas antiguas consecutivas tras las que se deja de leer un feed
+    OLD_ENTRIES_TOLERANCE = 3
+    
+    def __init__(
+        self,
+        config_path: str = "config/sources.yaml",
+        http_client: HTTPClient = None,
+        feed_cache: FeedValidatorCache = None,
+        use_cache: bool = True,
+        max_workers: int = 8,
+        parse_workers: int = 2,
+        feed_timeout: float = 15,
+        total_budget: float = 45,
+        max_items_per_feed: int = 50,
+        registry: ConfigRegistry = None
+    ):
         """
         Inicializa el recolector RSS.
         
         Args:
             config_path: Ruta al archivo de configuración
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+            feed_cache: Caché de validadores (ETag/Last-Modified) por feed
+            use_cache: Usar GET condicional y reutilizar feeds sin cambios
+            max_workers: Feeds descargados en paralelo
+            parse_workers: Threads dedicados a parsear feeds descargados
+            feed_timeout: Timeout HTTP por feed en segundos
+            total_budget: Tiempo máximo total de la recopilación en segundos
+            max_items_per_feed: Máximo de noticias por feed (configurable por
+                feed con `max_items` en sources.yaml)
+            registry: Registro de configuración (por defecto, el del proceso)
         """
         self.config_path = Path(config_path)
+        self.registry = registry or get_config_registry()
+        self._feeds_version = None
         self.feeds = self._load_feeds()
+        self.http = http_client or get_http_client()
+        self.feed_cache = (feed_cache or FeedValidatorCache()) if use_cache else None
+        self.max_workers = max_workers
+        self.parse_workers = parse_workers
+        self.feed_timeout = feed_timeout
+        self.total_budget = total_budget
+        self.max_items_per_feed = max_items_per_feed
+        self.feed_stats: Dict[str, Dict] = {}
     
     def _load_feeds(self) -> List[Dict]:
         """Carga la lista de RSS feeds desde el archivo de configuración."""
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                return config.get('rss_feeds', [])
-        except FileNotFoundError:
+        self._feeds_version = self.registry.version(self.config_path)
+        config = self.registry.load(self.config_path)
+        if config is None:
             print(f"⚠️  Archivo de configuración no encontrado: {self.config_path}")
             return []
+        return config.get('rss_feeds', [])
     
     def collect(self, max_age_hours: int = 24) -> List[Dict]:
         """
@@ -45,25 +89,126 @@ class RSSCollector:
         Returns:
             Lista de noticias recopiladas
         """
-        all_news = []
+        news, _ = self.collect_with_timings(max_age_hours)
+        return news
+    
+    def collect_with_timings(self, max_age_hours: int = 24) -> Tuple[List[Dict], Dict[str, Dict]]:
+        """
+        Recopila todos los feeds en paralelo y devuelve también los tiempos.
+        
+        Las descargas corren en un pool de threads; cada feed descargado
+        pasa a un segundo pool para parsearse, así el parseo no bloquea
+        las descargas pendientes. Los feeds que no terminan dentro de
+        `total_budget` se reportan como timeout.
+        
+        Args:
+            max_age_hours: Máxima antigüedad de las noticias en horas
+            
+        Returns:
+            Tuple (noticias, stats por feed con fetch_ms/parse_ms/items/status)
+        """
         cutoff_time = datetime.now() - timedelta(hours=max_age_hours)
+        deadline = time.monotonic() + self.total_budget
+        
+        # Recoger cambios en sources.yaml (sin reparsear si no cambió)
+        if self.registry.version(self.config_path) != self._feeds_version:
+            self.feeds = self._load_feeds()
+        self.feed_stats = {
+            feed['name']: {'status': 'pending', 'items': 0}
+            for feed in self.feeds
+        }
+        results: Dict[int, List[Dict]] = {}
         
         print(f"📡 Recopilando desde {len(self.feeds)} fuentes RSS...")
         
-        for feed_config in self.feeds:
+        fetch_pool = ThreadPoolExecutor(max_workers=max(self.max_workers, 1), thread_name_prefix="rss-fetch")
+        parse_pool = ThreadPoolExecutor(max_workers=max(self.parse_workers, 1), thread_name_prefix="rss-parse")
+        
+        try:
+            fetch_futures = {
+                fetch_pool.submit(self._fetch_feed, feed_config, cutoff_time): index
+                for index, feed_config in enumerate(self.feeds)
+            }
+            parse_futures = {}
+            
+            # Fase 1: descargas (las que terminan pasan a parsearse)
+            try:
+                for future in as_completed(fetch_futures, timeout=max(deadline - time.monotonic(), 0)):
+                    index = fetch_futures[future]
+                    feed_config = self.feeds[index]
+                    stats = self.feed_stats[feed_config['name']]
+                    
+                    try:
+                        fetched = future.result()
+                    except Exception as e:
+                        stats.update({'status': 'error', 'error': str(e)})
+                        print(f"  ❌ Error en {feed_config['name']}: {str(e)}")
+                        continue
+                    
+                    stats['fetch_ms'] = fetched['fetch_ms']
+                    
+                    if fetched['cached_items'] is not None:
+                        results[index] = fetched['cached_items']
+                        stats.update({'status': 'ok', 'cache': 'hit', 'items': len(fetched['cached_items'])})
+                        print(f"  ✅ {feed_config['name']}: {stats['items']} noticias (sin cambios, caché)")
+                    else:
+                        parse_future = parse_pool.submit(self._parse_feed, feed_config, fetched, cutoff_time)
+                        parse_futures[parse_future] = index
+            except FutureTimeoutError:
+                pass
+            
+            # Fase 2: parseos pendientes
             try:
-                news = self._collect_from_feed(feed_config, cutoff_time)
-                all_news.extend(news)
-                print(f"  ✅ {feed_config['name']}: {len(news)} noticias")
-            except Exception as e:
-                print(f"  ❌ Error en {feed_config['name']}: {str(e)}")
+                for future in as_completed(parse_futures, timeout=max(deadline - time.monotonic(), 0)):
+                    index = parse_futures[future]
+                    feed_config = self.feeds[index]
+                    stats = self.feed_stats[feed_config['name']]
+                    
+                    try:
+                        news, parse_ms = future.result()
+                    except Exception as e:
+                        stats.update({'status': 'error', 'error': str(e)})
+                        print(f"  ❌ Error en {feed_config['name']}: {str(e)}")
+                        continue
+                    
+                    results[index] = news
+                    stats.update({'status': 'ok', 'cache': 'miss', 'items': len(news), 'parse_ms': parse_ms})
+                    print(f"  ✅ {feed_config['name']}: {len(news)} noticias")
+            except FutureTimeoutError:
+                pass
+        finally:
+            # No esperar a feeds colgados: ya se reportan como timeout
+            fetch_pool.shutdown(wait=False, cancel_futures=True)
+            parse_pool.shutdown(wait=False, cancel_futures=True)
+        
+        for name, stats in self.feed_stats.items():
+            if stats['status'] == 'pending':
+                stats['status'] = 'timeout'
+                print(f"  ⏰ {name}: sin respuesta dentro de {self.total_budget}s")
+        
+        # Mismo orden que sources.yaml, independientemente de quién terminó antes
+        all_news = [item for index in sorted(results) for item in results[index]]
+        
+        if self.feed_cache:
+            self.feed_cache.save()
+            hits = sum(1 for s in self.feed_stats.values() if s.get('cache') == 'hit')
+            misses = sum(1 for s in self.feed_stats.values() if s.get('cache') == 'miss')
+            print(f"\n📦 Caché de feeds: {hits} sin cambios / {misses} parseados")
+        
+        slowest = sorted(
+            ((name, s['fetch_ms'] + s.get('parse_ms', 0)) for name, s in self.feed_stats.items() if 'fetch_ms' in s),
+            key=lambda x: x[1],
+            reverse=True
+        )[:3]
+        if slowest:
+            print("⏱️  Feeds más lentos: " + ", ".join(f"{name} ({ms:.0f} ms)" for name, ms in slowest))
         
         print(f"\n📊 Total recopilado: {len(all_news)} noticias")
-        return all_news
+        return all_news, self.feed_stats
     
     def _collect_from_feed(self, feed_config: Dict, cutoff_time: datetime) -> List[Dict]:
         """
-        Recopila noticias de un RSS feed específico.
+        Recopila noticias de un RSS feed específico (descarga + parseo).
         
         Args:
             feed_config: Configuración del feed
@@ -72,18 +217,131 @@ class RSSCollector:
         Returns:
             Lista de noticias del feed
         """
-        feed = feedparser.parse(feed_config['url'])
+        fetched = self._fetch_feed(feed_config, cutoff_time)
+        if fetched['cached_items'] is not None:
+            return fetched['cached_items']
+        news, _ = self._parse_feed(feed_config, fetched, cutoff_time)
+        return news
+    
+    def _fetch_feed(self, feed_config: Dict, cutoff_time: datetime) -> Dict:
+        """
+        Descarga un feed usando GET condicional (ETag/Last-Modified).
+        
+        Si el feed no cambió desde la última ejecución devuelve directamente
+        las noticias cacheadas, sin necesidad de parsear.
+        
+        Args:
+            feed_config: Configuración del feed
+            cutoff_time: Tiempo de corte para filtrar noticias antiguas
+            
+        Returns:
+            Dict con 'cached_items' (o None) y el contenido descargado
+        """
+        start = time.perf_counter()
+        url = feed_config['url']
+        cached = self.feed_cache.get(url) if self.feed_cache else None
+        
+        # La caché solo sirve si cubre el rango de fechas pedido
+        cache_usable = (
+            cached is not None
+            and cached.get('items_since')
+            and datetime.fromisoformat(cached['items_since']) <= cutoff_time
+        )
+        
+        headers = self.feed_cache.conditional_headers(url) if cache_usable else {}
+        response = self.http.get(url, headers=headers, timeout=self.feed_timeout)
+        
+        fetched = {
+            'cached_items': None,
+            'content': None,
+            'content_hash': None,
+            'headers': response.headers
+        }
+        
+        if response.status_code == 304 and cache_usable:
+            fetched['cached_items'] = self._reuse_cached_items(feed_config, cached, cutoff_time)
+        elif response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}")
+        else:
+            fetched['content'] = response.content
+            fetched['content_hash'] = FeedValidatorCache.content_hash(response.content)
+            
+            # Sin validadores del servidor, pero contenido idéntico
+            if cache_usable and cached.get('content_hash') == fetched['content_hash']:
+                fetched['cached_items'] = self._reuse_cached_items(feed_config, cached, cutoff_time)
+        
+        fetched['fetch_ms'] = (time.perf_counter() - start) * 1000
+        return fetched
+    
+    def _parse_feed(self, feed_config: Dict, fetched: Dict, cutoff_time: datetime) -> Tuple[List[Dict], float]:
+        """
+        Parsea un feed descargado y actualiza la caché de validadores.
+        
+        Args:
+            feed_config: Configuración del feed
+            fetched: Resultado de `_fetch_feed`
+            cutoff_time: Tiempo de corte para filtrar noticias antiguas
+            
+        Returns:
+            Tuple (noticias, milisegundos de parseo)
+        """
+        start = time.perf_counter()
+        headers = fetched['headers']
+        
+        entries = iter_feed_entries(fetched['content'], headers.get('content-type', ''))
+        news = self._entries_to_news(feed_config, entries, cutoff_time)
+        
+        if self.feed_cache:
+            url = feed_config['url']
+            self.feed_cache.record(url, hit=False)
+            self.feed_cache.update(
+                url,
+                etag=headers.get('ETag'),
+                last_modified=headers.get('Last-Modified'),
+                content_hash=fetched['content_hash'],
+                items=news,
+                items_since=cutoff_time.isoformat()
+            )
+        
+        return news, (time.perf_counter() - start) * 1000
+    
+    def _entries_to_news(self, feed_config: Dict, entries, cutoff_time: datetime) -> List[Dict]:
+        """
+        Convierte las entradas de un feed en noticias.
+        
+        Las entradas se consumen de forma perezosa: la lectura se detiene
+        al alcanzar el máximo de noticias del feed o cuando aparecen
+        varias entradas seguidas más antiguas que el corte (los feeds
+        vienen ordenados del más nuevo al más antiguo).
+        
+        Args:
+            feed_config: Configuración del feed
+            entries: Entradas parseadas del feed (lista o generador)
+            cutoff_time: Tiempo de corte para filtrar noticias antiguas
+            
+        Returns:
+            Lista de noticias
+        """
         news = []
+        max_items = feed_config.get('max_items', self.max_items_per_feed)
+        cutoff_ts = int(cutoff_time.timestamp())
+        old_streak = 0
         
-        for entry in feed.entries:
-            # Parsear fecha de publicación
+        for entry in entries:
+            # Parsear fecha de publicación (struct_time en UTC)
             published = None
-            if hasattr(entry, 'published_parsed'):
-                published = datetime(*entry.published_parsed[:6])
+            published_ts = None
+            if entry.get('published_parsed'):
+                published = datetime(*entry.get('published_parsed')[:6])
+                published_ts = to_epoch(entry.get('published_parsed'))
             
-            # Filtrar por antigüedad
-            if published and published < cutoff_time:
+            # Filtrar por antigüedad (tolerando alguna entrada fuera de orden)
+            if published_ts is not None and published_ts < cutoff_ts:
+                old_streak += 1
+                if old_streak >= self.OLD_ENTRIES_TOLERANCE:
+                    break
                 continue
+            old_streak = 0
             
             # Extraer información relevante
             news_item = {
@@ -91,13 +349,44 @@ class RSSCollector:
                 'link': entry.get('link', ''),
                 'summary': entry.get('summary', ''),
                 'published': published.isoformat() if published else None,
+                'published_ts': published_ts,
                 'source': feed_config['name'],
                 'category': feed_config.get('category', 'tech'),
                 'collected_at': datetime.now().isoformat()
             }
             
             news.append(news_item)
+            if max_items and len(news) >= max_items:
+                break
+        
+        return news
+    
+    def _reuse_cached_items(self, feed_config: Dict, cached: Dict, cutoff_time: datetime) -> List[Dict]:
+        """
+        Devuelve las noticias cacheadas de un feed que no cambió.
+        
+        Args:
+            feed_config: Configuración del feed
+            cached: Entrada de la caché
+            cutoff_time: Tiempo de corte para filtrar noticias antiguas
+            
+        Returns:
+            Lista de noticias aún dentro del rango de fechas
+        """
+        collected_at = datetime.now().isoformat()
+        cutoff_ts = int(cutoff_time.timestamp())
+        news = []
+        
+        for item in cached.get('items', []):
+            news_item = dict(item)
+            # Las cachés anteriores a published_ts solo traen 'published'
+            published_ts = ensure_published_ts(news_item)
+            if published_ts is not None and published_ts < cutoff_ts:
+                continue
+            news_item['collected_at'] = collected_at
+            news.append(news_item)
         
+        self.feed_cache.record(feed_config['url'], hit=True)
         return news
     
     def save_to_file(self, news: List[Dict], output_path: str = "data/news.json"):
@@ -10,12 +10,20 @@ Serper.dev proporciona acceso a Google Search con:
 Documentación: https://serper.dev/docs
 """
 
+import sys
 import os
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import now_epoch, to_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -30,13 +38,15 @@ class SerperCollector:
     - 2,500 búsquedas gratis/mes
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: HTTPClient = None):
         """
         Inicializa el collector de Serper.
         
         Args:
             api_key: API key de Serper (o usa SERPER_API_KEY del .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         self.api_key = api_key or os.getenv("SERPER_API_KEY")
         if not self.api_key:
             print("⚠️  No se encontró SERPER_API_KEY. Este collector no funcionará.")
@@ -82,7 +92,7 @@ class SerperCollector:
         }
         
         try:
-            response = requests.post(
+            response = self.http.post(
                 self.base_url,
                 headers=headers,
                 json=payload,
@@ -103,6 +113,7 @@ class SerperCollector:
                     'summary': item.get('snippet', ''),
                     'full_content': item.get('snippet', ''),
                     'published': item.get('date', datetime.now().isoformat()),
+                    'published_ts': to_epoch(item['date']) if item.get('date') else now_epoch(),
                     'source': 'Serper (Google)',
                     'position': item.get('position', 0)
                 })
@@ -10,12 +10,20 @@ Tavily es una API de búsqueda optimizada para LLMs que devuelve:
 Documentación: https://docs.tavily.com
 """
 
+import sys
 import os
 import requests
+from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import now_epoch
+from utils.http_client import HTTPClient, get_http_client
+
 # Cargar variables de entorno
 load_dotenv()
 
@@ -31,13 +39,15 @@ class TavilyCollector:
     - Búsqueda avanzada
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, http_client: HTTPClient = None):
         """
         Inicializa el collector de Tavily.
         
         Args:
             api_key: API key de Tavily (o usa TAVILY_API_KEY del .env)
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
         """
+        self.http = http_client or get_http_client()
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
         if not self.api_key:
             print("⚠️  No se encontró TAVILY_API_KEY. Este collector no funcionará.")
@@ -84,7 +94,7 @@ class TavilyCollector:
             payload["include_domains"] = include_domains
         
         try:
-            response = requests.post(self.base_url, json=payload, timeout=30)
+            response = self.http.post(self.base_url, json=payload, timeout=30)
             response.raise_for_status()
             data = response.json()
             
@@ -100,6 +110,7 @@ class TavilyCollector:
                     'summary': item.get('content', '')[:500],
                     'full_content': item.get('content', ''),
                     'published': datetime.now().isoformat(),
+                    'published_ts': now_epoch(),
                     'source': 'Tavily AI',
                     'score': item.get('score', 0),
                     'published_date': item.get('published_date', '')
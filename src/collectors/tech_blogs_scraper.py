@@ -5,19 +5,30 @@ Scrapea blogs de empresas como Google AI, Microsoft, Meta, etc.
 que no tienen RSS o tienen contenido adicional en HTML.
 """
 
-import requests
+import sys
 from bs4 import BeautifulSoup
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 import time
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.http_client import HTTPClient, get_http_client
+
 
 class TechBlogsScraper:
     """Scraper de blogs oficiales de empresas tech."""
     
-    def __init__(self):
-        """Inicializa el scraper de blogs tech."""
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el scraper de blogs tech.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
@@ -89,7 +100,7 @@ class TechBlogsScraper:
         Returns:
             Lista de artículos
         """
-        response = requests.get(
+        response = self.http.get(
             config['url'],
             headers=self.headers,
             timeout=15
@@ -138,6 +149,7 @@ class TechBlogsScraper:
                     'link': link,
                     'summary': summary,
                     'published': None,  # Difícil de extraer sin estructura
+                    'published_ts': None,
                     'source': config['name'],
                     'category': 'tech',
                     'collected_at': datetime.now().isoformat(),
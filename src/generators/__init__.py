@@ -1,6 +1,17 @@
 """Módulo de generadores de tweets."""
 
-from .tweet_generator import TweetGenerator
+from importlib import import_module
+
+# Import perezoso: importar un submódulo (p.ej. `from generators.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'TweetGenerator': 'tweet_generator'
+}
 
 __all__ = ['TweetGenerator']
 
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -9,14 +9,16 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Agregar src al path para imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from llm.backends import default_backend
 from llm.openai_provider import OpenAIProvider
+from utils.news_item import to_news_items
 
 
 class AITweetGenerator:
@@ -31,7 +33,8 @@ class AITweetGenerator:
     def __init__(
         self,
         news_file: str = "data/selected_news.json",
-        model: str = "gpt-3.5-turbo"
+        model: str = "gpt-3.5-turbo",
+        provider: OpenAIProvider = None
     ):
         """
         Inicializa el generador con IA.
@@ -39,15 +42,21 @@ class AITweetGenerator:
         Args:
             news_file: Ruta al archivo con noticias
             model: Modelo de OpenAI a usar
+            provider: Proveedor LLM ya configurado (por defecto uno con la
+                API key de .env)
         """
         self.news_file = Path(news_file)
         self.model = model
         
+        if provider is not None:
+            self.provider = provider
+            return
+        
         # Cargar API key
         load_dotenv()
         api_key = os.getenv("OPENAI_API_KEY")
         
-        if not api_key:
+        if not api_key and default_backend() == 'openai':
             raise ValueError(
                 "❌ No se encontró OPENAI_API_KEY. "
                 "Agrega tu API key al archivo .env"
@@ -62,7 +71,7 @@ class AITweetGenerator:
             return []
         
         with open(self.news_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return to_news_items(json.load(f))
     
     def generate_all(self, limit: int = None) -> List[Dict]:
         """
@@ -90,21 +99,19 @@ class AITweetGenerator:
         
         all_tweets = []
         
-        for i, news_item in enumerate(news_list, 1):
+        # Generar todos los threads en paralelo (el planificador limita
+        # concurrencia y rate limits); se muestran en orden
+        results = self.provider.scheduler.map(self._generate_thread, news_list)
+        
+        for i, (news_item, (thread, error)) in enumerate(zip(news_list, results), 1):
             print(f"\n{'='*60}")
             print(f"📰 Noticia {i}/{len(news_list)}")
-            print(f"   {news_item['title'][:60]}...")
+            print(f"   {news_item.get('title', '')[:60]}...")
             print(f"{'='*60}")
             
             try:
-                # Generar thread técnico
-                thread = self.provider.generate_tweet_thread(
-                    title=news_item['title'],
-                    summary=news_item.get('summary', ''),
-                    full_content=news_item.get('full_content', ''),
-                    source=news_item.get('source', ''),
-                    link=news_item.get('link', '')
-                )
+                if error is not None:
+                    raise error
                 
                 # Los tweets ya vienen en formato simplificado
                 all_tweets.extend(thread)
@@ -140,9 +147,32 @@ class AITweetGenerator:
         print(f"   🇬🇧 {english} tweets en inglés")
         print(f"   🇪🇸 {spanish} tweets en español")
         print(f"{'='*60}")
+        self.provider.scheduler.print_stats()
         
         return all_tweets
     
+    def _generate_thread(self, news_item: Dict) -> Tuple[Optional[List[Dict]], Optional[Exception]]:
+        """
+        Genera el thread técnico de una noticia (se ejecuta en el pool LLM).
+        
+        Args:
+            news_item: Noticia
+            
+        Returns:
+            Tuple (thread, None) o (None, error)
+        """
+        try:
+            thread = self.provider.generate_tweet_thread(
+                title=news_item['title'],
+                summary=news_item.get('summary', ''),
+                full_content=news_item.get('full_content', ''),
+                source=news_item.get('source', ''),
+                link=news_item.get('link', '')
+            )
+            return thread, None
+        except Exception as e:
+            return None, e
+    
     def save_tweets(
         self,
         tweets: List[Dict],
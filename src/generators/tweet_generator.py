@@ -7,10 +7,16 @@ Puedes usar templates simples o integrar IA (OpenAI) para hacerlo más sofistica
 
 import json
 import random
+import sys
 from pathlib import Path
 from typing import List, Dict
 from datetime import datetime
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.news_item import to_news_items
+
 
 class TweetGenerator:
     """Generador de tweets a partir de noticias."""
@@ -55,7 +61,7 @@ class TweetGenerator:
             return []
         
         with open(self.news_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+            return to_news_items(json.load(f))
     
     def generate(self, limit: int = 10) -> List[Dict]:
         """
@@ -1,6 +1,17 @@
 """Módulo de proveedores LLM."""
 
-from .openai_provider import OpenAIProvider
+from importlib import import_module
+
+# Import perezoso: importar un submódulo (p.ej. `from llm.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'OpenAIProvider': 'openai_provider'
+}
 
 __all__ = ['OpenAIProvider']
 
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,147 @@
+"""
+LLM Backends - Clientes intercambiables para chat completions
+
+El planificador (llm.scheduler) solo necesita un cliente con la interfaz
+del SDK de OpenAI:
+
+    client.chat.completions.create(**request)
+
+que devuelva un objeto con `.choices[0].message.content`, `.model` y
+`.usage` (prompt_tokens, completion_tokens y opcionalmente
+prompt_tokens_details.cached_tokens), y cuyos errores HTTP tengan
+`.status_code` y `.response.headers` (para reintentos y Retry-After).
+
+Backends disponibles:
+- 'openai': SDK oficial de OpenAI (por defecto)
+- 'http': cliente HTTP mínimo para cualquier servidor compatible con
+  /v1/chat/completions, p.ej. llm.fake_server para pruebas sin red
+
+Se eligen con las variables LLM_BACKEND y LLM_BASE_URL (o con argumentos).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Optional
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+BACKENDS = ('openai', 'http')
+
+
+class LLMHTTPError(Exception):
+    """Respuesta de error de un servidor de chat completions."""
+
+    def __init__(self, status_code: int, message: str, response: Any = None):
+        super().__init__(f"Error {status_code}: {message}")
+        self.status_code = status_code
+        self.response = response
+
+
+class HTTPChatClient:
+    """Cliente de /chat/completions sobre HTTP con la interfaz del SDK de OpenAI."""
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: Optional[str] = None,
+        timeout: float = 60,
+        pool_maxsize: int = 32
+    ):
+        """
+        Inicializa el cliente.
+
+        Args:
+            base_url: URL base de la API (p.ej. http://127.0.0.1:8765/v1)
+            api_key: API key (se envía como Bearer si se indica)
+            timeout: Timeout de cada request en segundos
+            pool_maxsize: Conexiones simultáneas máximas
+        """
+        # requests solo se importa si se usa este backend
+        from utils.http_client import HTTPClient
+
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        # Sin reintentos propios: los gestiona el planificador
+        self.http = HTTPClient(timeout=timeout, max_retries=0, pool_maxsize=pool_maxsize)
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create_chat_completion))
+
+    def create_chat_completion(self, **request: Any) -> SimpleNamespace:
+        """
+        Hace una llamada a /chat/completions.
+
+        Args:
+            **request: Parámetros de la llamada (model, messages, max_tokens...)
+
+        Returns:
+            Respuesta con acceso por atributos (response.choices[0].message.content)
+
+        Raises:
+            LLMHTTPError: Si el servidor responde con un error
+        """
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f"Bearer {self.api_key}"
+
+        response = self.http.post(
+            f"{self.base_url}/chat/completions",
+            data=json.dumps(request),
+            headers=headers
+        )
+        if response.status_code >= 400:
+            try:
+                message = response.json()['error']['message']
+            except (ValueError, KeyError, TypeError):
+                message = response.text[:200]
+            raise LLMHTTPError(response.status_code, message, response)
+
+        return json.loads(response.text, object_hook=lambda data: SimpleNamespace(**data))
+
+    def close(self):
+        """Cierra las conexiones del pool."""
+        self.http.close()
+
+
+def default_backend() -> str:
+    """Backend configurado en LLM_BACKEND (por defecto 'openai')."""
+    return (os.getenv("LLM_BACKEND") or 'openai').lower()
+
+
+def create_llm_client(
+    api_key: Optional[str] = None,
+    backend: Optional[str] = None,
+    base_url: Optional[str] = None
+) -> Any:
+    """
+    Crea el cliente de chat completions del backend elegido.
+
+    Args:
+        api_key: API key (obligatoria con el backend 'openai')
+        backend: 'openai' o 'http' (por defecto LLM_BACKEND)
+        base_url: URL base de la API (por defecto LLM_BASE_URL)
+
+    Returns:
+        Cliente con la interfaz client.chat.completions.create
+
+    Raises:
+        ValueError: Si el backend no existe o falta configuración
+    """
+    backend = (backend or default_backend()).lower()
+    base_url = base_url or os.getenv("LLM_BASE_URL") or None
+
+    if backend == 'openai':
+        if not api_key:
+            raise ValueError("OPENAI_API_KEY no encontrada en variables de entorno")
+        from openai import OpenAI
+        # Los reintentos los gestiona el planificador (respeta Retry-After)
+        return OpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+
+    if backend == 'http':
+        if not base_url:
+            raise ValueError("LLM_BASE_URL es obligatoria con LLM_BACKEND=http")
+        return HTTPChatClient(base_url, api_key=api_key)
+
+    raise ValueError(f"Backend LLM desconocido: {backend} (opciones: {', '.join(BACKENDS)})")
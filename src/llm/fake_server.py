@@ -0,0 +1,360 @@
+"""
+Fake Server - Servidor local compatible con /v1/chat/completions
+
+Sustituto de la API de OpenAI para pruebas de carga sin red. Responde
+con el mismo JSON que chat completions y simula:
+- Latencia configurable (base + jitter)
+- Errores 500/503 con una probabilidad dada
+- Rate limit de requests por minuto: 429 con header Retry-After
+- Prompt caching: un prefijo (mensaje system) ya visto de 1024+ tokens
+  se reporta en usage.prompt_tokens_details.cached_tokens
+
+Las respuestas son deterministas (dependen solo del prompt) y tienen la
+forma que esperan el validador (veredicto individual o por lotes), el
+scoring y la generación de threads, así todo el flujo funciona igual.
+
+Uso:
+    python src/llm/fake_server.py --port 8765 --latency-ms 300 --error-rate 0.05
+    LLM_BACKEND=http LLM_BASE_URL=http://127.0.0.1:8765/v1 python src/main.py validate
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import re
+import sys
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from llm.prompts import count_message_tokens, count_tokens
+
+# Tamaño mínimo y granularidad del prefijo cacheado (como en OpenAI)
+PROMPT_CACHE_MIN_TOKENS = 1024
+PROMPT_CACHE_BLOCK = 128
+
+_BATCH_ID = re.compile(r'\[id=(\d+)\]')
+
+
+def _digest(*parts: str) -> int:
+    """Entero determinista a partir de textos."""
+    return int.from_bytes(hashlib.sha256('\x00'.join(parts).encode()).digest()[:8], 'big')
+
+
+def _score(text: str, salt: str) -> int:
+    """Score determinista 0-100 de un texto."""
+    return _digest(salt, text) % 101
+
+
+def _verdict(text: str) -> Dict:
+    """Veredicto simulado del validador para una noticia."""
+    relevance = _score(text, 'relevance')
+    return {
+        'is_recent': _score(text, 'recent') >= 20,
+        'relevance_score': relevance,
+        'quality_score': _score(text, 'quality'),
+        'reason': f"Respuesta simulada (relevancia {relevance})",
+        'topics_matched': ["Simulado"] if relevance >= 50 else []
+    }
+
+
+def fake_content(messages: List[Dict]) -> str:
+    """
+    Respuesta determinista según el tipo de prompt.
+
+    Args:
+        messages: Mensajes del chat
+
+    Returns:
+        Contenido del mensaje del asistente
+    """
+    system = "\n".join(m.get('content') or '' for m in messages if m.get('role') == 'system')
+    user = "\n".join(m.get('content') or '' for m in messages if m.get('role') != 'system')
+
+    if 'hook_english' in system:
+        key = f"{_digest(user):x}"[:8]
+        return json.dumps({
+            'hook_english': f"Simulated hook {key}.\n\nWhat do you think?",
+            'thread_english': [f"1/2 Simulated analysis {key}", f"2/2 Simulated implications {key}"],
+            'hook_spanish': f"Hook simulado {key}.\n\n¿Cómo lo ves?",
+            'thread_spanish': [f"1/2 Análisis simulado {key}", f"2/2 Implicaciones simuladas {key}"]
+        }, ensure_ascii=False)
+
+    if '"results"' in system:
+        # Un bloque por noticia: "[id=N]\n..." hasta el siguiente id
+        blocks = _BATCH_ID.split(user)[1:]
+        results = [
+            {'id': int(news_id), **_verdict(text.strip())}
+            for news_id, text in zip(blocks[::2], blocks[1::2])
+        ]
+        return json.dumps({'results': results}, ensure_ascii=False)
+
+    if '"score"' in system:
+        score = _score(user, 'score')
+        return json.dumps({'score': score, 'reason': f"Score simulado {score}"}, ensure_ascii=False)
+
+    if 'relevance_score' in system:
+        return json.dumps(_verdict(user), ensure_ascii=False)
+
+    return f"Respuesta simulada {_digest(system, user):x}"
+
+
+class FakeChatServer:
+    """Servidor HTTP local que imita la API de chat completions."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 200,
+        jitter_ms: float = 50,
+        error_rate: float = 0.0,
+        requests_per_minute: Optional[int] = None,
+        seed: int = 42
+    ):
+        """
+        Inicializa el servidor (no arranca hasta `start`).
+
+        Args:
+            host: Interfaz donde escuchar
+            port: Puerto (0 = uno libre)
+            latency_ms: Latencia base de cada respuesta
+            jitter_ms: Variación aleatoria máxima de la latencia
+            error_rate: Probabilidad de responder 500/503
+            requests_per_minute: Límite de requests por minuto (None = sin límite)
+            seed: Semilla de la latencia y los errores simulados
+        """
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.requests_per_minute = requests_per_minute
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._recent_requests: deque = deque()
+        self._seen_prefixes = set()
+        self.stats = {
+            'requests': 0,
+            'ok': 0,
+            'errors': 0,
+            'rate_limited': 0,
+            'prompt_tokens': 0,
+            'cached_tokens': 0,
+            'completion_tokens': 0
+        }
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """URL base de la API (para LLM_BASE_URL)."""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> 'FakeChatServer':
+        """Arranca el servidor en un thread de fondo."""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Detiene el servidor."""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> 'FakeChatServer':
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _admit(self) -> Tuple[Optional[int], Optional[float], float]:
+        """
+        Decide el destino de un request.
+
+        Returns:
+            (status de error o None, Retry-After o None, latencia en segundos)
+        """
+        with self._lock:
+            self.stats['requests'] += 1
+            now = time.monotonic()
+
+            if self.requests_per_minute:
+                while self._recent_requests and now - self._recent_requests[0] >= 60:
+                    self._recent_requests.popleft()
+                if len(self._recent_requests) >= self.requests_per_minute:
+                    self.stats['rate_limited'] += 1
+                    return 429, 60 - (now - self._recent_requests[0]), 0.0
+                self._recent_requests.append(now)
+
+            latency = (self.latency_ms + self._random.uniform(0, self.jitter_ms)) / 1000
+            if self._random.random() < self.error_rate:
+                self.stats['errors'] += 1
+                return self._random.choice((500, 503)), None, latency
+            return None, None, latency
+
+    def _cached_tokens(self, messages: List[Dict], model: str) -> int:
+        """Tokens del prefijo que el proveedor tendría en caché."""
+        if not messages or messages[0].get('role') != 'system':
+            return 0
+        prefix = messages[0].get('content') or ''
+        prefix_tokens = count_tokens(prefix, model)
+        if prefix_tokens < PROMPT_CACHE_MIN_TOKENS:
+            return 0
+        key = hashlib.sha256(prefix.encode()).digest()
+        with self._lock:
+            seen = key in self._seen_prefixes
+            self._seen_prefixes.add(key)
+        return prefix_tokens // PROMPT_CACHE_BLOCK * PROMPT_CACHE_BLOCK if seen else 0
+
+    def complete(self, request: Dict) -> Dict:
+        """
+        Respuesta de chat completions para un request válido.
+
+        Args:
+            request: Cuerpo del request (model, messages...)
+
+        Returns:
+            JSON de respuesta de chat completions
+        """
+        model = request.get('model') or 'gpt-3.5-turbo'
+        messages = request.get('messages') or []
+        content = fake_content(messages)
+
+        prompt_tokens = count_message_tokens(messages, model)
+        completion_tokens = count_tokens(content, model)
+        if request.get('max_tokens'):
+            completion_tokens = min(completion_tokens, int(request['max_tokens']))
+        cached_tokens = self._cached_tokens(messages, model)
+
+        with self._lock:
+            self.stats['ok'] += 1
+            self.stats['prompt_tokens'] += prompt_tokens
+            self.stats['cached_tokens'] += cached_tokens
+            self.stats['completion_tokens'] += completion_tokens
+
+        return {
+            'id': f"chatcmpl-fake-{_digest(model, json.dumps(messages, sort_keys=True)):x}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': model,
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop'
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+                'prompt_tokens_details': {'cached_tokens': cached_tokens}
+            }
+        }
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status: int, payload: Dict, headers: Dict = None):
+                body = json.dumps(payload, ensure_ascii=False).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_error(self, status: int, message: str, headers: Dict = None):
+                self._send_json(status, {
+                    'error': {'message': message, 'type': 'fake_server_error', 'code': status}
+                }, headers)
+
+            def do_GET(self):
+                if self.path in ('/health', '/v1/health'):
+                    self._send_json(200, {'status': 'ok'})
+                elif self.path in ('/stats', '/v1/stats'):
+                    with server._lock:
+                        self._send_json(200, dict(server.stats))
+                else:
+                    self._send_error(404, f"Ruta desconocida: {self.path}")
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length)
+
+                if self.path not in ('/v1/chat/completions', '/chat/completions'):
+                    self._send_error(404, f"Ruta desconocida: {self.path}")
+                    return
+                try:
+                    request = json.loads(body)
+                    if not isinstance(request.get('messages'), list):
+                        raise ValueError("messages debe ser una lista")
+                except ValueError as e:
+                    self._send_error(400, f"Request inválido: {e}")
+                    return
+
+                status, retry_after, latency = server._admit()
+                if status == 429:
+                    self._send_error(429, "Rate limit simulado", {
+                        'Retry-After': f"{retry_after:.3f}",
+                        'retry-after-ms': str(int(retry_after * 1000))
+                    })
+                    return
+
+                time.sleep(latency)
+                if status is not None:
+                    self._send_error(status, "Error simulado del servidor")
+                    return
+                self._send_json(200, server.complete(request))
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local compatible con chat completions")
+    parser.add_argument('--host', default='127.0.0.1', help='Interfaz donde escuchar')
+    parser.add_argument('--port', type=int, default=8765, help='Puerto')
+    parser.add_argument('--latency-ms', type=float, default=200, help='Latencia base')
+    parser.add_argument('--jitter-ms', type=float, default=50, help='Variación de la latencia')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probabilidad de error 5xx')
+    parser.add_argument('--rpm', type=int, default=None, help='Límite de requests por minuto')
+    parser.add_argument('--seed', type=int, default=42, help='Semilla de latencia y errores')
+    args = parser.parse_args()
+
+    server = FakeChatServer(
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        requests_per_minute=args.rpm,
+        seed=args.seed
+    )
+    print(f"🧪 Servidor LLM simulado en {server.url}")
+    print(f"   LLM_BACKEND=http LLM_BASE_URL={server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"\n📊 {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
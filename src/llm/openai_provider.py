@@ -6,125 +6,42 @@ Este módulo maneja toda la interacción con la API de OpenAI:
 - Generación de múltiples versiones de tweets
 """
 
-from openai import OpenAI
+import sys
+from pathlib import Path
 from typing import List, Dict
 import json
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-class OpenAIProvider:
-    """
-    Proveedor de OpenAI para scoring y generación de tweets.
-    
-    Este proveedor usa GPT para:
-    1. Calificar noticias de forma inteligente
-    2. Generar 3 versiones de tweets por noticia
-    """
-    
-    def __init__(self, api_key: str, model: str = "gpt-3.5-turbo"):
-        """
-        Inicializa el proveedor de OpenAI.
-        
-        Args:
-            api_key: Tu API key de OpenAI
-            model: Modelo a usar (gpt-3.5-turbo, gpt-4, gpt-4-turbo, etc.)
-        """
-        self.client = OpenAI(api_key=api_key)
-        self.model = model
-        
-    def score_news(self, title: str, summary: str, source: str = "") -> Dict:
-        """
-        Califica una noticia usando GPT.
-        
-        Args:
-            title: Título de la noticia
-            summary: Resumen/descripción
-            source: Fuente de la noticia
-            
-        Returns:
-            Dict con score y razón
-        """
-        
-        prompt = f"""Eres un experto en noticias tecnológicas y startups.
+from llm.backends import create_llm_client
+from llm.prompts import PromptTemplate
+from llm.scheduler import LLMScheduler, get_llm_scheduler
+
+# Prompts precompilados: el prefijo estático (system) es idéntico en cada
+# request y va primero, así el proveedor puede reutilizarlo (prompt caching);
+# el mensaje user solo lleva los datos de la noticia
+SCORE_PROMPT = PromptTemplate(
+    system="""Eres un experto analista de noticias tecnológicas y startups.
 
-Califica esta noticia de 0 a 100 según:
+Califica la noticia que recibirás de 0 a 100 según:
 - Relevancia para la comunidad tech
 - Importancia del tema
 - Novedad/actualidad
 - Impacto en la industria
 
-Noticia:
-Título: {title}
-Resumen: {summary}
-Fuente: {source}
-
 Responde SOLO en formato JSON:
-{{
+{
     "score": <número del 0-100>,
     "reason": "<breve razón en español>"
-}}"""
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "Eres un experto analista de noticias tech."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,  # Bajo para ser consistente
-                max_tokens=150
-            )
-            
-            result = response.choices[0].message.content.strip()
-            
-            # Parsear JSON
-            data = json.loads(result)
-            
-            return {
-                'score': float(data.get('score', 0)),
-                'reason': data.get('reason', 'Sin razón'),
-                'model_used': self.model
-            }
-            
-        except Exception as e:
-            print(f"⚠️  Error en scoring con OpenAI: {str(e)}")
-            return {
-                'score': 0,
-                'reason': f'Error: {str(e)}',
-                'model_used': self.model
-            }
-    
-    def generate_tweet_thread(
-        self,
-        title: str,
-        summary: str,
-        full_content: str = "",
-        source: str = "",
-        link: str = ""
-    ) -> List[Dict]:
-        """
-        Genera UN THREAD técnico y explicativo (puede ser múltiples tweets).
-        
-        Args:
-            title: Título de la noticia
-            summary: Resumen
-            full_content: Contenido completo (si está disponible)
-            source: Fuente
-            
-        Returns:
-            Lista de tweets (thread) con formato simplificado
-        """
-        
-        # Combinar toda la información disponible
-        content_for_analysis = f"{title}\n\n{summary}"
-        if full_content:
-            content_for_analysis += f"\n\n{full_content[:2000]}"  # Max 2000 chars
-        
-        prompt = f"""Eres un ANALISTA TÉCNICO que explica noticias tech de forma DIRECTA, CONVERSACIONAL y CON DATOS CONCRETOS.
+}""",
+    user_template="Noticia:\nTítulo: {title}\nResumen: {summary}\nFuente: {source}"
+)
 
-Noticia:
-{content_for_analysis}
+TWEET_THREAD_PROMPT = PromptTemplate(
+    system="""You are a technical analyst who explains tech news in depth. Always respond with valid JSON only.
 
-Fuente: {source}
+Eres un ANALISTA TÉCNICO que explica noticias tech de forma DIRECTA, CONVERSACIONAL y CON DATOS CONCRETOS.
 
 Tu misión: EXPLICAR QUÉ PASÓ de forma directa con datos, nombres propios y preguntas que generen interacción.
 
@@ -178,7 +95,7 @@ FORMATO DEL THREAD:
 GENERA AMBAS VERSIONES (Inglés Y Español):
 
 RESPONDE SOLO ESTE JSON:
-{{
+{
   "hook_english": "Microsoft wants to eliminate all C/C++ code.\n\nReplacing it with Rust.\n\n1 engineer, 1 month, 1M lines.\n\nTarget: 2030. What do you think?",
   "thread_english": [
     "1/3 [explicación directa con puntos ✓ o ①②③]",
@@ -191,7 +108,7 @@ RESPONDE SOLO ESTE JSON:
     "2/3 [continuación con datos concretos]",
     "3/3 [final con implicaciones]"
   ]
-}}
+}
 
 IMPORTANTE: 
 - Cada tweet debe tener máximo 280 caracteres
@@ -200,21 +117,150 @@ IMPORTANTE:
 - Usa \\n\\n para separar párrafos en el hook
 - Ambas versiones (inglés y español) deben tener el mismo número de tweets
 - Numera los tweets si son más de 1 (ej: "1/3 ...", "2/3 ...", "3/3 ...")
-- TERMINA el hook con pregunta: "¿Cómo lo ves?", "What do you think?", etc."""
+- TERMINA el hook con pregunta: "¿Cómo lo ves?", "What do you think?", etc.""",
+    user_template="Noticia:\n{content}\n\nFuente: {source}"
+)
+
+
+class OpenAIProvider:
+    """
+    Proveedor de OpenAI para scoring y generación de tweets.
+    
+    Este proveedor usa GPT para:
+    1. Calificar noticias de forma inteligente
+    2. Generar 3 versiones de tweets por noticia
+    """
+    
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-3.5-turbo",
+        scheduler: LLMScheduler = None,
+        client=None
+    ):
+        """
+        Inicializa el proveedor de OpenAI.
+        
+        Args:
+            api_key: Tu API key de OpenAI
+            model: Modelo a usar (gpt-3.5-turbo, gpt-4, gpt-4-turbo, etc.)
+            scheduler: Planificador de llamadas LLM (por defecto el compartido)
+            client: Cliente de chat completions (por defecto el del backend
+                configurado, ver llm.backends)
+        """
+        self.client = client or create_llm_client(api_key)
+        self.model = model
+        self.scheduler = scheduler or get_llm_scheduler()
+        
+    def score_news(self, title: str, summary: str, source: str = "") -> Dict:
+        """
+        Califica una noticia usando GPT.
+        
+        Args:
+            title: Título de la noticia
+            summary: Resumen/descripción
+            source: Fuente de la noticia
+            
+        Returns:
+            Dict con score y razón
+        """
+        
+
+        try:
+            response = self.scheduler.call(
+                self.client,
+                parse=self._parse_score_response,
+                model=self.model,
+                messages=SCORE_PROMPT.messages(title=title, summary=summary, source=source),
+                temperature=0.3,  # Bajo para ser consistente
+                max_tokens=150
+            )
+            
+            return {**response['parsed'], 'model_used': self.model}
+            
+        except Exception as e:
+            print(f"⚠️  Error en scoring con OpenAI: {str(e)}")
+            return {
+                'score': 0,
+                'reason': f'Error: {str(e)}',
+                'model_used': self.model
+            }
+    
+    @staticmethod
+    def _parse_score_response(result_text: str) -> Dict:
+        """
+        Extrae score y razón de la respuesta de scoring.
+        
+        Raises:
+            ValueError: Si no es JSON o no trae un score numérico
+        """
+        data = json.loads(result_text.strip())
+        if not isinstance(data, dict) or not isinstance(data.get('score'), (int, float)):
+            raise ValueError("La respuesta no trae un score numérico")
+        return {
+            'score': float(data['score']),
+            'reason': data.get('reason', 'Sin razón')
+        }
+    
+    def score_many(self, news_list: List[Dict]) -> List[Dict]:
+        """
+        Califica varias noticias en paralelo.
+        
+        Args:
+            news_list: Noticias (con title, summary y source)
+            
+        Returns:
+            Resultados de `score_news`, en el mismo orden
+        """
+        return self.scheduler.map(
+            lambda news_item: self.score_news(
+                news_item.get('title', ''),
+                news_item.get('summary', ''),
+                news_item.get('source', '')
+            ),
+            news_list
+        )
+    
+    def generate_tweet_thread(
+        self,
+        title: str,
+        summary: str,
+        full_content: str = "",
+        source: str = "",
+        link: str = ""
+    ) -> List[Dict]:
+        """
+        Genera UN THREAD técnico y explicativo (puede ser múltiples tweets).
+        
+        Args:
+            title: Título de la noticia
+            summary: Resumen
+            full_content: Contenido completo (si está disponible)
+            source: Fuente
+            
+        Returns:
+            Lista de tweets (thread) con formato simplificado
+        """
+        
+        # Combinar toda la información disponible
+        content_for_analysis = f"{title}\n\n{summary}"
+        if full_content:
+            content_for_analysis += f"\n\n{full_content[:2000]}"  # Max 2000 chars
+        
 
         try:
-            response = self.client.chat.completions.create(
+            # Texto creativo: cada generación debe ser nueva, sin caché
+            response = self.scheduler.call(
+                self.client,
+                use_cache=False,
                 model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a technical analyst who explains tech news in depth. Always respond with valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
+                messages=TWEET_THREAD_PROMPT.messages(content=content_for_analysis, source=source),
                 temperature=0.7,  # Balance creatividad/precisión
                 max_tokens=1500,
                 response_format={"type": "json_object"}
             )
             
-            result = response.choices[0].message.content.strip()
+            result = response['content'].strip()
             
             # Parsear JSON
             try:
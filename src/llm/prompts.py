@@ -0,0 +1,171 @@
+"""
+Prompts - Plantillas de prompts y conteo local de tokens
+
+Cada prompt se divide en:
+- Un prefijo estático (mensaje system): instrucciones, criterios y formato
+  de respuesta. Se construye una sola vez y va siempre primero y sin
+  cambios, así el proveedor puede reutilizarlo entre requests (prompt
+  caching de OpenAI: se cobra más barato y se procesa más rápido)
+- La parte variable (mensaje user): solo los datos de la noticia
+
+Los tokens se cuentan localmente antes de enviar: con tiktoken si está
+instalado, si no con una estimación de ~4 caracteres por token. Los
+precios por modelo permiten calcular el coste de cada llamada.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_MODEL = 'gpt-3.5-turbo'
+
+# Tokens extra por mensaje del chat (rol y separadores) y por respuesta
+TOKENS_PER_MESSAGE = 4
+TOKENS_PER_REPLY = 3
+
+# USD por millón de tokens: (prompt, prompt en caché, respuesta)
+MODEL_PRICES = {
+    'gpt-3.5-turbo': (0.50, 0.50, 1.50),
+    'gpt-4o-mini': (0.15, 0.075, 0.60),
+    'gpt-4o': (2.50, 1.25, 10.00),
+    'gpt-4-turbo': (10.00, 10.00, 30.00),
+    'gpt-4': (30.00, 30.00, 60.00),
+}
+
+
+@lru_cache(maxsize=None)
+def _encoding(model: str):
+    """Codificación de tiktoken para el modelo (None si no está disponible)."""
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        pass
+    except Exception:
+        # p.ej. sin red para descargar el vocabulario
+        return None
+    try:
+        return tiktoken.get_encoding('cl100k_base')
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = DEFAULT_MODEL) -> int:
+    """
+    Cuenta los tokens de un texto.
+
+    Args:
+        text: Texto a contar
+        model: Modelo (define el tokenizador)
+
+    Returns:
+        Número de tokens (exacto con tiktoken, estimado si no)
+    """
+    if not text:
+        return 0
+    encoding = _encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(messages: List[Dict], model: str = DEFAULT_MODEL) -> int:
+    """
+    Cuenta los tokens de prompt de una lista de mensajes del chat.
+
+    Args:
+        messages: Mensajes ({'role', 'content'})
+        model: Modelo (define el tokenizador)
+
+    Returns:
+        Tokens de prompt, incluyendo el overhead de cada mensaje
+    """
+    return TOKENS_PER_REPLY + sum(
+        TOKENS_PER_MESSAGE + count_tokens(message.get('content') or '', model)
+        for message in messages
+    )
+
+
+def model_prices(model: Optional[str]) -> Tuple[float, float, float]:
+    """
+    Precios del modelo (el nombre más largo que sea prefijo, p.ej.
+    'gpt-4o-mini-2024-07-18' -> 'gpt-4o-mini').
+
+    Args:
+        model: Nombre del modelo
+
+    Returns:
+        (prompt, prompt en caché, respuesta) en USD por millón de tokens
+    """
+    model = model or DEFAULT_MODEL
+    for name in sorted(MODEL_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            return MODEL_PRICES[name]
+    return MODEL_PRICES[DEFAULT_MODEL]
+
+
+def estimate_cost(
+    model: Optional[str],
+    prompt_tokens: int,
+    completion_tokens: int,
+    cached_tokens: int = 0
+) -> float:
+    """
+    Coste en USD de una llamada.
+
+    Args:
+        model: Modelo usado
+        prompt_tokens: Tokens de prompt (incluye los que vienen de caché)
+        completion_tokens: Tokens de respuesta
+        cached_tokens: Tokens de prompt servidos desde la caché del proveedor
+
+    Returns:
+        Coste en USD
+    """
+    prompt_price, cached_price, completion_price = model_prices(model)
+    cached_tokens = min(cached_tokens, prompt_tokens)
+    return (
+        (prompt_tokens - cached_tokens) * prompt_price
+        + cached_tokens * cached_price
+        + completion_tokens * completion_price
+    ) / 1_000_000
+
+
+class PromptTemplate:
+    """Prompt con prefijo estático (system) y parte variable (user)."""
+
+    def __init__(self, system: str, user_template: str):
+        """
+        Inicializa la plantilla.
+
+        Args:
+            system: Prefijo estático, idéntico en todas las llamadas
+            user_template: Parte variable, con campos de str.format
+        """
+        self.system = system
+        self.user_template = user_template
+        self._system_message = {'role': 'system', 'content': system}
+
+    def messages(self, **values) -> List[Dict]:
+        """
+        Mensajes de una llamada: primero el prefijo, después los datos.
+
+        Args:
+            **values: Valores de los campos de user_template
+
+        Returns:
+            Lista de mensajes para chat completions
+        """
+        return [
+            dict(self._system_message),
+            {'role': 'user', 'content': self.user_template.format(**values)}
+        ]
+
+    def prefix_tokens(self, model: str = DEFAULT_MODEL) -> int:
+        """Tokens del prefijo estático (lo que el proveedor puede reutilizar)."""
+        return count_tokens(self.system, model) + TOKENS_PER_MESSAGE
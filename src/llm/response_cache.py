@@ -0,0 +1,209 @@
+"""
+LLM Response Cache - Caché persistente de respuestas del LLM
+
+realtime_news.json guarda las últimas 200 noticias, así que la misma
+noticia se vuelve a validar (y a pagar) en cada ejecución. Esta caché
+guarda en SQLite la respuesta de cada request:
+- Clave: SHA-256 del request canónico (modelo, mensajes, temperatura y
+  demás parámetros), así un prompt idéntico nunca se paga dos veces
+- Expiración por TTL (un día por defecto) y tamaño máximo (se eliminan
+  las menos usadas)
+- Solo se guardan respuestas que el llamador pudo interpretar (ver
+  `LLMScheduler.call`), así una respuesta mal formada no se repite
+- Segura entre threads (el planificador llama desde varios a la vez)
+- Contadores de aciertos/fallos para medir el ratio de aciertos
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class LLMResponseCache:
+    """Caché de respuestas de chat completions respaldada por SQLite."""
+
+    def __init__(
+        self,
+        db_path: str = "data/llm_cache.db",
+        ttl_days: float = 1,
+        max_entries: int = 20_000
+    ):
+        """
+        Inicializa la caché.
+
+        Args:
+            db_path: Ruta de la base SQLite
+            ttl_days: Días que una respuesta se considera válida
+            max_entries: Máximo de respuestas guardadas (se eliminan las menos usadas)
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key BLOB PRIMARY KEY,"
+            " model TEXT,"
+            " temperature REAL,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " used_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS responses_used_at_idx ON responses (used_at)")
+        self.conn.commit()
+
+    @staticmethod
+    def make_key(request: Dict[str, Any]) -> bytes:
+        """
+        Huella de un request: SHA-256 de su JSON canónico.
+
+        Args:
+            request: Parámetros de la llamada (model, messages, temperature...)
+
+        Returns:
+            Digest de 32 bytes
+        """
+        canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode()).digest()
+
+    def get(self, request: Dict[str, Any]) -> Optional[Dict]:
+        """
+        Busca la respuesta guardada de un request.
+
+        Args:
+            request: Parámetros de la llamada
+
+        Returns:
+            Respuesta guardada (content, usage, model) o None
+        """
+        key = self.make_key(request)
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT response FROM responses WHERE key = ? AND created_at >= ?",
+                (key, now - self.ttl_seconds)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.conn.execute("UPDATE responses SET used_at = ? WHERE key = ?", (now, key))
+            self.conn.commit()
+        return json.loads(row[0])
+
+    def put(self, request: Dict[str, Any], response: Dict):
+        """
+        Guarda la respuesta de un request.
+
+        Args:
+            request: Parámetros de la llamada
+            response: Respuesta a guardar (debe ser serializable a JSON)
+        """
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, model, temperature, response, created_at, used_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    self.make_key(request),
+                    request.get('model'),
+                    request.get('temperature'),
+                    json.dumps(response, ensure_ascii=False),
+                    now,
+                    now
+                )
+            )
+            self._prune_locked()
+            self.conn.commit()
+
+    def delete(self, request: Dict[str, Any]):
+        """
+        Elimina la respuesta guardada de un request (p.ej. si no es válida).
+
+        Args:
+            request: Parámetros de la llamada
+        """
+        with self._lock:
+            self.conn.execute("DELETE FROM responses WHERE key = ?", (self.make_key(request),))
+            self.conn.commit()
+
+    def prune(self) -> int:
+        """
+        Elimina respuestas expiradas y las menos usadas si se supera el máximo.
+
+        Returns:
+            Número de respuestas eliminadas
+        """
+        with self._lock:
+            removed = self._prune_locked()
+            self.conn.commit()
+        return removed
+
+    def _prune_locked(self) -> int:
+        """Aplica TTL y tamaño máximo (requiere el lock)."""
+        cutoff = time.time() - self.ttl_seconds
+        removed = self.conn.execute(
+            "DELETE FROM responses WHERE created_at < ?", (cutoff,)
+        ).rowcount
+
+        excess = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0] - self.max_entries
+        if excess > 0:
+            removed += self.conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY used_at ASC LIMIT ?"
+                ")",
+                (excess,)
+            ).rowcount
+        return removed
+
+    def stats(self) -> Dict:
+        """
+        Métricas de la caché.
+
+        Returns:
+            Dict con hits, misses, hit_ratio y entries
+        """
+        with self._lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'entries': entries
+            }
+
+    def close(self):
+        """Cierra la base."""
+        with self._lock:
+            self.conn.close()
+
+    def __len__(self) -> int:
+        return self.stats()['entries']
+
+
+# Instancia compartida por proceso
+_shared_cache: Optional[LLMResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Devuelve la caché de respuestas LLM compartida por todo el proceso."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMResponseCache()
+        return _shared_cache
@@ -0,0 +1,541 @@
+"""
+LLM Scheduler - Planificador compartido de llamadas a la API de chat
+
+El validador, el proveedor de OpenAI y el generador de tweets hacían las
+llamadas una detrás de otra: validar 30 noticias tardaba la suma de 30
+latencias. El planificador, uno por proceso:
+- Ejecuta varias llamadas a la vez (concurrencia acotada)
+- Respeta los límites de la cuenta con dos token buckets: requests por
+  minuto y tokens por minuto
+- Reintenta errores transitorios (429, 5xx, timeouts) con backoff,
+  respetando el header Retry-After: un 429 pausa a todos los workers
+- Registra latencia, tokens, coste e intentos de cada llamada, y corta
+  la ejecución si se supera el presupuesto de tokens o de coste
+- Consulta antes la caché de respuestas (si tiene una): un prompt
+  idéntico se responde sin llamar a la API
+"""
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from llm.prompts import count_message_tokens, estimate_cost
+from llm.response_cache import LLMResponseCache, get_llm_response_cache
+
+# Errores HTTP que vale la pena reintentar
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMBudgetExceeded(RuntimeError):
+    """La llamada superaría el presupuesto de tokens o coste de la ejecución."""
+
+
+class TokenBucket:
+    """Token bucket thread-safe: `rate` unidades por minuto, hasta `capacity` acumuladas."""
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        """
+        Inicializa el bucket lleno.
+
+        Args:
+            rate_per_minute: Unidades que se recargan por minuto
+            capacity: Máximo acumulable (por defecto, un minuto de recarga)
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity if capacity is not None else rate_per_minute
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """Recarga según el tiempo transcurrido (requiere el lock)."""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1.0) -> float:
+        """
+        Consume unidades, esperando a que haya suficientes.
+
+        Una petición mayor que la capacidad espera a tener el bucket lleno
+        y lo deja en negativo (si no, no pasaría nunca).
+
+        Args:
+            amount: Unidades a consumir
+
+        Returns:
+            Segundos esperados
+        """
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                needed = min(amount, self.capacity)
+                if self.tokens >= needed:
+                    self.tokens -= amount
+                    return waited
+                wait = (needed - self.tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def refund(self, amount: float):
+        """
+        Devuelve unidades (p.ej. si la llamada usó menos tokens de los estimados).
+
+        Args:
+            amount: Unidades a devolver (negativo para cobrar de más)
+        """
+        with self.lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class LLMScheduler:
+    """Planificador de llamadas a chat completions con concurrencia y rate limits."""
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        requests_per_minute: float = 500,
+        tokens_per_minute: float = 200_000,
+        max_retries: int = 4,
+        base_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        history_size: int = 1000,
+        cache: Optional[LLMResponseCache] = None,
+        max_run_tokens: Optional[int] = None,
+        max_run_cost: Optional[float] = None
+    ):
+        """
+        Inicializa el planificador.
+
+        Args:
+            max_concurrency: Llamadas simultáneas como máximo
+            requests_per_minute: Límite de requests por minuto
+            tokens_per_minute: Límite de tokens (prompt + respuesta) por minuto
+            max_retries: Reintentos de errores transitorios
+            base_backoff: Espera del primer reintento sin Retry-After (se duplica)
+            max_backoff: Espera máxima entre reintentos
+            history_size: Llamadas recientes guardadas para métricas
+            cache: Caché de respuestas (None = sin caché)
+            max_run_tokens: Tokens máximos de toda la ejecución (None = sin límite)
+            max_run_cost: Coste máximo en USD de toda la ejecución (None = sin límite)
+        """
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.cache = cache
+        self.max_run_tokens = max_run_tokens
+        self.max_run_cost = max_run_cost
+
+        self.request_bucket = TokenBucket(requests_per_minute)
+        self.token_bucket = TokenBucket(tokens_per_minute)
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="llm")
+
+        # Hasta cuándo están pausadas todas las llamadas (tras un 429)
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # Tokens y coste estimados de las llamadas en curso (para el presupuesto)
+        self._reserved_tokens = 0
+        self._reserved_cost = 0.0
+
+        self.history: deque = deque(maxlen=history_size)
+        self.totals = {
+            'calls': 0,
+            'cache_hits': 0,
+            'errors': 0,
+            'retries': 0,
+            'rate_limited': 0,
+            'prompt_tokens': 0,
+            'cached_prompt_tokens': 0,
+            'completion_tokens': 0,
+            'cost_usd': 0.0,
+            'budget_rejected': 0
+        }
+
+    @staticmethod
+    def estimate_tokens(messages: List[Dict], max_tokens: int = 0, model: Optional[str] = None) -> int:
+        """
+        Tokens de una llamada, contados localmente antes de enviarla.
+
+        Args:
+            messages: Mensajes del chat
+            max_tokens: Tokens máximos de respuesta
+            model: Modelo (define el tokenizador)
+
+        Returns:
+            Tokens de prompt + respuesta máxima
+        """
+        return count_message_tokens(messages, model or 'gpt-3.5-turbo') + (max_tokens or 0)
+
+    def _reserve_budget(self, model: Optional[str], prompt_tokens: int, max_tokens: int):
+        """
+        Reserva el peor caso de una llamada dentro del presupuesto.
+
+        Raises:
+            LLMBudgetExceeded: Si la llamada podría superar el presupuesto
+        """
+        tokens = prompt_tokens + max_tokens
+        cost = estimate_cost(model, prompt_tokens, max_tokens)
+        with self._lock:
+            used_tokens = self.totals['prompt_tokens'] + self.totals['completion_tokens']
+            if self.max_run_tokens is not None and \
+                    used_tokens + self._reserved_tokens + tokens > self.max_run_tokens:
+                self.totals['budget_rejected'] += 1
+                raise LLMBudgetExceeded(
+                    f"Presupuesto de tokens agotado ({used_tokens}/{self.max_run_tokens})"
+                )
+            if self.max_run_cost is not None and \
+                    self.totals['cost_usd'] + self._reserved_cost + cost > self.max_run_cost:
+                self.totals['budget_rejected'] += 1
+                raise LLMBudgetExceeded(
+                    f"Presupuesto de coste agotado "
+                    f"(${self.totals['cost_usd']:.4f}/${self.max_run_cost:.4f})"
+                )
+            self._reserved_tokens += tokens
+            self._reserved_cost += cost
+
+    def _release_budget(self, model: Optional[str], prompt_tokens: int, max_tokens: int):
+        """Libera la reserva de `_reserve_budget` al terminar la llamada."""
+        with self._lock:
+            self._reserved_tokens -= prompt_tokens + max_tokens
+            self._reserved_cost -= estimate_cost(model, prompt_tokens, max_tokens)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        """Segundos indicados por Retry-After (o retry-after-ms) en la respuesta de error."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        value = headers.get('retry-after-ms')
+        if value:
+            try:
+                return float(value) / 1000
+            except ValueError:
+                pass
+
+        value = headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            try:
+                return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+            except (TypeError, ValueError):
+                return None
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        """True si el error es transitorio (rate limit, error del servidor, red)."""
+        status = getattr(error, 'status_code', None)
+        if status is not None:
+            return status in RETRYABLE_STATUS
+        name = type(error).__name__
+        return 'Timeout' in name or 'Connection' in name
+
+    def _wait_if_paused(self) -> float:
+        """Espera mientras haya una pausa global por rate limit."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                remaining = self._paused_until - time.monotonic()
+            if remaining <= 0:
+                return waited
+            time.sleep(remaining)
+            waited += remaining
+
+    def _pause(self, seconds: float):
+        """Pausa todas las llamadas durante `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def _record(self, record: Dict):
+        """Guarda las métricas de una llamada."""
+        with self._lock:
+            self.history.append(record)
+            self.totals['calls'] += 1
+            self.totals['retries'] += record['attempts'] - 1
+            self.totals['prompt_tokens'] += record['prompt_tokens']
+            self.totals['cached_prompt_tokens'] += record.get('cached_tokens', 0)
+            self.totals['completion_tokens'] += record['completion_tokens']
+            self.totals['cost_usd'] += record.get('cost_usd', 0.0)
+            if record['status'] != 'ok':
+                self.totals['errors'] += 1
+
+    def call(
+        self,
+        client: Any,
+        use_cache: bool = True,
+        parse: Optional[Callable[[str], Any]] = None,
+        **request: Any
+    ) -> Dict:
+        """
+        Hace una llamada a chat completions respetando límites y reintentos.
+
+        Se ejecuta en el thread que la invoca (puede usarse desde threads
+        propios o desde `submit`/`map`). Si el planificador tiene caché y
+        el mismo request ya se respondió, se devuelve esa respuesta sin
+        llamar a la API (attempts = 0, cached = True).
+
+        Solo se guardan en la caché respuestas que `parse` acepta: una
+        respuesta mal formada no se sirve de nuevo, se vuelve a pedir.
+
+        Args:
+            client: Cliente con la interfaz de OpenAI (client.chat.completions.create)
+            use_cache: Consultar y guardar la respuesta en la caché (False
+                para respuestas que deben variar, p.ej. texto creativo)
+            parse: Convierte el contenido en el resultado que usa el llamador
+                y lanza una excepción si no es válido (sin parse no se usa
+                la caché)
+            **request: Parámetros de la llamada (model, messages, max_tokens...)
+
+        Returns:
+            Dict con content, parsed (si hay parse), usage (prompt/completion/
+            total tokens), model, latency_ms, attempts, waited_ms (espera por
+            rate limit) y cached
+
+        Raises:
+            LLMBudgetExceeded: Si la llamada superaría el presupuesto de la ejecución
+            Exception: El último error si se agotan los reintentos o no es
+                transitorio, o el de `parse` si la respuesta no es válida
+        """
+        cache = self.cache if use_cache and parse is not None else None
+        if cache is not None:
+            cached = cache.get(request)
+            if cached is not None:
+                try:
+                    parsed = parse(cached['content'])
+                except Exception:
+                    # Entrada inválida: descartarla y volver a pedir
+                    cache.delete(request)
+                else:
+                    with self._lock:
+                        self.totals['cache_hits'] += 1
+                    return {
+                        **cached,
+                        'parsed': parsed,
+                        'cost_usd': 0.0,
+                        'latency_ms': 0.0,
+                        'attempts': 0,
+                        'waited_ms': 0.0,
+                        'cached': True
+                    }
+
+        model = request.get('model')
+        max_tokens = request.get('max_tokens') or 0
+        prompt_estimate = count_message_tokens(request.get('messages', []), model or 'gpt-3.5-turbo')
+        start = time.monotonic()
+
+        self._reserve_budget(model, prompt_estimate, max_tokens)
+        try:
+            result = self._call_with_retries(client, request, prompt_estimate + max_tokens, start)
+        finally:
+            self._release_budget(model, prompt_estimate, max_tokens)
+
+        if parse is not None:
+            result['parsed'] = parse(result['content'])
+            if cache is not None:
+                cache.put(request, {
+                    'content': result['content'],
+                    'usage': result['usage'],
+                    'model': result['model']
+                })
+        return result
+
+    def _call_with_retries(
+        self,
+        client: Any,
+        request: Dict,
+        estimated: int,
+        start: float
+    ) -> Dict:
+        """Bucle de llamada con rate limits y reintentos (ver `call`)."""
+        attempts = 0
+        waited = 0.0
+
+        with self._slots:
+            while True:
+                attempts += 1
+                waited += self._wait_if_paused()
+                waited += self.request_bucket.acquire(1)
+                waited += self.token_bucket.acquire(estimated)
+
+                call_start = time.monotonic()
+                try:
+                    response = client.chat.completions.create(**request)
+                except Exception as e:
+                    # Los tokens estimados no se usaron
+                    self.token_bucket.refund(estimated)
+
+                    if attempts > self.max_retries or not self._is_retryable(e):
+                        self._record({
+                            'model': request.get('model'),
+                            'status': 'error',
+                            'error': str(e),
+                            'latency_ms': round((time.monotonic() - start) * 1000, 1),
+                            'waited_ms': round(waited * 1000, 1),
+                            'attempts': attempts,
+                            'prompt_tokens': 0,
+                            'completion_tokens': 0
+                        })
+                        raise
+
+                    retry_after = self._retry_after(e)
+                    if getattr(e, 'status_code', None) == 429:
+                        with self._lock:
+                            self.totals['rate_limited'] += 1
+                    if retry_after is None:
+                        backoff = min(self.base_backoff * 2 ** (attempts - 1), self.max_backoff)
+                        retry_after = backoff * (0.5 + random.random() / 2)
+                    if getattr(e, 'status_code', None) == 429:
+                        # La cuenta entera está limitada: pausar a todos
+                        self._pause(retry_after)
+                    else:
+                        time.sleep(retry_after)
+                        waited += retry_after
+                    continue
+
+                latency = time.monotonic() - call_start
+                usage = getattr(response, 'usage', None)
+                prompt_tokens = int(getattr(usage, 'prompt_tokens', 0) or 0)
+                completion_tokens = int(getattr(usage, 'completion_tokens', 0) or 0)
+                # Tokens del prefijo reutilizados por el proveedor (prompt caching)
+                details = getattr(usage, 'prompt_tokens_details', None)
+                cached_tokens = int(getattr(details, 'cached_tokens', 0) or 0)
+                model = getattr(response, 'model', None) or request.get('model')
+                cost = estimate_cost(model, prompt_tokens, completion_tokens, cached_tokens)
+
+                # Ajustar el bucket de tokens al consumo real
+                if usage is not None:
+                    self.token_bucket.refund(estimated - prompt_tokens - completion_tokens)
+
+                result = {
+                    'content': response.choices[0].message.content,
+                    'usage': {
+                        'prompt_tokens': prompt_tokens,
+                        'completion_tokens': completion_tokens,
+                        'cached_tokens': cached_tokens,
+                        'total_tokens': prompt_tokens + completion_tokens
+                    },
+                    'cost_usd': cost,
+                    'model': model,
+                    'latency_ms': round(latency * 1000, 1),
+                    'attempts': attempts,
+                    'waited_ms': round(waited * 1000, 1),
+                    'cached': False
+                }
+                self._record({
+                    'model': result['model'],
+                    'status': 'ok',
+                    'latency_ms': result['latency_ms'],
+                    'waited_ms': result['waited_ms'],
+                    'attempts': attempts,
+                    'prompt_tokens': prompt_tokens,
+                    'cached_tokens': cached_tokens,
+                    'completion_tokens': completion_tokens,
+                    'cost_usd': cost
+                })
+                return result
+
+    def submit(self, func: Callable, *args: Any, **kwargs: Any) -> Future:
+        """
+        Ejecuta una función en el pool del planificador.
+
+        La función normalmente hace una o más llamadas con `call`. No debe
+        esperar a otros futures del mismo pool.
+
+        Args:
+            func: Función a ejecutar
+            *args, **kwargs: Argumentos de la función
+
+        Returns:
+            Future con el resultado
+        """
+        return self._executor.submit(func, *args, **kwargs)
+
+    def map(self, func: Callable, items: Iterable) -> List:
+        """
+        Aplica una función a cada elemento en paralelo.
+
+        Args:
+            func: Función de un argumento
+            items: Elementos
+
+        Returns:
+            Resultados en el mismo orden que `items` (si una llamada falla
+            se propaga su excepción)
+        """
+        futures = [self._executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+    def stats(self) -> Dict:
+        """
+        Resumen de métricas de las llamadas registradas.
+
+        Returns:
+            Dict con totales y latencias p50/p95/máx (ms) de las recientes
+        """
+        with self._lock:
+            totals = dict(self.totals)
+            latencies = sorted(r['latency_ms'] for r in self.history if r['status'] == 'ok')
+
+        def percentile(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(int(p * len(latencies)), len(latencies) - 1)]
+
+        totals['latency_p50_ms'] = percentile(0.50)
+        totals['latency_p95_ms'] = percentile(0.95)
+        totals['latency_max_ms'] = latencies[-1] if latencies else 0.0
+
+        lookups = totals['calls'] + totals['cache_hits']
+        totals['cache_hit_ratio'] = totals['cache_hits'] / lookups if lookups else 0.0
+        return totals
+
+    def print_stats(self):
+        """Muestra las métricas acumuladas."""
+        stats = self.stats()
+        print(f"\n   📈 LLM: {stats['calls']} llamadas, {stats['errors']} errores, "
+              f"{stats['retries']} reintentos ({stats['rate_limited']} por rate limit)")
+        print(f"      Tokens: {stats['prompt_tokens']} prompt ({stats['cached_prompt_tokens']} del prefijo en caché) "
+              f"+ {stats['completion_tokens']} respuesta, coste ~${stats['cost_usd']:.4f}")
+        print(f"      Latencia: p50 {stats['latency_p50_ms']:.0f} ms, "
+              f"p95 {stats['latency_p95_ms']:.0f} ms, máx {stats['latency_max_ms']:.0f} ms")
+        if stats['budget_rejected']:
+            print(f"      ⚠️  {stats['budget_rejected']} llamadas rechazadas por presupuesto")
+        if self.cache is not None:
+            cache_stats = self.cache.stats()
+            print(f"      Caché: {cache_stats['hits']} aciertos de "
+                  f"{cache_stats['hits'] + cache_stats['misses']} consultas "
+                  f"({cache_stats['hit_ratio']:.0%}), {cache_stats['entries']} respuestas guardadas")
+
+
+# Instancia compartida por proceso
+_shared_scheduler: Optional[LLMScheduler] = None
+_shared_scheduler_lock = threading.Lock()
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    """Devuelve el planificador de llamadas LLM compartido por todo el proceso."""
+    global _shared_scheduler
+    with _shared_scheduler_lock:
+        if _shared_scheduler is None:
+            max_run_tokens = os.getenv("LLM_MAX_RUN_TOKENS")
+            max_run_cost = os.getenv("LLM_MAX_RUN_COST_USD")
+            _shared_scheduler = LLMScheduler(
+                cache=get_llm_response_cache(),
+                max_run_tokens=int(max_run_tokens) if max_run_tokens else None,
+                max_run_cost=float(max_run_cost) if max_run_cost else None
+            )
+        return _shared_scheduler
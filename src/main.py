@@ -2,106 +2,125 @@
 TechNews Tweet Generator - Punto de entrada principal
 
 Este es el archivo principal que coordina todo el sistema.
+
+Cada comando importa solo lo que usa (collectors, generadores, OpenAI,
+NumPy...) dentro de su función, así `list` o `review` arrancan sin cargar
+dependencias pesadas. Ver bench_startup.py para medir el arranque.
 """
 
 import argparse
 import json
+import threading
+from importlib import import_module
 from pathlib import Path
-from datetime import datetime
 
-from collectors.rss_collector import RSSCollector
-from collectors.news_api_collector import NewsAPICollector
-from collectors.hackernews_collector import HackerNewsCollector
-from collectors.reddit_scraper import RedditScraper
-from collectors.devto_collector import DevToCollector
-from collectors.newsdata_collector import NewsDataCollector
-from collectors.guardian_collector import GuardianCollector
-from generators.tweet_generator import TweetGenerator
-from generators.ai_tweet_generator import AITweetGenerator
-from agent import NewsAgent
+from utils.news_item import json_default, to_news_items
+
+
+def preload_modules(*module_names: str) -> threading.Thread:
+    """
+    Importa módulos en un thread de fondo mientras el comando avanza.
+
+    Un `import` posterior del mismo módulo espera a que termine esta
+    carga (lock de importación) en lugar de repetirla.
+
+    Args:
+        module_names: Módulos a importar
+
+    Returns:
+        Thread de la precarga
+    """
+    def load():
+        for name in module_names:
+            try:
+                import_module(name)
+            except Exception:
+                # El import real del comando mostrará el error
+                pass
+
+    thread = threading.Thread(target=load, name="preload", daemon=True)
+    thread.start()
+    return thread
 
 
 def collect_news():
-    """Recopila noticias de todas las fuentes configuradas."""
+    """Recopila noticias de todas las fuentes configuradas (en paralelo)."""
+    from collectors.rss_collector import RSSCollector
+    from collectors.news_api_collector import NewsAPICollector
+    from collectors.hackernews_collector import HackerNewsCollector
+    from collectors.devto_collector import DevToCollector
+    from collectors.newsdata_collector import NewsDataCollector
+    from collectors.guardian_collector import GuardianCollector
+    from utils.collection_orchestrator import CollectionOrchestrator
+    
     print("🔍 Recopilando noticias tecnológicas desde TODAS las fuentes...\n")
     
-    all_news = []
-    stats = {}
+    orchestrator = CollectionOrchestrator(default_timeout=60, global_deadline=120)
     
     # Fuente 1: RSS Feeds
-    print("📡 Fuente #1: RSS Feeds")
-    print("-" * 60)
-    rss_collector = RSSCollector()
-    rss_news = rss_collector.collect(max_age_hours=24)
-    all_news.extend(rss_news)
-    stats['RSS Feeds'] = len(rss_news)
+    orchestrator.add_task(
+        'RSS Feeds',
+        lambda: RSSCollector().collect(max_age_hours=24)
+    )
     
     # Fuente 2: News API
-    print("\n📡 Fuente #2: News API")
-    print("-" * 60)
-    news_api_collector = NewsAPICollector()
-    news_api_news = news_api_collector.collect(max_age_hours=24, max_results_per_query=10)
-    all_news.extend(news_api_news)
-    stats['News API'] = len(news_api_news)
-    
-    # Fuente 3: Hacker News
-    print("\n📡 Fuente #3: Hacker News")
-    print("-" * 60)
-    hn_collector = HackerNewsCollector()
+    orchestrator.add_task(
+        'News API',
+        lambda: NewsAPICollector().collect(max_age_hours=24, max_results_per_query=10)
+    )
     
+    # Fuente 3: Hacker News (3 pasadas en paralelo, suman en la misma stat)
+    hn_collector = HackerNewsCollector()
     # Top stories (noticias populares)
-    hn_top = hn_collector.collect(story_type='top', max_items=20, min_score=50)
-    print(f"  ✅ HN Top: {len(hn_top)} historias")
-    
+    orchestrator.add_task(
+        'HN Top',
+        lambda: hn_collector.collect(story_type='top', max_items=20, min_score=50),
+        stat_key='Hacker News'
+    )
     # New stories (noticias recientes, últimas 2-3 horas)
-    hn_new = hn_collector.collect(story_type='new', max_items=30, min_score=20)
-    print(f"  ✅ HN New: {len(hn_new)} historias")
-    
+    orchestrator.add_task(
+        'HN New',
+        lambda: hn_collector.collect(story_type='new', max_items=30, min_score=20),
+        stat_key='Hacker News'
+    )
     # Best stories (mejores del día)
-    hn_best = hn_collector.collect(story_type='best', max_items=15, min_score=40)
-    print(f"  ✅ HN Best: {len(hn_best)} historias")
-    
-    all_news.extend(hn_top)
-    all_news.extend(hn_new)
-    all_news.extend(hn_best)
-    stats['Hacker News'] = len(hn_top) + len(hn_new) + len(hn_best)
+    orchestrator.add_task(
+        'HN Best',
+        lambda: hn_collector.collect(story_type='best', max_items=15, min_score=40),
+        stat_key='Hacker News'
+    )
     
     # Fuente 4: Reddit
-    print("\n📡 Fuente #4: Reddit (Scraping)")
-    print("-" * 60)
     # DESACTIVADO - Reddit tiene noticias no oficiales
-    # reddit_scraper = RedditScraper()
-    # reddit_news = reddit_scraper.collect_multiple_subreddits(
-    #     subreddits=['technology', 'programming', 'Python', 'artificial', 'MachineLearning'],
-    #     limit_per_subreddit=10,
-    #     min_score=50
+    orchestrator.add_stat('Reddit')
+    # (reactivar importando collectors.reddit_scraper.RedditScraper)
+    # orchestrator.add_task(
+    #     'Reddit',
+    #     lambda: RedditScraper().collect_multiple_subreddits(
+    #         subreddits=['technology', 'programming', 'Python', 'artificial', 'MachineLearning'],
+    #         limit_per_subreddit=10,
+    #         min_score=50
+    #     )
     # )
-    # all_news.extend(reddit_news)
-    # stats['Reddit'] = len(reddit_news)
-    stats['Reddit'] = 0  # Desactivado
     
     # Fuente 5: Dev.to
-    print("\n📡 Fuente #5: Dev.to")
-    print("-" * 60)
-    devto_collector = DevToCollector()
-    devto_news = devto_collector.collect_multiple_tags(
-        tags=[
-            'python', 'javascript', 'typescript', 'ai', 'webdev',
-            'react', 'nextjs', 'rust', 'machinelearning', 
-            'nodejs', 'devops', 'cloud', 'programming'
-        ],
-        per_page_per_tag=5,  # Menos por tag pero más tags
-        min_reactions=3  # Menos restrictivo
+    orchestrator.add_task(
+        'Dev.to',
+        lambda: DevToCollector().collect_multiple_tags(
+            tags=[
+                'python', 'javascript', 'typescript', 'ai', 'webdev',
+                'react', 'nextjs', 'rust', 'machinelearning', 
+                'nodejs', 'devops', 'cloud', 'programming'
+            ],
+            per_page_per_tag=5,  # Menos por tag pero más tags
+            min_reactions=3  # Menos restrictivo
+        )
     )
-    all_news.extend(devto_news)
-    stats['Dev.to'] = len(devto_news)
     
     # Fuente 6: NewsData.io
-    print("\n📡 Fuente #6: NewsData.io")
-    print("-" * 60)
-    try:
-        newsdata_collector = NewsDataCollector()
-        newsdata_news = newsdata_collector.collect_multiple_queries(
+    orchestrator.add_task(
+        'NewsData.io',
+        lambda: NewsDataCollector().collect_multiple_queries(
             queries=[
                 {'query': 'AI', 'language': 'en'},
                 {'query': 'programming', 'language': 'en'},
@@ -111,37 +130,28 @@ def collect_news():
             ],
             max_results_per_query=10
         )
-        all_news.extend(newsdata_news)
-        stats['NewsData.io'] = len(newsdata_news)
-    except Exception as e:
-        print(f"  ⚠️  Error en NewsData.io: {str(e)}")
-        stats['NewsData.io'] = 0
+    )
     
     # Fuente 7: The Guardian
-    print("\n📡 Fuente #7: The Guardian")
-    print("-" * 60)
-    try:
-        guardian_collector = GuardianCollector()
-        guardian_news = guardian_collector.collect_multiple_sections(
+    orchestrator.add_task(
+        'The Guardian',
+        lambda: GuardianCollector().collect_multiple_sections(
             sections=['technology', 'science', 'business'],
             max_results_per_section=20
         )
-        all_news.extend(guardian_news)
-        stats['The Guardian'] = len(guardian_news)
-    except Exception as e:
-        print(f"  ⚠️  Error en The Guardian: {str(e)}")
-        stats['The Guardian'] = 0
+    )
+    
+    # Ejecutar todas las fuentes a la vez (resultados parciales si alguna falla)
+    all_news, stats = orchestrator.run()
+    orchestrator.print_report()
     
     # Guardar todas las noticias combinadas
     if all_news:
-        import json
-        from pathlib import Path
-        
         output_file = Path("data/news.json")
         output_file.parent.mkdir(exist_ok=True)
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(all_news, f, ensure_ascii=False, indent=2)
+            json.dump(all_news, f, ensure_ascii=False, indent=2, default=json_default)
         
         print("\n" + "=" * 60)
         print(f"✅ TOTAL: {len(all_news)} noticias recopiladas")
@@ -157,6 +167,8 @@ def collect_news():
 
 def select_news():
     """Selecciona las mejores noticias usando el agente inteligente."""
+    from agent import NewsAgent
+    
     print("\n🤖 Seleccionando mejores noticias...")
     
     # Cargar noticias recopiladas
@@ -166,7 +178,7 @@ def select_news():
         return []
     
     with open(news_file, 'r', encoding='utf-8') as f:
-        all_news = json.load(f)
+        all_news = to_news_items(json.load(f))
     
     # Usar agente para seleccionar (mostrar top 15 para review manual)
     agent = NewsAgent()
@@ -178,8 +190,23 @@ def select_news():
     return selected
 
 
+def load_selector_model():
+    """Carga el modelo ML de selección (o crea uno nuevo si no hay guardado)."""
+    from ml.news_selector_model import NewsSelectorModel
+    
+    model = NewsSelectorModel()
+    if model.is_trained or model.online_learner is not None:
+        print("✅ Modelo ML cargado (se actualizará con tu feedback)\n")
+    else:
+        print("📊 Modelo ML nuevo (se entrenará con tu feedback)\n")
+    return model
+
+
 def review_news():
     """Revisa y califica manualmente las noticias seleccionadas para entrenar el modelo."""
+    # NumPy + modelo ML se cargan de fondo mientras se muestra la primera noticia
+    preload_modules('ml.news_selector_model')
+    
     print("\n" + "="*70)
     print("📝 REVISIÓN MANUAL DE NOTICIAS")
     print("="*70)
@@ -193,22 +220,14 @@ def review_news():
         return
     
     with open(selected_file, 'r', encoding='utf-8') as f:
-        news_list = json.load(f)
+        news_list = to_news_items(json.load(f))
     
     if not news_list:
         print("⚠️  No hay noticias para revisar.")
         return
     
-    # Cargar modelo ML
-    from ml.news_selector_model import NewsSelectorModel
-    model = NewsSelectorModel()
-    
-    # Intentar cargar modelo entrenado previo
-    try:
-        model.load_model()
-        print("✅ Modelo ML cargado (se actualizará con tu feedback)\n")
-    except:
-        print("📊 Modelo ML nuevo (se entrenará con tu feedback)\n")
+    # El modelo ML se obtiene al recibir la primera respuesta
+    model = None
     
     approved_news = []
     feedback_data = []
@@ -237,11 +256,15 @@ def review_news():
             if choice in ['s', 'n']:
                 label = 1 if choice == 's' else 0
                 
-                # Guardar feedback
+                if model is None:
+                    model = load_selector_model()
+                
+                # Guardar feedback (el modelo online aprende al instante)
                 feedback_data.append({
                     'news': news,
                     'label': label
                 })
+                model.add_feedback(news, label)
                 
                 if choice == 's':
                     approved_news.append(news)
@@ -256,15 +279,12 @@ def review_news():
         if choice == 'x':
             break
     
-    # Entrenar modelo con el feedback
+    # Guardar el modelo actualizado con el feedback
     if feedback_data:
         print("\n" + "="*70)
-        print("🧠 ENTRENANDO MODELO ML CON TU FEEDBACK")
+        print("🧠 MODELO ML ACTUALIZADO CON TU FEEDBACK")
         print("="*70)
         
-        for item in feedback_data:
-            model.add_feedback(item['news'], item['label'])
-        
         # Guardar modelo actualizado
         model.save_model()
         
@@ -276,7 +296,7 @@ def review_news():
     if approved_news:
         output_file = Path("data/approved_news.json")
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(approved_news, f, ensure_ascii=False, indent=2)
+            json.dump(approved_news, f, ensure_ascii=False, indent=2, default=json_default)
         
         print(f"\n💾 {len(approved_news)} noticias aprobadas guardadas en: data/approved_news.json")
         print("   Ejecuta 'python src/main.py generate' para crear tweets")
@@ -286,6 +306,9 @@ def review_news():
 
 def generate_tweets():
     """Genera tweets con IA a partir de las noticias seleccionadas."""
+    from generators.ai_tweet_generator import AITweetGenerator
+    from generators.tweet_generator import TweetGenerator
+    
     print("\n📝 Generando tweets con IA...")
     
     # Prioridad: aprobadas manualmente > seleccionadas > todas
@@ -347,7 +370,7 @@ def validate_news_with_llm():
         return
     
     with open(news_file, 'r', encoding='utf-8') as f:
-        all_news = json.load(f)
+        all_news = to_news_items(json.load(f))
     
     print(f"📰 Cargadas {len(all_news)} noticias")
     
@@ -367,7 +390,7 @@ def validate_news_with_llm():
     if validated_news:
         output_file = Path("data/validated_news.json")
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(validated_news, f, ensure_ascii=False, indent=2)
+            json.dump(validated_news, f, ensure_ascii=False, indent=2, default=json_default)
         
         print(f"\n✅ {len(validated_news)} noticias validadas")
         print(f"💾 Guardadas en: {output_file}")
@@ -1,5 +1,18 @@
 """Machine Learning components for news selection and processing."""
 
-from .news_selector_model import NewsSelectorModel
+from importlib import import_module
 
-__all__ = ['NewsSelectorModel']
+# Import perezoso: importar un submódulo (p.ej. `from ml.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'NewsSelectorModel': 'news_selector_model',
+    'OnlineLogisticRegression': 'online_learner'
+}
+
+__all__ = ['NewsSelectorModel', 'OnlineLogisticRegression']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,142 @@
+"""
+Model Artifact - Formato versionado para guardar modelos
+
+En lugar de un pickle (lento de cargar, inseguro: ejecuta código al
+deserializar, y no se puede mapear en memoria) el modelo se guarda en un
+directorio con:
+- manifest.json: versión del esquema, nombres de features y todos los
+  valores escalares
+- un archivo .npy por cada array grande de NumPy, que se abre con mmap
+  (sin copiar ni parsear: solo se leen las páginas que se usan)
+
+En el manifest cada array grande se reemplaza por {"__npy__": "archivo.npy"}.
+Los arrays pequeños (p.ej. un peso por feature) van dentro del propio
+manifest: abrir y mapear un archivo por array cuesta más que leerlos.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+MANIFEST_NAME = 'manifest.json'
+ARTIFACT_FORMAT = 'news-selector-model'
+
+# Arrays de hasta este número de elementos se guardan en el manifest
+INLINE_ARRAY_SIZE = 1024
+
+
+class ArtifactSchemaError(ValueError):
+    """El artefacto no corresponde al formato o versión esperados."""
+
+
+def _dump_value(value: Any, directory: Path, name: str) -> Any:
+    """Convierte un valor a JSON, escribiendo los arrays como .npy."""
+    if isinstance(value, np.ndarray) and value.size <= INLINE_ARRAY_SIZE:
+        return {
+            '__array__': value.tolist(),
+            'dtype': value.dtype.str,
+            'shape': list(value.shape)
+        }
+    if isinstance(value, np.ndarray):
+        file_name = f"{name}.npy"
+        tmp_path = directory / f".{file_name}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.ascontiguousarray(value), allow_pickle=False)
+        os.replace(tmp_path, directory / file_name)
+        return {'__npy__': file_name}
+    if isinstance(value, dict):
+        return {
+            key: _dump_value(item, directory, f"{name}.{key}")
+            for key, item in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [_dump_value(item, directory, f"{name}.{i}") for i, item in enumerate(value)]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _load_value(value: Any, directory: Path, mmap: bool) -> Any:
+    """Inverso de `_dump_value`: reconstruye los arrays y abre los .npy."""
+    if isinstance(value, dict):
+        if '__array__' in value:
+            return np.array(value['__array__'], dtype=np.dtype(value['dtype'])).reshape(value['shape'])
+        if set(value) == {'__npy__'}:
+            file_name = value['__npy__']
+            if Path(file_name).name != file_name:
+                raise ArtifactSchemaError(f"Nombre de array inválido: {file_name}")
+            return np.load(
+                directory / file_name,
+                mmap_mode='r' if mmap else None,
+                allow_pickle=False
+            )
+        return {key: _load_value(item, directory, mmap) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_load_value(item, directory, mmap) for item in value]
+    return value
+
+
+def save_artifact(directory: str, schema_version: int, payload: Dict[str, Any]):
+    """
+    Guarda un modelo como directorio con manifest.json + arrays .npy.
+
+    El manifest se escribe al final, así un lector nunca ve un manifest
+    que apunte a arrays a medio escribir.
+
+    Args:
+        directory: Directorio del artefacto (se crea si no existe)
+        schema_version: Versión del esquema del payload
+        payload: Dict con valores JSON y arrays de NumPy
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    manifest = {
+        'format': ARTIFACT_FORMAT,
+        'schema_version': schema_version,
+        'payload': _dump_value(payload, directory, 'payload')
+    }
+
+    tmp_path = directory / f".{MANIFEST_NAME}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, directory / MANIFEST_NAME)
+
+
+def load_artifact(
+    directory: str,
+    schema_version: int,
+    mmap: bool = True
+) -> Optional[Dict[str, Any]]:
+    """
+    Carga un modelo guardado con `save_artifact`.
+
+    Args:
+        directory: Directorio del artefacto
+        schema_version: Versión del esquema esperada
+        mmap: Abrir los arrays con mmap (solo lectura)
+
+    Returns:
+        Payload o None si el artefacto no existe
+
+    Raises:
+        ArtifactSchemaError: Si el formato o la versión no coinciden
+    """
+    manifest_path = Path(directory) / MANIFEST_NAME
+    if not manifest_path.exists():
+        return None
+
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    if manifest.get('format') != ARTIFACT_FORMAT:
+        raise ArtifactSchemaError(f"Formato desconocido: {manifest.get('format')}")
+    if manifest.get('schema_version') != schema_version:
+        raise ArtifactSchemaError(
+            f"Versión de esquema {manifest.get('schema_version')}, se esperaba {schema_version}"
+        )
+
+    return _load_value(manifest.get('payload', {}), manifest_path.parent, mmap)
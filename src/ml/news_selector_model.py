@@ -7,29 +7,88 @@ basándose en features del contenido y feedback histórico.
 
 import json
 import pickle
+import sys
+import time
 from pathlib import Path
 from typing import List, Dict, Tuple
 from datetime import datetime
 import numpy as np
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ml.model_artifact import ArtifactSchemaError, load_artifact, save_artifact
+from ml.online_learner import OnlineLogisticRegression
+
+# Versión del formato guardado: subirla si cambian los features o el payload
+MODEL_SCHEMA_VERSION = 1
+
+# Keywords tech relevantes
+TECH_KEYWORDS = ('ai', 'ml', 'python', 'javascript', 'api', 'data', 'cloud',
+                 'security', 'crypto', 'blockchain', 'startup', 'tech')
+
+# Nombres de los features en el orden de las columnas (alfabético)
+FEATURE_NAMES = (
+    'avg_comment_score',
+    'content_length',
+    'engagement_score',
+    'has_full_content',
+    'has_quality_comments',
+    'is_arstechnica',
+    'is_devto',
+    'is_hackernews',
+    'is_reddit',
+    'num_comments',
+    'num_keywords',
+    'num_quality_comments',
+    'reactions',
+    'score',
+    'tech_keyword_count',
+    'title_length',
+    'title_word_count',
+)
+FEATURE_INDEX = {name: index for index, name in enumerate(FEATURE_NAMES)}
+
+# Labels de cada clase que necesita el modelo online antes de influir en el
+# score, y labels por clase a partir de los cuales decide él solo
+MIN_ONLINE_LABELS_PER_CLASS = 10
+FULL_ONLINE_LABELS_PER_CLASS = 50
+
 
 class NewsSelectorModel:
     """Modelo ML para seleccionar noticias relevantes."""
     
-    def __init__(self, model_path: str = "models/news_selector.pkl"):
+    def __init__(
+        self,
+        model_path: str = "models/news_selector",
+        online: bool = True,
+        feedback_path: str = "data/feedback.jsonl"
+    ):
         """
         Inicializa el modelo de selección.
         
         Args:
-            model_path: Ruta donde guardar/cargar el modelo
+            model_path: Directorio donde guardar/cargar el modelo (un
+                `.pkl` antiguo en la misma ruta se migra al cargarlo)
+            online: Aprender de cada feedback de forma incremental
+                (regresión logística online) en lugar de esperar a reentrenar
+            feedback_path: Archivo JSONL donde se acumula el feedback
         """
         self.model_path = Path(model_path)
+        if self.model_path.suffix == '.pkl':
+            self.model_path = self.model_path.with_suffix('')
+        self.legacy_model_path = self.model_path.with_suffix('.pkl')
+        self.feedback_path = Path(feedback_path)
         self.model = None
         self.feature_names = []
         self.is_trained = False
+        self.online = online
+        self.online_learner = None
+        # Byte de feedback_path hasta el que el modelo online ya aprendió
+        self.feedback_offset = 0
         
         # Cargar modelo si existe
-        if self.model_path.exists():
+        if self.model_path.exists() or self.legacy_model_path.exists():
             self.load_model()
     
     def extract_features(self, news_item: Dict) -> Dict[str, float]:
@@ -42,56 +101,97 @@ class NewsSelectorModel:
         Returns:
             Dict con features extraídos
         """
-        features = {}
+        return dict(zip(FEATURE_NAMES, self._feature_row(news_item)))
+    
+    @staticmethod
+    def _feature_row(news_item: Dict) -> tuple:
+        """
+        Calcula los features de una noticia en el orden de FEATURE_NAMES.
+        
+        Args:
+            news_item: Noticia a procesar
+            
+        Returns:
+            Tupla de valores (una fila de la matriz de features)
+        """
+        get = news_item.get
         
         # 1. Features de engagement
-        features['score'] = float(news_item.get('score', 0))
-        features['num_comments'] = float(news_item.get('num_comments', 0))
-        features['reactions'] = float(news_item.get('reactions', 0))
-        features['engagement_score'] = float(news_item.get('engagement_score', 0))
+        score = float(get('score', 0))
+        num_comments = float(get('num_comments', 0))
+        reactions = float(get('reactions', 0))
+        engagement_score = float(get('engagement_score', 0))
         
         # 2. Features de contenido
-        title = news_item.get('title', '')
-        features['title_length'] = float(len(title))
-        features['title_word_count'] = float(len(title.split()))
-        
-        content = news_item.get('full_content', news_item.get('summary', ''))
-        features['content_length'] = float(len(content))
-        features['has_full_content'] = 1.0 if news_item.get('full_content') else 0.0
-        
-        # 3. Features de keywords
-        keywords = news_item.get('extracted_keywords', [])
-        features['num_keywords'] = float(len(keywords))
-        
-        # Keywords tech relevantes
-        tech_keywords = ['ai', 'ml', 'python', 'javascript', 'api', 'data', 'cloud', 
-                        'security', 'crypto', 'blockchain', 'startup', 'tech']
-        features['tech_keyword_count'] = sum(
-            1 for kw in keywords if any(tech in kw.lower() for tech in tech_keywords)
+        title = get('title', '')
+        content = get('full_content', get('summary', ''))
+        has_full_content = 1.0 if get('full_content') else 0.0
+        
+        # 3. Features de keywords (tech relevantes)
+        keywords = get('extracted_keywords', [])
+        tech_keyword_count = sum(
+            1 for kw in keywords if any(tech in kw.lower() for tech in TECH_KEYWORDS)
         )
         
         # 4. Features de fuente
-        source = news_item.get('source', '').lower()
-        features['is_hackernews'] = 1.0 if 'hacker' in source else 0.0
-        features['is_reddit'] = 1.0 if 'reddit' in source else 0.0
-        features['is_arstechnica'] = 1.0 if 'ars technica' in source else 0.0
-        features['is_devto'] = 1.0 if 'dev.to' in source else 0.0
+        source = get('source', '').lower()
         
         # 5. Features de comentarios
-        top_comments = news_item.get('top_comments', [])
-        features['has_quality_comments'] = 1.0 if len(top_comments) > 0 else 0.0
-        features['num_quality_comments'] = float(len(top_comments))
-        
+        top_comments = get('top_comments', [])
         if top_comments:
-            avg_comment_score = np.mean([c.get('score', 0) for c in top_comments])
-            features['avg_comment_score'] = float(avg_comment_score)
+            avg_comment_score = float(np.mean([c.get('score', 0) for c in top_comments]))
         else:
-            features['avg_comment_score'] = 0.0
+            avg_comment_score = 0.0
         
         # 6. Features de tiempo (si está disponible)
         # TODO: Agregar features temporales cuando tengamos historial
         
-        return features
+        # Mismo orden que FEATURE_NAMES (alfabético)
+        return (
+            avg_comment_score,                          # avg_comment_score
+            float(len(content)),                        # content_length
+            engagement_score,                           # engagement_score
+            has_full_content,                           # has_full_content
+            1.0 if top_comments else 0.0,               # has_quality_comments
+            1.0 if 'ars technica' in source else 0.0,   # is_arstechnica
+            1.0 if 'dev.to' in source else 0.0,         # is_devto
+            1.0 if 'hacker' in source else 0.0,         # is_hackernews
+            1.0 if 'reddit' in source else 0.0,         # is_reddit
+            num_comments,                               # num_comments
+            float(len(keywords)),                       # num_keywords
+            float(len(top_comments)),                   # num_quality_comments
+            reactions,                                  # reactions
+            score,                                      # score
+            tech_keyword_count,                         # tech_keyword_count
+            float(len(title)),                          # title_length
+            float(len(title.split())),                  # title_word_count
+        )
+    
+    def extract_feature_matrix(self, news_items: List[Dict]) -> np.ndarray:
+        """
+        Extrae los features de todas las noticias en una sola matriz.
+        
+        Args:
+            news_items: Noticias a procesar
+            
+        Returns:
+            Matriz (n_noticias x n_features) con columnas en el orden de
+            `self.feature_names` (o FEATURE_NAMES si el modelo no está entrenado)
+        """
+        X = self._raw_feature_matrix(news_items)
+        
+        # Modelo guardado con otro orden de columnas
+        if self.feature_names and tuple(self.feature_names) != FEATURE_NAMES:
+            X = X[:, [FEATURE_INDEX[name] for name in self.feature_names]]
+        return X
+    
+    def _raw_feature_matrix(self, news_items: List[Dict]) -> np.ndarray:
+        """Matriz de features con columnas en el orden de FEATURE_NAMES."""
+        feature_row = self._feature_row
+        return np.array(
+            [feature_row(item) for item in news_items],
+            dtype=np.float64
+        ).reshape(len(news_items), len(FEATURE_NAMES))
     
     def prepare_training_data(self, labeled_news: List[Dict]) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -103,25 +203,18 @@ class NewsSelectorModel:
         Returns:
             Tuple (X, y) para entrenamiento
         """
-        X = []
-        y = []
+        # Guardar nombres de features (primera vez)
+        if not self.feature_names:
+            self.feature_names = list(FEATURE_NAMES)
         
-        for item in labeled_news:
-            features = self.extract_features(item)
-            
-            # Guardar nombres de features (primera vez)
-            if not self.feature_names:
-                self.feature_names = sorted(features.keys())
-            
-            # Crear vector de features en orden consistente
-            feature_vector = [features[name] for name in self.feature_names]
-            X.append(feature_vector)
-            
-            # Label (debe estar en el item)
-            label = item.get('label', item.get('is_relevant', 0))
-            y.append(float(label))
+        X = self.extract_feature_matrix(labeled_news)
+        
+        # Label (debe estar en el item)
+        y = np.array(
+            [float(item.get('label', item.get('is_relevant', 0))) for item in labeled_news]
+        )
         
-        return np.array(X), np.array(y)
+        return X, y
     
     def train(self, labeled_news: List[Dict]):
         """
@@ -170,8 +263,11 @@ class NewsSelectorModel:
             news_item: Noticia a evaluar
             
         Returns:
-            Score de relevancia (0-100)
+            Score de relevancia (ver `predict_scores` para la escala)
         """
+        if self._online_weight() > 0:
+            return float(self.predict_scores([news_item])[0])
+        
         if not self.is_trained or self.model is None:
             # Fallback: usar engagement score
             return news_item.get('engagement_score', 
@@ -193,6 +289,160 @@ class NewsSelectorModel:
         
         return float(score)
     
+    def predict_scores(self, news_items: List[Dict]) -> np.ndarray:
+        """
+        Predice el score de relevancia de muchas noticias a la vez.
+        
+        Equivale a llamar a `predict_score` con cada una, pero extrae
+        la matriz de features completa y la puntúa con una sola
+        operación matricial.
+        
+        Escala del score:
+        - Sin modelo online listo: el del modelo entrenado (similitud con
+          los ejemplos positivos, 0-100) o, sin entrenar, el engagement
+        - Con al menos MIN_ONLINE_LABELS_PER_CLASS labels de cada clase se
+          mezcla con 100 * P(relevante) del modelo online, con un peso que
+          crece hasta 1 al llegar a FULL_ONLINE_LABELS_PER_CLASS. A partir
+          de ahí el score es 100 * P(relevante): min_score=10 en
+          `select_top_news` equivale a exigir una probabilidad >= 0.1
+        
+        Args:
+            news_items: Noticias a evaluar
+            
+        Returns:
+            Array con un score por noticia
+        """
+        weight = self._online_weight()
+        if weight == 0:
+            return self._base_scores(news_items)
+        
+        # Probabilidad de relevancia escalada a 0-100
+        X = self._raw_feature_matrix(news_items)
+        online_scores = 100.0 * self.online_learner.predict_proba(X)
+        if weight == 1:
+            return online_scores
+        base_scores = np.clip(self._base_scores(news_items), 0, 100)
+        return (1 - weight) * base_scores + weight * online_scores
+    
+    def _base_scores(self, news_items: List[Dict]) -> np.ndarray:
+        """Scores del modelo entrenado (o del engagement si no hay modelo)."""
+        if not self.is_trained or self.model is None:
+            # Fallback: usar engagement score
+            return np.array([
+                item.get('engagement_score', item.get('score', 0) / 10)
+                for item in news_items
+            ], dtype=np.float64)
+        
+        if self.model['type'] != 'weighted_average':
+            return np.zeros(len(news_items))
+        
+        X = self.extract_feature_matrix(news_items)
+        weights = self.model['weights']
+        scores = X @ weights / (np.linalg.norm(weights) + 1e-10)
+        return np.clip(scores, 0, 100)
+    
+    def _online_weight(self) -> float:
+        """
+        Peso del modelo online en el score (0-1).
+        
+        Es 0 hasta que vio MIN_ONLINE_LABELS_PER_CLASS labels de cada clase
+        (con un par de labels la probabilidad es casi aleatoria) y crece
+        linealmente hasta 1 en FULL_ONLINE_LABELS_PER_CLASS.
+        """
+        if not self.online or self.online_learner is None:
+            return 0.0
+        labels = int(self.online_learner.class_counts.min())
+        if labels < MIN_ONLINE_LABELS_PER_CLASS:
+            return 0.0
+        if not self.is_trained or self.model is None:
+            # Sin modelo entrenado la alternativa es el engagement (otra escala)
+            return 1.0
+        return min(1.0, labels / FULL_ONLINE_LABELS_PER_CLASS)
+    
+    @staticmethod
+    def _feedback_row(feedback: Dict) -> List[float]:
+        """Fila de features (orden de FEATURE_NAMES) de una línea de feedback."""
+        features = feedback['features']
+        return [float(features.get(name, 0.0)) for name in FEATURE_NAMES]
+    
+    def _feedback_size(self) -> int:
+        """Tamaño en bytes del archivo de feedback (0 si no existe)."""
+        try:
+            return self.feedback_path.stat().st_size
+        except FileNotFoundError:
+            return 0
+    
+    def _load_feedback_history(self, offset: int = 0) -> Tuple[np.ndarray, np.ndarray, int]:
+        """
+        Features y labels del feedback guardado a partir de un byte.
+        
+        Solo se leen líneas completas: una a medio escribir se deja para
+        la próxima vez.
+        
+        Args:
+            offset: Byte desde el que leer (lo anterior ya se aprendió)
+            
+        Returns:
+            Tuple (X, y, byte siguiente a la última línea leída)
+        """
+        rows, labels = [], []
+        if self.feedback_path.exists():
+            with open(self.feedback_path, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        break
+                    offset += len(line)
+                    try:
+                        feedback = json.loads(line)
+                        rows.append(self._feedback_row(feedback))
+                        labels.append(float(feedback['is_relevant']))
+                    except (ValueError, KeyError, TypeError, AttributeError):
+                        continue
+        X = np.array(rows, dtype=np.float64).reshape(len(rows), len(FEATURE_NAMES))
+        return X, np.array(labels), offset
+    
+    def _replay_feedback(self) -> int:
+        """
+        Aprende el feedback guardado que el modelo online aún no vio.
+        
+        Cubre el feedback añadido después del último `save_model()` (p.ej.
+        si la revisión se cortó con Ctrl+C). Se lee desde `feedback_offset`,
+        así el coste depende solo de lo nuevo. Si el archivo es más corto
+        que el offset (se vació o se reemplazó) se lee desde el principio.
+        
+        Returns:
+            Número de ejemplos aprendidos
+        """
+        if self.online_learner is None:
+            self.online_learner = OnlineLogisticRegression(len(FEATURE_NAMES))
+            self.feedback_offset = 0
+        if self._feedback_size() < self.feedback_offset:
+            self.feedback_offset = 0
+        
+        X, y, self.feedback_offset = self._load_feedback_history(self.feedback_offset)
+        if len(y):
+            self.online_learner.partial_fit(X, y)
+        return len(y)
+    
+    def partial_fit(self, news_items: List[Dict], labels: List[float]):
+        """
+        Actualiza el modelo online con nuevas noticias etiquetadas.
+        
+        La primera vez el modelo se inicializa repasando el feedback ya
+        guardado en `feedback_path`; después cada llamada solo procesa
+        los ejemplos nuevos.
+        
+        Args:
+            news_items: Noticias etiquetadas
+            labels: Label de cada noticia (1 relevante, 0 no relevante)
+        """
+        if self.online_learner is None:
+            self._replay_feedback()
+        
+        X = self._raw_feature_matrix(news_items)
+        self.online_learner.partial_fit(X, np.array(labels, dtype=np.float64))
+    
     def select_top_news(
         self,
         news_items: List[Dict],
@@ -205,29 +455,26 @@ class NewsSelectorModel:
         Args:
             news_items: Lista de noticias
             top_n: Número de noticias a seleccionar
-            min_score: Score mínimo requerido
+            min_score: Score mínimo requerido (en la escala de `predict_scores`)
             
         Returns:
             Lista de mejores noticias con scores
         """
         print(f"\n🤖 Seleccionando mejores {top_n} noticias con ML...")
         
-        # Calcular scores
-        scored_news = []
-        for item in news_items:
-            score = self.predict_score(item)
-            item_copy = item.copy()
-            item_copy['ml_relevance_score'] = score
-            scored_news.append(item_copy)
-        
-        # Filtrar por score mínimo
-        filtered = [item for item in scored_news if item['ml_relevance_score'] >= min_score]
+        # Calcular scores (todas las noticias en una sola pasada)
+        scores = self.predict_scores(news_items)
         
-        # Ordenar por score
-        sorted_news = sorted(filtered, key=lambda x: x['ml_relevance_score'], reverse=True)
+        # Filtrar por score mínimo y ordenar (estable: empates en orden original)
+        candidates = np.flatnonzero(scores >= min_score)
+        order = candidates[np.argsort(-scores[candidates], kind='stable')]
         
-        # Seleccionar top N
-        selected = sorted_news[:top_n]
+        # Seleccionar top N (solo se copian las elegidas)
+        selected = []
+        for index in order[:top_n]:
+            item_copy = news_items[index].copy()
+            item_copy['ml_relevance_score'] = float(scores[index])
+            selected.append(item_copy)
         
         print(f"   ✅ {len(selected)} noticias seleccionadas")
         if selected:
@@ -236,54 +483,121 @@ class NewsSelectorModel:
         return selected
     
     def save_model(self):
-        """Guarda el modelo en disco."""
-        if self.model is None:
+        """Guarda el modelo en disco (manifest.json + arrays .npy)."""
+        if self.model is None and self.online_learner is None:
             return
         
-        self.model_path.parent.mkdir(exist_ok=True)
+        online_state = None
+        if self.online_learner is not None:
+            online_state = dict(
+                self.online_learner.get_state(),
+                feature_names=list(FEATURE_NAMES),
+                feedback_offset=self.feedback_offset
+            )
         
         model_data = {
             'model': self.model,
-            'feature_names': self.feature_names,
+            'feature_names': list(self.feature_names),
             'is_trained': self.is_trained,
+            'online_learner': online_state,
             'trained_at': datetime.now().isoformat()
         }
         
-        with open(self.model_path, 'wb') as f:
-            pickle.dump(model_data, f)
+        save_artifact(self.model_path, MODEL_SCHEMA_VERSION, model_data)
         
         print(f"💾 Modelo guardado en: {self.model_path}")
     
+    @staticmethod
+    def _check_schema(model_data: Dict):
+        """
+        Verifica que un modelo guardado sea compatible con los features actuales.
+        
+        Raises:
+            ArtifactSchemaError: Si hay features desconocidos o tamaños distintos
+        """
+        feature_names = model_data.get('feature_names') or []
+        unknown = [name for name in feature_names if name not in FEATURE_INDEX]
+        if unknown:
+            raise ArtifactSchemaError(f"Features desconocidos: {unknown}")
+        
+        model = model_data.get('model')
+        if model and model.get('type') == 'weighted_average':
+            if len(model['weights']) != len(feature_names):
+                raise ArtifactSchemaError("Los pesos no coinciden con feature_names")
+        
+        online_state = model_data.get('online_learner')
+        if online_state:
+            online_names = online_state.get('feature_names', list(FEATURE_NAMES))
+            if list(online_names) != list(FEATURE_NAMES):
+                raise ArtifactSchemaError("El modelo online usa otros features")
+    
+    def _load_legacy_pickle(self) -> Dict:
+        """Carga un modelo del formato antiguo (pickle)."""
+        with open(self.legacy_model_path, 'rb') as f:
+            return pickle.load(f)
+    
     def load_model(self):
-        """Carga el modelo desde disco."""
-        if not self.model_path.exists():
-            return
+        """
+        Carga el modelo desde disco.
         
+        Los arrays se abren con mmap. Si solo existe el pickle del formato
+        antiguo se carga y se guarda en el formato nuevo.
+        """
         try:
-            with open(self.model_path, 'rb') as f:
-                model_data = pickle.load(f)
+            model_data = load_artifact(self.model_path, MODEL_SCHEMA_VERSION)
+            migrated = False
+            if model_data is None:
+                if not self.legacy_model_path.exists():
+                    return
+                model_data = self._load_legacy_pickle()
+                migrated = True
+            
+            self._check_schema(model_data)
             
             self.model = model_data['model']
-            self.feature_names = model_data['feature_names']
+            self.feature_names = list(model_data['feature_names'])
             self.is_trained = model_data['is_trained']
+            online_state = model_data.get('online_learner')
+            self.online_learner = OnlineLogisticRegression.from_state(online_state)
+            self.feedback_offset = 0
+            if online_state:
+                # Guardado sin offset: se asume que ya aprendió todo el archivo
+                self.feedback_offset = int(online_state.get('feedback_offset', self._feedback_size()))
+            
+            # Feedback guardado después del último save_model()
+            replayed = self._replay_feedback() if self.online and self.online_learner else 0
+            
+            if migrated:
+                print(f"🔄 Migrando modelo antiguo: {self.legacy_model_path}")
+                self.save_model()
             
             print(f"✅ Modelo cargado desde: {self.model_path}")
             print(f"   Entrenado en: {model_data.get('trained_at', 'unknown')}")
+            if replayed:
+                print(f"   Feedback pendiente aprendido: {replayed} ejemplos")
             
         except Exception as e:
             print(f"⚠️  Error cargando modelo: {e}")
             self.model = None
+            self.feature_names = []
             self.is_trained = False
+            self.online_learner = None
+            self.feedback_offset = 0
     
     def add_feedback(self, news_item: Dict, is_relevant: bool):
         """
         Agrega feedback sobre una noticia (para reentrenamiento).
         
+        En modo online además actualiza el modelo al instante con la línea
+        recién escrita (sin releer el archivo). El modelo guardado registra
+        hasta qué byte del archivo aprendió, así que si el proceso termina
+        antes de `save_model()` el resto se aprende al volver a cargarlo.
+        
         Args:
             news_item: Noticia
             is_relevant: Si fue relevante o no
         """
-        feedback_file = Path("data/feedback.jsonl")
+        feedback_file = self.feedback_path
         feedback_file.parent.mkdir(exist_ok=True)
         
         feedback = {
@@ -295,10 +609,30 @@ class NewsSelectorModel:
         }
         
         # Append to feedback file
-        with open(feedback_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(feedback, ensure_ascii=False) + '\n')
-        
-        print(f"✅ Feedback guardado")
+        with open(feedback_file, 'ab') as f:
+            line_start = f.tell()
+            f.write((json.dumps(feedback, ensure_ascii=False) + '\n').encode('utf-8'))
+            line_end = f.tell()
+        
+        update_ms = None
+        if self.online:
+            start = time.perf_counter()
+            if self.online_learner is not None and self.feedback_offset == line_start:
+                # Al día con el archivo: basta con aprender la línea nueva
+                self.online_learner.partial_fit(
+                    np.array([self._feedback_row(feedback)]),
+                    np.array([float(feedback['is_relevant'])])
+                )
+                self.feedback_offset = line_end
+            else:
+                # Primera vez o feedback que aún no aprendió (incluye esta línea)
+                self._replay_feedback()
+            update_ms = (time.perf_counter() - start) * 1000
+        
+        if update_ms is not None:
+            print(f"✅ Feedback guardado (modelo actualizado en {update_ms:.1f} ms)")
+        else:
+            print(f"✅ Feedback guardado")
 
 
 # Ejemplo de uso
@@ -0,0 +1,162 @@
+"""
+Online Learner - Regresión logística entrenada de forma incremental
+
+Reentrenar desde cero con todo el feedback acumulado se vuelve cada vez
+más lento. Este modelo aprende ejemplo a ejemplo (`partial_fit`) con
+descenso de gradiente estocástico, así cada etiqueta nueva de la revisión
+manual actualiza el modelo en microsegundos.
+
+Los features de noticias tienen escalas muy distintas (longitud del
+contenido vs. flags 0/1), así que se transforman con log1p y se
+estandarizan con media y varianza acumuladas en línea (Welford). El
+paso de cada peso se adapta con AdaGrad.
+
+Todo el estado son arrays de NumPy y números, para poder persistirlo.
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+
+
+class OnlineLogisticRegression:
+    """Clasificador logístico binario con aprendizaje incremental."""
+
+    def __init__(self, n_features: int, learning_rate: float = 0.1, l2: float = 1e-4):
+        """
+        Inicializa el modelo sin entrenar.
+
+        Args:
+            n_features: Número de features de entrada
+            learning_rate: Paso base del gradiente (AdaGrad lo reduce por peso)
+            l2: Regularización L2 de los pesos
+        """
+        self.n_features = n_features
+        self.learning_rate = learning_rate
+        self.l2 = l2
+
+        self.weights = np.zeros(n_features)
+        self.bias = 0.0
+        self.n_seen = 0
+        self.class_counts = np.zeros(2, dtype=np.int64)
+
+        # Estadísticas en línea de los features (tras log1p)
+        self.mean = np.zeros(n_features)
+        self.m2 = np.zeros(n_features)
+
+        # Gradientes acumulados al cuadrado (AdaGrad)
+        self.grad_sq = np.zeros(n_features)
+        self.bias_grad_sq = 0.0
+
+    @property
+    def is_ready(self) -> bool:
+        """True si ya vio ejemplos de las dos clases."""
+        return bool(self.class_counts.all())
+
+    def _transform(self, X: np.ndarray) -> np.ndarray:
+        """log1p + estandarización con las estadísticas acumuladas."""
+        X = np.log1p(np.maximum(X, 0))
+        std = np.sqrt(self.m2 / max(self.n_seen - 1, 1))
+        std[std == 0] = 1.0
+        return (X - self.mean) / std
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> 'OnlineLogisticRegression':
+        """
+        Actualiza el modelo con nuevos ejemplos, uno a uno.
+
+        Args:
+            X: Matriz (n_ejemplos x n_features)
+            y: Labels 0/1
+
+        Returns:
+            El propio modelo
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        y = np.asarray(y, dtype=np.float64).ravel()
+
+        for x, label in zip(X, y):
+            # Actualizar media/varianza antes de estandarizar el ejemplo
+            x_log = np.log1p(np.maximum(x, 0))
+            self.n_seen += 1
+            delta = x_log - self.mean
+            self.mean += delta / self.n_seen
+            self.m2 += delta * (x_log - self.mean)
+            self.class_counts[int(label > 0.5)] += 1
+
+            z = self._transform(x[np.newaxis, :])[0]
+            error = self._sigmoid(z @ self.weights + self.bias) - label
+
+            grad = error * z + self.l2 * self.weights
+            self.grad_sq += grad * grad
+            self.weights -= self.learning_rate * grad / (np.sqrt(self.grad_sq) + 1e-8)
+
+            self.bias_grad_sq += error * error
+            self.bias -= self.learning_rate * error / (np.sqrt(self.bias_grad_sq) + 1e-8)
+
+        return self
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """
+        Probabilidad de relevancia de cada ejemplo.
+
+        Args:
+            X: Matriz (n_ejemplos x n_features)
+
+        Returns:
+            Array de probabilidades (0-1)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=np.float64))
+        return self._sigmoid(self._transform(X) @ self.weights + self.bias)
+
+    @staticmethod
+    def _sigmoid(values):
+        return 1.0 / (1.0 + np.exp(-np.clip(values, -35, 35)))
+
+    def get_state(self) -> Dict:
+        """
+        Estado completo del modelo (para guardarlo).
+
+        Returns:
+            Dict de arrays y números
+        """
+        return {
+            'n_features': self.n_features,
+            'learning_rate': self.learning_rate,
+            'l2': self.l2,
+            'weights': self.weights,
+            'bias': self.bias,
+            'n_seen': self.n_seen,
+            'class_counts': self.class_counts,
+            'mean': self.mean,
+            'm2': self.m2,
+            'grad_sq': self.grad_sq,
+            'bias_grad_sq': self.bias_grad_sq
+        }
+
+    @classmethod
+    def from_state(cls, state: Optional[Dict]) -> Optional['OnlineLogisticRegression']:
+        """
+        Reconstruye un modelo desde `get_state()`.
+
+        Args:
+            state: Estado guardado (o None)
+
+        Returns:
+            Modelo o None si no hay estado
+        """
+        if not state:
+            return None
+        model = cls(
+            int(state['n_features']),
+            learning_rate=float(state['learning_rate']),
+            l2=float(state['l2'])
+        )
+        model.weights = np.array(state['weights'], dtype=np.float64)
+        model.bias = float(state['bias'])
+        model.n_seen = int(state['n_seen'])
+        model.class_counts = np.array(state['class_counts'], dtype=np.int64)
+        model.mean = np.array(state['mean'], dtype=np.float64)
+        model.m2 = np.array(state['m2'], dtype=np.float64)
+        model.grad_sq = np.array(state['grad_sq'], dtype=np.float64)
+        model.bias_grad_sq = float(state['bias_grad_sq'])
+        return model
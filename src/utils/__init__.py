@@ -1,7 +1,19 @@
 """Módulo de utilidades."""
 
-from .news_filter import NewsFilter
-from .news_scorer import NewsScorer
+from importlib import import_module
 
-__all__ = ['NewsFilter', 'NewsScorer']
+# Import perezoso: importar un submódulo (p.ej. `from utils.x import ...`)
+# no carga el resto del paquete ni sus dependencias
+_EXPORTS = {
+    'NewsFilter': 'news_filter',
+    'NewsItem': 'news_item',
+    'NewsScorer': 'news_scorer'
+}
 
+__all__ = ['NewsFilter', 'NewsItem', 'NewsScorer']
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{_EXPORTS[name]}", __name__), name)
@@ -0,0 +1,283 @@
+"""
+Bloom Filter - Pre-filtro probabilístico para deduplicación
+
+Un Bloom filter responde "seguro que NO lo vi" o "quizás lo vi".
+Las respuestas negativas (la mayoría: casi todo lo que llega es nuevo)
+se resuelven sin consultar el almacén exacto (SeenURLStore).
+
+- BloomFilter: filtro de capacidad fija guardado en un archivo mmap
+- ScalableBloomFilter: encadena filtros cada vez más grandes (y con
+  menor tasa de error) para mantener la tasa de falsos positivos
+  acotada aunque se añadan millones de claves
+
+Un Bloom filter no puede borrar claves. Como SeenURLStore olvida las
+claves tras su TTL, el dueño del filtro debe vaciarlo (`clear`) y volver
+a llenarlo con las claves vigentes periódicamente; si no, las claves
+expiradas se acumulan y cada vez más consultas acaban en el almacén.
+"""
+
+import hashlib
+import math
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, List
+
+
+class BloomFilter:
+    """Bloom filter de capacidad fija persistido como archivo mmap."""
+
+    MAGIC = b'BLM1'
+    # magic, num_bits, num_hashes, capacity, count, error_rate
+    HEADER_FORMAT = '<4sQIQQd'
+    HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+    def __init__(self, path: str, capacity: int = 100_000, error_rate: float = 0.001):
+        """
+        Abre (o crea) un Bloom filter en disco.
+
+        Args:
+            path: Archivo del filtro
+            capacity: Número de claves para el que se dimensiona
+            error_rate: Tasa de falsos positivos objetivo a plena capacidad
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.path.exists():
+            with open(self.path, 'rb') as f:
+                header = f.read(self.HEADER_SIZE)
+            magic, num_bits, num_hashes, capacity, count, error_rate = struct.unpack(
+                self.HEADER_FORMAT, header
+            )
+            if magic != self.MAGIC:
+                raise ValueError(f"Archivo de Bloom filter inválido: {self.path}")
+        else:
+            # Dimensionado óptimo: m = -n·ln(p) / ln(2)², k = m/n · ln(2)
+            num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+            num_bits = (num_bits + 7) // 8 * 8
+            num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+            count = 0
+            with open(self.path, 'wb') as f:
+                f.write(struct.pack(
+                    self.HEADER_FORMAT, self.MAGIC, num_bits, num_hashes,
+                    capacity, count, error_rate
+                ))
+                f.truncate(self.HEADER_SIZE + num_bits // 8)
+
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.capacity = capacity
+        self.count = count
+        self.error_rate = error_rate
+
+        self._file = open(self.path, 'r+b')
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+
+    def _positions(self, key: bytes):
+        """Posiciones de bits de una clave (double hashing sobre un digest de 16 bytes)."""
+        if len(key) != 16:
+            key = hashlib.md5(key).digest()
+        h1 = int.from_bytes(key[:8], 'little')
+        h2 = int.from_bytes(key[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: bytes) -> bool:
+        """
+        Añade una clave.
+
+        Args:
+            key: Clave (idealmente un digest de 16 bytes)
+
+        Returns:
+            True si la clave era nueva (algún bit cambió)
+        """
+        data = self._mmap
+        offset = self.HEADER_SIZE
+        changed = False
+        for pos in self._positions(key):
+            byte_index = offset + (pos >> 3)
+            mask = 1 << (pos & 7)
+            current = data[byte_index]
+            if not current & mask:
+                data[byte_index] = current | mask
+                changed = True
+        if changed:
+            self.count += 1
+        return changed
+
+    def might_contain(self, key: bytes) -> bool:
+        """
+        Verifica si una clave quizás fue añadida.
+
+        Args:
+            key: Clave
+
+        Returns:
+            False si seguro que no está; True si quizás está
+        """
+        data = self._mmap
+        offset = self.HEADER_SIZE
+        for pos in self._positions(key):
+            if not data[offset + (pos >> 3)] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def is_full(self) -> bool:
+        """True si se alcanzó la capacidad para la que fue dimensionado."""
+        return self.count >= self.capacity
+
+    def estimated_fpr(self) -> float:
+        """Tasa de falsos positivos estimada con el número actual de claves."""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+    def flush(self):
+        """Escribe el contador en la cabecera y sincroniza el archivo."""
+        struct.pack_into('<Q', self._mmap, 4 + 8 + 4 + 8, self.count)
+        self._mmap.flush()
+
+    def close(self):
+        """Sincroniza y cierra el archivo."""
+        if self._mmap.closed:
+            return
+        self.flush()
+        self._mmap.close()
+        self._file.close()
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter escalable: cuando un filtro se llena se añade otro
+    con `growth` veces más capacidad y `tightening` veces menos error.
+    """
+
+    def __init__(
+        self,
+        directory: str = "data/seen_bloom",
+        initial_capacity: int = 100_000,
+        error_rate: float = 0.001,
+        growth: int = 2,
+        tightening: float = 0.5
+    ):
+        """
+        Abre (o crea) el filtro escalable.
+
+        Args:
+            directory: Carpeta donde se guardan los filtros (uno por archivo)
+            initial_capacity: Capacidad del primer filtro
+            error_rate: Tasa de falsos positivos objetivo total
+            growth: Factor de crecimiento de capacidad entre filtros
+            tightening: Factor de reducción del error entre filtros
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+
+        # Estadísticas de uso
+        self.checks = 0
+        self.negatives = 0
+        self.false_positives = 0
+
+        self.filters: List[BloomFilter] = [
+            BloomFilter(str(path))
+            for path in sorted(self.directory.glob('slice_*.bloom'))
+        ]
+        if not self.filters:
+            self._add_filter()
+
+    @property
+    def is_new(self) -> bool:
+        """True si el filtro está vacío (p.ej. recién creado)."""
+        return all(f.count == 0 for f in self.filters)
+
+    def _add_filter(self):
+        """Añade un nuevo filtro a la cadena."""
+        index = len(self.filters)
+        capacity = self.initial_capacity * (self.growth ** index)
+        # La serie geométrica del error converge a error_rate total
+        error = self.error_rate * (1 - self.tightening) * (self.tightening ** index)
+        path = self.directory / f"slice_{index:03d}.bloom"
+        self.filters.append(BloomFilter(str(path), capacity=capacity, error_rate=error))
+
+    def add(self, key: bytes):
+        """
+        Añade una clave.
+
+        Args:
+            key: Clave (digest de 16 bytes)
+        """
+        if self.might_contain(key, count=False):
+            return
+        if self.filters[-1].is_full():
+            self._add_filter()
+        self.filters[-1].add(key)
+
+    def might_contain(self, key: bytes, count: bool = True) -> bool:
+        """
+        Verifica si una clave quizás fue añadida.
+
+        Args:
+            key: Clave
+            count: Si cuenta en las estadísticas
+
+        Returns:
+            False si seguro que no está; True si quizás está
+        """
+        found = any(f.might_contain(key) for f in self.filters)
+        if count:
+            self.checks += 1
+            if not found:
+                self.negatives += 1
+        return found
+
+    def clear(self):
+        """Vacía el filtro: borra todos los archivos y reinicia las estadísticas."""
+        self.close()
+        for path in self.directory.glob('slice_*.bloom'):
+            path.unlink()
+        self.filters = []
+        self.checks = 0
+        self.negatives = 0
+        self.false_positives = 0
+        self._add_filter()
+
+    def record_false_positive(self):
+        """Registra que un "quizás" resultó no estar en el almacén exacto."""
+        self.false_positives += 1
+
+    def estimated_fpr(self) -> float:
+        """Tasa de falsos positivos estimada de toda la cadena."""
+        prob_no_fp = 1.0
+        for f in self.filters:
+            prob_no_fp *= 1 - f.estimated_fpr()
+        return 1 - prob_no_fp
+
+    def stats(self) -> Dict:
+        """Devuelve estadísticas del filtro."""
+        # Falsos positivos sobre todas las claves que realmente no estaban
+        true_negatives = self.negatives + self.false_positives
+        return {
+            'filters': len(self.filters),
+            'keys': sum(f.count for f in self.filters),
+            'size_bytes': sum(f.num_bits // 8 for f in self.filters),
+            'checks': self.checks,
+            'negatives': self.negatives,
+            'false_positives': self.false_positives,
+            'observed_fpr': self.false_positives / true_negatives if true_negatives else 0.0,
+            'estimated_fpr': self.estimated_fpr(),
+            'target_fpr': self.error_rate
+        }
+
+    def flush(self):
+        """Sincroniza todos los filtros a disco."""
+        for f in self.filters:
+            f.flush()
+
+    def close(self):
+        """Sincroniza y cierra todos los filtros."""
+        for f in self.filters:
+            f.close()
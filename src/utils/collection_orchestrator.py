@@ -0,0 +1,212 @@
+"""
+Collection Orchestrator - Ejecuta todos los collectors en paralelo
+
+En lugar de llamar a cada fuente una detrás de otra (tiempo total = suma
+de latencias), el orquestador lanza todas las fuentes a la vez con:
+- Timeout por fuente
+- Deadline global para toda la recopilación
+- Resultados parciales: si una fuente falla o tarda demasiado,
+  el resto de noticias se devuelve igualmente
+
+Las tareas corren en threads daemon propios (no en un ThreadPoolExecutor,
+cuyos threads se esperan al salir del intérprete): un thread de Python no
+se puede matar, así que una fuente colgada sigue ejecutándose en segundo
+plano, pero ni `run()` ni el final del proceso la esperan.
+"""
+
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.news_item import NewsItem, to_news_items
+
+
+class CollectionOrchestrator:
+    """
+    Orquestador de recopilación concurrente.
+
+    Cada fuente se registra como una tarea (función sin argumentos que
+    devuelve una lista de noticias). Las tareas se ejecutan en threads
+    daemon y los resultados se combinan en el orden de registro,
+    así el resultado es determinista aunque la ejecución no lo sea.
+    """
+
+    def __init__(
+        self,
+        default_timeout: float = 60.0,
+        global_deadline: float = 120.0,
+        max_workers: Optional[int] = None
+    ):
+        """
+        Inicializa el orquestador.
+
+        Args:
+            default_timeout: Timeout por fuente en segundos
+            global_deadline: Tiempo máximo total de la recopilación en segundos
+            max_workers: Threads simultáneos (None = uno por tarea)
+        """
+        self.default_timeout = default_timeout
+        self.global_deadline = global_deadline
+        self.max_workers = max_workers
+        self.tasks: List[Dict] = []
+        self.stat_keys: List[str] = []
+        self.report: Dict[str, Dict] = {}
+
+    def add_task(
+        self,
+        name: str,
+        func: Callable[[], List[Dict]],
+        stat_key: str = None,
+        timeout: float = None
+    ):
+        """
+        Registra una fuente a recopilar.
+
+        Args:
+            name: Nombre de la tarea (para logs y reporte)
+            func: Función sin argumentos que devuelve la lista de noticias
+            stat_key: Clave en el dict de stats (varias tareas pueden sumar
+                en la misma clave, p.ej. las 3 pasadas de Hacker News)
+            timeout: Timeout específico de esta fuente en segundos
+        """
+        self.tasks.append({
+            'name': name,
+            'func': func,
+            'stat_key': stat_key or name,
+            'timeout': timeout if timeout is not None else self.default_timeout
+        })
+        self.add_stat(stat_key or name)
+
+    def add_stat(self, stat_key: str):
+        """
+        Registra una clave de stats (con 0 noticias si ninguna tarea suma en ella).
+
+        Sirve para fuentes desactivadas que deben seguir apareciendo en
+        el resumen en su posición.
+
+        Args:
+            stat_key: Clave en el dict de stats
+        """
+        if stat_key not in self.stat_keys:
+            self.stat_keys.append(stat_key)
+
+    def run(self) -> Tuple[List[NewsItem], Dict[str, int]]:
+        """
+        Ejecuta todas las tareas registradas en paralelo.
+
+        Vuelve como mucho tras `global_deadline` segundos; las tareas que
+        sigan en marcha se abandonan (ver la nota del módulo).
+
+        Las noticias de los collectors (dicts) se convierten aquí a
+        NewsItem, el formato compacto que usa el resto del pipeline.
+
+        Returns:
+            Tuple (noticias combinadas, stats por fuente)
+        """
+        all_news = []
+        # Las claves de stats aparecen en orden de registro, igual que antes
+        stats: Dict[str, int] = {stat_key: 0 for stat_key in self.stat_keys}
+        self.report = {}
+
+        if not self.tasks:
+            return all_news, stats
+
+        futures = [(task, Future()) for task in self.tasks]
+        start = time.monotonic()
+        self._start_workers(futures, self.max_workers or len(self.tasks))
+
+        try:
+            for task, future in futures:
+                elapsed = time.monotonic() - start
+                # El timeout de cada fuente cuenta desde el inicio (todas
+                # arrancan a la vez) y nunca puede superar el deadline global
+                remaining = min(
+                    task['timeout'] - elapsed,
+                    self.global_deadline - elapsed
+                )
+
+                try:
+                    news, duration = future.result(timeout=max(remaining, 0))
+                    all_news.extend(news)
+                    stats[task['stat_key']] += len(news)
+                    self.report[task['name']] = {
+                        'status': 'ok',
+                        'items': len(news),
+                        'seconds': round(duration, 2)
+                    }
+                except FutureTimeoutError:
+                    # Solo cancela si aún no empezó; si no, se abandona
+                    future.cancel()
+                    print(f"  ⏰ {task['name']}: timeout, se descartan sus resultados")
+                    self.report[task['name']] = {
+                        'status': 'timeout',
+                        'items': 0,
+                        'seconds': round(time.monotonic() - start, 2)
+                    }
+                except Exception as e:
+                    print(f"  ⚠️  Error en {task['name']}: {str(e)}")
+                    self.report[task['name']] = {
+                        'status': 'error',
+                        'items': 0,
+                        'error': str(e)
+                    }
+        finally:
+            # Las tareas que no llegaron a empezar ya no se ejecutan
+            for _, future in futures:
+                future.cancel()
+
+        return all_news, stats
+
+    def _start_workers(self, futures: List[Tuple[Dict, Future]], workers: int):
+        """
+        Lanza `workers` threads daemon que ejecutan las tareas en orden.
+
+        Args:
+            futures: Pares (tarea, Future donde dejar su resultado)
+            workers: Número de threads
+        """
+        pending = queue.SimpleQueue()
+        for item in futures:
+            pending.put(item)
+
+        def worker():
+            while True:
+                try:
+                    task, future = pending.get_nowait()
+                except queue.Empty:
+                    return
+                # False si se canceló antes de empezar (p.ej. deadline)
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(self._run_task(task))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        for index in range(min(workers, len(futures))):
+            threading.Thread(target=worker, name=f"collector_{index}", daemon=True).start()
+
+    @staticmethod
+    def _run_task(task: Dict) -> Tuple[List[Dict], float]:
+        """Ejecuta una tarea y mide su duración."""
+        task_start = time.monotonic()
+        news = to_news_items(task['func']() or [])
+        return news, time.monotonic() - task_start
+
+    def print_report(self):
+        """Muestra el tiempo y estado de cada fuente de la última ejecución."""
+        print("\n⏱️  Tiempos por fuente:")
+        for name, info in self.report.items():
+            if info['status'] == 'ok':
+                print(f"   ✅ {name}: {info['items']} noticias en {info['seconds']}s")
+            elif info['status'] == 'timeout':
+                print(f"   ⏰ {name}: timeout")
+            else:
+                print(f"   ❌ {name}: {info.get('error', 'error')}")
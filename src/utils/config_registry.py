@@ -0,0 +1,173 @@
+"""
+Config Registry - Caché compartida de archivos de configuración YAML
+
+NewsScorer, QueryBuilder y RSSCollector abrían y parseaban su YAML cada
+vez que se construían (y el agente continuo los construye en cada
+iteración). El registro, uno por proceso:
+- Parsea cada archivo una sola vez
+- Cachea también su forma compilada (p.ej. el matcher de keywords)
+- Solo recarga si cambia el mtime/tamaño del archivo y además su hash,
+  así se puede editar la configuración en caliente sin reiniciar
+- Si una edición deja el YAML inválido se avisa y se sigue usando la
+  configuración anterior; se reintenta cuando el archivo vuelve a cambiar
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import yaml
+
+
+class _ConfigEntry:
+    """Estado cacheado de un archivo de configuración."""
+
+    __slots__ = ('mtime_ns', 'size', 'failed_stat', 'digest', 'config', 'version', 'compiled')
+
+    def __init__(self):
+        self.mtime_ns = None
+        self.size = None
+        # (mtime_ns, size) de la última versión con YAML inválido
+        self.failed_stat = None
+        self.digest = None
+        self.config = None
+        self.version = 0
+        self.compiled: Dict[str, Any] = {}
+
+
+class ConfigRegistry:
+    """Registro de configuraciones YAML con recarga por cambios en el archivo."""
+
+    def __init__(self):
+        """Inicializa el registro vacío."""
+        self._entries: Dict[Path, _ConfigEntry] = {}
+        self._lock = threading.RLock()
+        self.reloads = 0
+
+    def _refresh(self, path: Path) -> _ConfigEntry:
+        """Devuelve la entrada de un archivo, recargándolo si cambió (requiere el lock)."""
+        entry = self._entries.get(path)
+        if entry is None:
+            entry = self._entries[path] = _ConfigEntry()
+
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            if entry.digest is not None or entry.version == 0:
+                entry.mtime_ns = entry.size = entry.digest = entry.config = None
+                entry.compiled = {}
+                entry.version += 1
+            return entry
+
+        if stat.st_mtime_ns == entry.mtime_ns and stat.st_size == entry.size:
+            return entry
+        if (stat.st_mtime_ns, stat.st_size) == entry.failed_stat:
+            return entry
+
+        with open(path, 'rb') as f:
+            content = f.read()
+
+        # Tocado pero idéntico (p.ej. guardado sin cambios): no reparsear
+        digest = hashlib.sha256(content).hexdigest()
+        if digest == entry.digest:
+            entry.mtime_ns = stat.st_mtime_ns
+            entry.size = stat.st_size
+            entry.failed_stat = None
+            return entry
+
+        try:
+            config = yaml.safe_load(content) or {}
+        except yaml.YAMLError as e:
+            # Edición a medias o con errores: seguir con la configuración anterior
+            print(f"⚠️  YAML inválido en {path}, se mantiene la configuración anterior: {e}")
+            entry.failed_stat = (stat.st_mtime_ns, stat.st_size)
+            return entry
+
+        entry.mtime_ns = stat.st_mtime_ns
+        entry.size = stat.st_size
+        entry.failed_stat = None
+        entry.digest = digest
+        entry.config = config
+        entry.compiled = {}
+        entry.version += 1
+        self.reloads += 1
+        return entry
+
+    def load(self, config_path: str) -> Optional[Dict]:
+        """
+        Obtiene la configuración parseada de un archivo.
+
+        El dict devuelto se comparte entre todos los consumidores:
+        no debe modificarse.
+
+        Args:
+            config_path: Ruta del YAML
+
+        Returns:
+            Configuración o None si el archivo no existe
+        """
+        path = Path(config_path).resolve()
+        with self._lock:
+            return self._refresh(path).config
+
+    def version(self, config_path: str) -> int:
+        """
+        Número de versión del archivo (cambia en cada recarga).
+
+        Args:
+            config_path: Ruta del YAML
+
+        Returns:
+            Versión actual
+        """
+        path = Path(config_path).resolve()
+        with self._lock:
+            return self._refresh(path).version
+
+    def get_compiled(
+        self,
+        config_path: str,
+        name: str,
+        compile_config: Callable[[Dict], Any]
+    ) -> Any:
+        """
+        Obtiene una forma compilada de la configuración, cacheada por versión.
+
+        Args:
+            config_path: Ruta del YAML
+            name: Nombre de la forma compilada (p.ej. 'scoring_rules')
+            compile_config: Función que recibe la configuración y la compila
+                (no se llama si el archivo no existe)
+
+        Returns:
+            Resultado de `compile_config` o None si el archivo no existe
+        """
+        path = Path(config_path).resolve()
+        with self._lock:
+            entry = self._refresh(path)
+            if entry.config is None:
+                return None
+            if name not in entry.compiled:
+                entry.compiled[name] = compile_config(entry.config)
+            return entry.compiled[name]
+
+    def clear(self):
+        """Olvida todas las configuraciones cacheadas."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Instancia compartida por proceso
+_shared_registry: Optional[ConfigRegistry] = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Devuelve el registro de configuración compartido por todo el proceso."""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = ConfigRegistry()
+        return _shared_registry
@@ -5,19 +5,31 @@ Extrae el contenido completo del artículo, comentarios relevantes,
 y genera metadata adicional para mejorar la selección y generación de tweets.
 """
 
-import requests
+import sys
 from bs4 import BeautifulSoup
 from pathlib import Path
 from typing import Dict, List, Optional
 import time
 from datetime import datetime
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.hn_item_cache import get_hn_item_cache
+from utils.http_client import HTTPClient, get_http_client
+
 
 class ContentEnricher:
     """Enriquece noticias con contexto adicional."""
     
-    def __init__(self):
-        """Inicializa el enriquecedor de contenido."""
+    def __init__(self, http_client: HTTPClient = None):
+        """
+        Inicializa el enriquecedor de contenido.
+        
+        Args:
+            http_client: Cliente HTTP compartido (por defecto, el del proceso)
+        """
+        self.http = http_client or get_http_client()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
@@ -85,7 +97,7 @@ class ContentEnricher:
             return None
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.http.get(url, headers=self.headers, timeout=10)
             
             if response.status_code != 200:
                 return None
@@ -163,35 +175,31 @@ class ContentEnricher:
             Lista de comentarios
         """
         try:
-            url = f"https://hacker-news.firebaseio.com/v0/item/{item_id}.json"
-            response = requests.get(url, timeout=5)
+            # La historia y sus comentarios salen de la caché compartida
+            # (la historia normalmente ya la descargó HackerNewsCollector)
+            cache = get_hn_item_cache()
+            item = cache.get_or_fetch(item_id, self._download_hn_item)
             
-            if response.status_code != 200:
+            if not item:
                 return []
             
-            item = response.json()
             kids = item.get('kids', [])[:max_comments]
             
             comments = []
             for kid_id in kids:
                 try:
-                    comment_url = f"https://hacker-news.firebaseio.com/v0/item/{kid_id}.json"
-                    comment_response = requests.get(comment_url, timeout=5)
-                    
-                    if comment_response.status_code == 200:
-                        comment = comment_response.json()
-                        if comment.get('text'):
-                            # Limpiar HTML del texto
-                            soup = BeautifulSoup(comment['text'], 'html.parser')
-                            text = soup.get_text(strip=True)
-                            
-                            comments.append({
-                                'author': comment.get('by', 'anonymous'),
-                                'text': text[:500],  # Máximo 500 chars
-                                'score': comment.get('score', 0)
-                            })
+                    comment = cache.get_or_fetch(kid_id, self._download_hn_item)
                     
-                    time.sleep(0.1)  # Rate limiting
+                    if comment and comment.get('text'):
+                        # Limpiar HTML del texto
+                        soup = BeautifulSoup(comment['text'], 'html.parser')
+                        text = soup.get_text(strip=True)
+                        
+                        comments.append({
+                            'author': comment.get('by', 'anonymous'),
+                            'text': text[:500],  # Máximo 500 chars
+                            'score': comment.get('score', 0)
+                        })
                     
                 except:
                     continue
@@ -201,6 +209,25 @@ class ContentEnricher:
         except Exception as e:
             return []
     
+    def _download_hn_item(self, item_id: int) -> Optional[Dict]:
+        """
+        Descarga un item de Hacker News (solo se llama si no está en caché).
+        
+        Args:
+            item_id: ID del item en HN
+            
+        Returns:
+            Item o None
+        """
+        url = f"https://hacker-news.firebaseio.com/v0/item/{item_id}.json"
+        response = self.http.get(url, timeout=5)
+        time.sleep(0.1)  # Rate limiting (solo en descargas reales)
+        
+        if response.status_code != 200:
+            return None
+        
+        return response.json()
+    
     def _extract_reddit_comments(self, subreddit: str, post_id: str, max_comments: int = 5) -> List[Dict]:
         """
         Extrae comentarios top de Reddit.
@@ -217,7 +244,7 @@ class ContentEnricher:
             url = f"https://old.reddit.com/r/{subreddit}/comments/{post_id}/.json"
             headers = {'User-Agent': 'Mozilla/5.0'}
             
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             
             if response.status_code != 200:
                 return []
@@ -349,10 +376,11 @@ class ContentEnricher:
 # Ejemplo de uso
 if __name__ == "__main__":
     import json
+    from utils.news_item import json_default, to_news_items
     
     # Cargar noticias
     with open('data/selected_news.json', 'r', encoding='utf-8') as f:
-        news = json.load(f)
+        news = to_news_items(json.load(f))
     
     # Enriquecer
     enricher = ContentEnricher()
@@ -360,6 +388,6 @@ if __name__ == "__main__":
     
     # Guardar
     with open('data/enriched_news.json', 'w', encoding='utf-8') as f:
-        json.dump(enriched_news, f, ensure_ascii=False, indent=2)
+        json.dump(enriched_news, f, ensure_ascii=False, indent=2, default=json_default)
     
     print(f"\n💾 Guardado en: data/enriched_news.json")
@@ -0,0 +1,177 @@
+"""
+Date Normalizer - Fechas de publicación a epoch UTC
+
+Cada collector entrega la fecha en un formato distinto (epoch de HN,
+struct_time de RSS, ISO 8601 con y sin zona, RFC 822, "2 hours ago" de
+Serper...) y los filtros la volvían a parsear en cada etapa. Aquí se
+convierte UNA vez, al recopilar, a un entero epoch UTC (`published_ts`);
+los filtros de antigüedad pasan a ser comparaciones de enteros.
+
+Para no probar todos los formatos con cada fecha se recuerda qué parser
+funcionó para cada "forma" del texto (los dígitos se reemplazan por 0:
+'2025-01-31T10:00:00Z' -> '0000-00-00T00:00:00Z').
+"""
+
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Optional
+
+try:
+    from dateutil import parser as dateutil_parser
+except ImportError:
+    dateutil_parser = None
+
+_DIGITS_TO_ZERO = str.maketrans('123456789', '000000000')
+_FORMAT_CACHE_SIZE = 1024
+
+_RELATIVE_DATE = re.compile(
+    r'^(\d+)\s+(second|minute|min|hour|day|week|month|year)s?\s+ago$',
+    re.IGNORECASE
+)
+_RELATIVE_UNITS = {
+    'second': 1,
+    'minute': 60,
+    'min': 60,
+    'hour': 3600,
+    'day': 86400,
+    'week': 7 * 86400,
+    'month': 30 * 86400,
+    'year': 365 * 86400
+}
+
+
+def _parse_iso(value: str) -> datetime:
+    """ISO 8601 (APIs, GitHub, Dev.to, Guardian...)."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def _parse_rfc822(value: str) -> datetime:
+    """RFC 822 (pubDate de RSS)."""
+    return parsedate_to_datetime(value)
+
+
+def _parse_relative(value: str) -> datetime:
+    """Fechas relativas ("3 hours ago")."""
+    match = _RELATIVE_DATE.match(value)
+    if not match:
+        raise ValueError(value)
+    seconds = int(match.group(1)) * _RELATIVE_UNITS[match.group(2).lower()]
+    return datetime.now(timezone.utc) - timedelta(seconds=seconds)
+
+
+def _parse_month_day_year(value: str) -> datetime:
+    """Fechas tipo "Oct 15, 2025" (Serper)."""
+    return datetime.strptime(value, '%b %d, %Y')
+
+
+def _parse_dateutil(value: str) -> datetime:
+    """Último recurso: dateutil, si está instalado."""
+    if dateutil_parser is None:
+        raise ValueError(value)
+    return dateutil_parser.parse(value)
+
+
+_PARSERS = (_parse_iso, _parse_rfc822, _parse_relative, _parse_month_day_year, _parse_dateutil)
+
+# forma del texto -> parser que funcionó
+_format_cache: Dict[str, Callable[[str], datetime]] = {}
+_format_cache_lock = threading.Lock()
+
+
+def parse_datetime(value: str) -> Optional[datetime]:
+    """
+    Parsea una fecha en cualquiera de los formatos conocidos.
+
+    Args:
+        value: Texto de la fecha
+
+    Returns:
+        datetime (con o sin zona) o None si no se reconoce
+    """
+    value = value.strip()
+    if not value:
+        return None
+
+    shape = value.translate(_DIGITS_TO_ZERO)
+    cached_parser = _format_cache.get(shape)
+    if cached_parser is not None:
+        try:
+            return cached_parser(value)
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+    for parser in _PARSERS:
+        if parser is cached_parser:
+            continue
+        try:
+            parsed = parser(value)
+        except (ValueError, TypeError, OverflowError):
+            continue
+        if parsed is None:
+            continue
+        with _format_cache_lock:
+            if len(_format_cache) >= _FORMAT_CACHE_SIZE:
+                _format_cache.clear()
+            _format_cache[shape] = parser
+        return parsed
+
+    return None
+
+
+def to_epoch(value: Any) -> Optional[int]:
+    """
+    Convierte una fecha de publicación a epoch UTC en segundos.
+
+    Acepta epoch (int/float), datetime, time.struct_time (en UTC, como
+    `published_parsed` de feedparser) o texto. Los datetime sin zona
+    se interpretan como UTC.
+
+    Args:
+        value: Fecha en cualquiera de los formatos anteriores
+
+    Returns:
+        Epoch UTC entero o None si no hay fecha o no se reconoce
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value) if value > 0 else None
+    if isinstance(value, time.struct_time):
+        return int(datetime(*value[:6], tzinfo=timezone.utc).timestamp())
+    if isinstance(value, str):
+        value = parse_datetime(value)
+        if value is None:
+            return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp())
+    return None
+
+
+def ensure_published_ts(news_item: Dict) -> Optional[int]:
+    """
+    Devuelve `published_ts` de una noticia, calculándolo desde `published`
+    (y guardándolo) si falta, p.ej. en noticias cacheadas o antiguas.
+
+    Args:
+        news_item: Noticia
+
+    Returns:
+        Epoch UTC o None si la noticia no tiene fecha
+    """
+    if 'published_ts' in news_item:
+        return news_item['published_ts']
+    published_ts = to_epoch(news_item.get('published'))
+    news_item['published_ts'] = published_ts
+    return published_ts
+
+
+def now_epoch() -> int:
+    """Epoch UTC actual (para fuentes sin fecha, que se fechan al recopilar)."""
+    return int(time.time())
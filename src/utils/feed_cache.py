@@ -0,0 +1,135 @@
+"""
+Feed Cache - Caché de validadores HTTP para feeds RSS
+
+Guarda por cada feed su ETag, Last-Modified y un hash del contenido,
+junto con las noticias que produjo. En la siguiente ejecución:
+- El servidor responde 304 Not Modified -> no se descarga ni se parsea
+- El servidor responde 200 pero el contenido es idéntico -> no se parsea
+En ambos casos se reutilizan las noticias guardadas.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+class FeedValidatorCache:
+    """Caché persistente (JSON) de validadores y noticias por feed."""
+
+    def __init__(self, cache_path: str = "data/feed_cache.json"):
+        """
+        Inicializa la caché.
+
+        Args:
+            cache_path: Archivo JSON donde se persiste la caché
+        """
+        self.cache_path = Path(cache_path)
+        self._lock = threading.Lock()
+        self.entries: Dict[str, Dict] = self._load()
+
+    def _load(self) -> Dict[str, Dict]:
+        """Carga la caché desde disco."""
+        if not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (ValueError, OSError):
+            print(f"⚠️  Caché de feeds corrupta, se regenerará: {self.cache_path}")
+            return {}
+
+    @staticmethod
+    def content_hash(content: bytes) -> str:
+        """Hash del contenido descargado de un feed."""
+        return hashlib.sha256(content).hexdigest()
+
+    def get(self, url: str) -> Optional[Dict]:
+        """
+        Obtiene la entrada cacheada de un feed.
+
+        Args:
+            url: URL del feed
+
+        Returns:
+            Entrada o None
+        """
+        with self._lock:
+            return self.entries.get(url)
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Headers para un GET condicional.
+
+        Args:
+            url: URL del feed
+
+        Returns:
+            Dict con If-None-Match / If-Modified-Since si hay validadores
+        """
+        headers = {}
+        entry = self.get(url)
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        content_hash: str,
+        items: List[Dict],
+        items_since: str
+    ):
+        """
+        Guarda validadores y noticias tras descargar y parsear un feed.
+
+        Args:
+            url: URL del feed
+            etag: Header ETag de la respuesta
+            last_modified: Header Last-Modified de la respuesta
+            content_hash: Hash del contenido
+            items: Noticias producidas por el feed
+            items_since: Fecha de corte (ISO) usada al producir las noticias
+        """
+        with self._lock:
+            entry = self.entries.setdefault(url, {'hits': 0, 'misses': 0})
+            entry.update({
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_hash': content_hash,
+                'items': items,
+                'items_since': items_since,
+                'updated_at': datetime.now().isoformat()
+            })
+
+    def record(self, url: str, hit: bool):
+        """
+        Registra un hit (feed sin cambios) o un miss (feed parseado).
+
+        Args:
+            url: URL del feed
+            hit: True si se reutilizó la caché
+        """
+        with self._lock:
+            entry = self.entries.setdefault(url, {'hits': 0, 'misses': 0})
+            if hit:
+                entry['hits'] = entry.get('hits', 0) + 1
+            else:
+                entry['misses'] = entry.get('misses', 0) + 1
+
+    def save(self):
+        """Persiste la caché en disco (escritura atómica)."""
+        self.cache_path.parent.mkdir(exist_ok=True)
+        tmp_path = self.cache_path.with_suffix('.tmp')
+        with self._lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, ensure_ascii=False)
+        os.replace(tmp_path, self.cache_path)
@@ -0,0 +1,141 @@
+"""
+Feed Stream - Lectura incremental de feeds RSS/Atom
+
+feedparser construye el feed completo antes de devolverlo, aunque solo
+interesen las primeras entradas (los feeds vienen ordenados del más nuevo
+al más antiguo y muchos traen cientos de entradas viejas). Este módulo
+recorre el XML con iterparse y produce las entradas una a una, de modo
+que quien lo consume puede detenerse en cuanto llega a la fecha de corte.
+
+Soporta RSS 2.0, RSS 1.0 (RDF) y Atom. Si el XML está mal formado
+(entidades HTML sin declarar, encoding roto...) se recurre a feedparser,
+que es tolerante a errores.
+"""
+
+import io
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+
+import feedparser
+
+# Etiquetas (sin namespace) que delimitan una entrada
+ENTRY_TAGS = {'item', 'entry'}
+
+# Campos de fecha por orden de preferencia
+DATE_TAGS = ('pubDate', 'published', 'date', 'updated', 'issued', 'modified')
+
+
+def _local_name(tag: str) -> str:
+    """Quita el namespace de una etiqueta ('{ns}item' -> 'item')."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[time.struct_time]:
+    """
+    Convierte una fecha RFC 822 (RSS) o ISO 8601 (Atom) a struct_time UTC.
+
+    Devuelve el mismo formato que `published_parsed` de feedparser.
+
+    Args:
+        value: Texto de la fecha
+
+    Returns:
+        struct_time en UTC o None si no se reconoce
+    """
+    if not value:
+        return None
+    value = value.strip()
+
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).timetuple()
+
+
+def _element_to_entry(element: ET.Element) -> Dict:
+    """Convierte un <item>/<entry> en un dict con los campos de feedparser."""
+    fields = {}
+    link = None
+
+    for child in element:
+        name = _local_name(child.tag)
+        if len(child):
+            # Atom type="xhtml": el texto está dentro de <div><p>...</p></div>
+            text = ''.join(child.itertext()).strip()
+        else:
+            text = (child.text or '').strip()
+
+        if name == 'link':
+            # Atom: <link rel="alternate" href="..."/>; RSS: <link>url</link>
+            href = child.get('href')
+            if href:
+                if link is None or child.get('rel', 'alternate') == 'alternate':
+                    link = href
+            elif text and link is None:
+                link = text
+        elif name in ('description', 'summary'):
+            fields.setdefault('summary', text)
+        elif name in ('encoded', 'content'):
+            fields.setdefault('content', text)
+        elif name not in fields:
+            fields[name] = text
+
+    published = None
+    for tag in DATE_TAGS:
+        if fields.get(tag):
+            published = parse_feed_date(fields[tag])
+            if published:
+                break
+
+    return {
+        'title': fields.get('title', ''),
+        'link': link or fields.get('guid', ''),
+        'summary': fields.get('summary') or fields.get('content', ''),
+        'published_parsed': published
+    }
+
+
+def _iter_xml_entries(content: bytes) -> Iterator[Dict]:
+    """Recorre el XML entrada a entrada liberando cada una tras procesarla."""
+    for _, element in ET.iterparse(io.BytesIO(content), events=('end',)):
+        if _local_name(element.tag) in ENTRY_TAGS:
+            yield _element_to_entry(element)
+            element.clear()
+
+
+def iter_feed_entries(content: bytes, content_type: str = '') -> Iterator[Dict]:
+    """
+    Genera las entradas de un feed de forma perezosa.
+
+    Si el XML resulta inválido se continúa con feedparser, saltando
+    las entradas que ya se habían producido.
+
+    Args:
+        content: Contenido descargado del feed
+        content_type: Header Content-Type de la respuesta (para feedparser)
+
+    Returns:
+        Iterador de dicts con title, link, summary y published_parsed
+    """
+    yielded = 0
+    try:
+        for entry in _iter_xml_entries(content):
+            yield entry
+            yielded += 1
+        return
+    except ET.ParseError:
+        pass
+
+    feed = feedparser.parse(content, response_headers={'content-type': content_type})
+    for entry in feed.entries[yielded:]:
+        yield entry
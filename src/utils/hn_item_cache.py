@@ -0,0 +1,163 @@
+"""
+HN Item Cache - Caché compartida de items de Hacker News
+
+Las pasadas 'top', 'new' y 'best' de HackerNewsCollector comparten muchos
+IDs, y ContentEnricher vuelve a descargar la historia y sus comentarios.
+Esta caché (una por proceso) garantiza que cada item se descarga como
+máximo una vez por ejecución:
+- Clave: ID del item
+- Expiración por TTL
+- Tamaño máximo con política LRU
+- Descargas concurrentes del mismo ID se unifican en una sola
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+
+class HNItemCache:
+    """Caché LRU con TTL para items de Hacker News, segura entre threads."""
+
+    def __init__(self, max_items: int = 5000, ttl_seconds: float = 1800):
+        """
+        Inicializa la caché.
+
+        Args:
+            max_items: Máximo de items guardados (se descartan los menos usados)
+            ttl_seconds: Segundos que un item se considera fresco
+        """
+        self.max_items = max_items
+        self.ttl_seconds = ttl_seconds
+        self._items: "OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._in_flight: Dict[int, threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, item_id: int) -> Optional[Dict]:
+        """
+        Obtiene un item de la caché si existe y no ha expirado.
+
+        Args:
+            item_id: ID del item
+
+        Returns:
+            Item o None
+        """
+        item_id = int(item_id)
+        with self._lock:
+            return self._get_locked(item_id)
+
+    def put(self, item_id: int, item: Dict):
+        """
+        Guarda un item en la caché.
+
+        Args:
+            item_id: ID del item
+            item: Datos del item
+        """
+        item_id = int(item_id)
+        with self._lock:
+            self._put_locked(item_id, item)
+
+    def get_or_fetch(self, item_id: int, fetch: Callable[[int], Optional[Dict]]) -> Optional[Dict]:
+        """
+        Devuelve el item desde caché o lo descarga con `fetch`.
+
+        Si otro thread ya está descargando el mismo ID, espera a ese
+        resultado en lugar de lanzar una segunda descarga.
+
+        Args:
+            item_id: ID del item
+            fetch: Función que descarga el item (devuelve None si falla)
+
+        Returns:
+            Item o None
+        """
+        item_id = int(item_id)
+
+        while True:
+            with self._lock:
+                item = self._get_locked(item_id, count=False)
+                if item is not None:
+                    self.hits += 1
+                    return item
+
+                event = self._in_flight.get(item_id)
+                if event is None:
+                    # Este thread es el responsable de descargarlo
+                    self.misses += 1
+                    event = threading.Event()
+                    self._in_flight[item_id] = event
+                    break
+
+            # Otro thread lo está descargando: esperar y volver a mirar
+            event.wait()
+            # Si la otra descarga falló, la siguiente vuelta lo intenta este thread
+
+        try:
+            item = fetch(item_id)
+            if item is not None:
+                self.put(item_id, item)
+            return item
+        finally:
+            with self._lock:
+                self._in_flight.pop(item_id, None)
+            event.set()
+
+    def clear(self):
+        """Vacía la caché y reinicia las estadísticas."""
+        with self._lock:
+            self._items.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """Devuelve estadísticas de uso de la caché."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self._items),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / total if total else 0.0
+            }
+
+    def _get_locked(self, item_id: int, count: bool = True) -> Optional[Dict]:
+        """Lectura interna (requiere tener el lock)."""
+        entry = self._items.get(item_id)
+        if entry is not None:
+            stored_at, item = entry
+            if time.monotonic() - stored_at <= self.ttl_seconds:
+                self._items.move_to_end(item_id)
+                if count:
+                    self.hits += 1
+                return item
+            del self._items[item_id]
+
+        if count:
+            self.misses += 1
+        return None
+
+    def _put_locked(self, item_id: int, item: Dict):
+        """Escritura interna (requiere tener el lock)."""
+        self._items[item_id] = (time.monotonic(), item)
+        self._items.move_to_end(item_id)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+
+
+# Instancia única por proceso
+_shared_cache: Optional[HNItemCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_hn_item_cache() -> HNItemCache:
+    """Devuelve la caché de items de HN compartida por todo el proceso."""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = HNItemCache()
+        return _shared_cache
@@ -0,0 +1,156 @@
+"""
+HTTP Client - Cliente HTTP compartido por todos los collectors
+
+Antes cada collector llamaba a `requests.get`/`requests.post` directamente,
+lo que abre una conexión TCP + TLS nueva por request. Este cliente
+centraliza:
+- Pools de conexiones por host con keep-alive (requests.Session)
+- Compresión gzip/deflate (y brotli si está instalado)
+- Timeout por defecto y política de reintentos consistente
+  (429/5xx con backoff exponencial, respetando Retry-After hasta un
+  máximo, para que un servidor no pueda bloquear un collector minutos)
+
+Nota: requests/urllib3 no soportan HTTP/2; todas las conexiones son
+HTTP/1.1 con keep-alive.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import brotli  # noqa: F401  (urllib3 lo usa para decodificar 'br')
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+
+class CappedRetry(Retry):
+    """Retry que respeta Retry-After pero nunca espera más de `max_retry_after`."""
+
+    def __init__(self, *args, max_retry_after: float = 10, **kwargs):
+        """
+        Inicializa la política de reintentos.
+
+        Args:
+            *args: Argumentos de urllib3 Retry
+            max_retry_after: Espera máxima en segundos ante un Retry-After
+            **kwargs: Argumentos de urllib3 Retry
+        """
+        super().__init__(*args, **kwargs)
+        self.max_retry_after = max_retry_after
+
+    def new(self, **kwargs) -> 'CappedRetry':
+        # urllib3 crea una copia por reintento sin conocer max_retry_after
+        retry = super().new(**kwargs)
+        retry.max_retry_after = self.max_retry_after
+        return retry
+
+    def get_retry_after(self, response) -> Optional[float]:
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, self.max_retry_after)
+
+
+class HTTPClient:
+    """
+    Cliente HTTP con pool de conexiones y reintentos.
+
+    Es seguro usar una misma instancia desde varios threads
+    (los collectors corren en paralelo en el orquestador).
+    """
+
+    DEFAULT_USER_AGENT = 'TechNewsBot/1.0'
+
+    def __init__(
+        self,
+        timeout: float = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        pool_connections: int = 20,
+        pool_maxsize: int = 50,
+        user_agent: str = None,
+        max_retry_after: float = 10
+    ):
+        """
+        Inicializa el cliente.
+
+        Args:
+            timeout: Timeout por defecto de cada request en segundos
+            max_retries: Reintentos ante errores de conexión, 429 y 5xx
+            backoff_factor: Factor de backoff exponencial entre reintentos
+            pool_connections: Número de hosts con pool propio
+            pool_maxsize: Conexiones simultáneas máximas por host
+            user_agent: User-Agent por defecto
+            max_retry_after: Espera máxima en segundos cuando el servidor
+                pide más con Retry-After (p.ej. un 429 con 'Retry-After: 3600')
+        """
+        self.timeout = timeout
+
+        retry = CappedRetry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False,  # Devolver la última respuesta, no excepción
+            max_retry_after=max_retry_after
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry
+        )
+
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': user_agent or self.DEFAULT_USER_AGENT,
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive'
+        })
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Ejecuta un request aplicando el timeout por defecto.
+
+        Args:
+            method: Método HTTP
+            url: URL
+            **kwargs: Argumentos de requests (params, headers, json, timeout...)
+
+        Returns:
+            Respuesta de requests
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET con pool de conexiones (mismos argumentos que requests.get)."""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """POST con pool de conexiones (mismos argumentos que requests.post)."""
+        return self.request('POST', url, **kwargs)
+
+    def close(self):
+        """Cierra todas las conexiones del pool."""
+        self.session.close()
+
+
+# Instancia compartida por proceso
+_shared_client: Optional[HTTPClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Devuelve el cliente HTTP compartido por todos los collectors."""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient()
+        return _shared_client
@@ -0,0 +1,115 @@
+"""
+Keyword Matcher - Búsqueda simultánea de muchas keywords
+
+Buscar cada keyword con `keyword in texto` recorre el texto una vez por
+keyword. Aquí todas las keywords se compilan una sola vez en una única
+expresión regular con forma de trie (los prefijos comunes se comparten),
+que el motor de `re` evalúa en C recorriendo el texto una única vez.
+
+La regex encuentra en cada posición la keyword más larga que empieza
+ahí; las demás keywords que empiezan en esa posición son justamente sus
+prefijos, que se precalculan. Así se obtienen todas las apariciones,
+incluidas las solapadas y las keywords contenidas en otras.
+"""
+
+import re
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+
+class KeywordMatcher:
+    """Matcher multi-keyword compilado una vez para un conjunto fijo de keywords."""
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compila el matcher.
+
+        Args:
+            keywords: Keywords a buscar (se distinguen mayúsculas; normalizar
+                antes si hace falta). Su posición en la lista es su ID.
+        """
+        self.keywords: List[str] = list(keywords)
+
+        # Un keyword vacío aparece en cualquier texto (igual que '' in texto)
+        self.always_matched: Set[int] = {
+            kid for kid, keyword in enumerate(self.keywords) if not keyword
+        }
+
+        ids_by_keyword: Dict[str, List[int]] = {}
+        for kid, keyword in enumerate(self.keywords):
+            if keyword:
+                ids_by_keyword.setdefault(keyword, []).append(kid)
+
+        # Para cada keyword: todas las keywords que son prefijo suyo (incluida ella)
+        self._prefix_matches: Dict[str, Tuple[Tuple[int, int], ...]] = {}
+        for keyword in ids_by_keyword:
+            self._prefix_matches[keyword] = tuple(
+                (kid, length)
+                for length in range(1, len(keyword) + 1)
+                for kid in ids_by_keyword.get(keyword[:length], ())
+            )
+
+        self._pattern = None
+        if ids_by_keyword:
+            trie_regex = self._trie_regex(ids_by_keyword)
+            # Lookahead: coincidencias de ancho cero en cada posición (solapadas)
+            self._pattern = re.compile(f"(?=({trie_regex}))", re.DOTALL)
+
+    @staticmethod
+    def _trie_regex(keywords: Iterable[str]) -> str:
+        """Construye una regex con forma de trie que prefiere la keyword más larga."""
+        trie: Dict = {}
+        for keyword in keywords:
+            node = trie
+            for char in keyword:
+                node = node.setdefault(char, {})
+            node[''] = True
+
+        def build(node: Dict) -> str:
+            branches = [
+                re.escape(char) + build(child)
+                for char, child in sorted(node.items())
+                if char
+            ]
+            if not branches:
+                return ''
+            body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+            # Si aquí termina una keyword, continuar es opcional (greedy: la más larga)
+            return f"(?:{body})?" if '' in node else body
+
+        return build(trie)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Recorre el texto una vez y genera cada aparición.
+
+        Args:
+            text: Texto donde buscar
+
+        Returns:
+            Iterador de (id de keyword, inicio, fin) con fin exclusivo
+        """
+        if self._pattern is None:
+            return
+        prefix_matches = self._prefix_matches
+        for match in self._pattern.finditer(text):
+            start = match.start()
+            for kid, length in prefix_matches[match.group(1)]:
+                yield kid, start, start + length
+
+    def find_all(self, text: str) -> Set[int]:
+        """
+        IDs de las keywords que aparecen en el texto.
+
+        Args:
+            text: Texto donde buscar
+
+        Returns:
+            Set de IDs
+        """
+        found = set(self.always_matched)
+        for kid, _, _ in self.iter_matches(text):
+            found.add(kid)
+        return found
+
+    def __len__(self) -> int:
+        return len(self.keywords)
@@ -0,0 +1,412 @@
+"""
+Near Duplicates - Detección de noticias casi duplicadas (MinHash + LSH)
+
+La misma historia llega desde Guardian, NewsData, HN, Algolia... con
+titulares ligeramente distintos, y el MD5 del título no la detecta.
+Aquí cada noticia se convierte en un conjunto de shingles (n-gramas de
+caracteres del titular normalizado):
+- MinHash resume el conjunto en una firma corta cuya similitud estima
+  la Jaccard entre conjuntos. Se usa la variante de una sola
+  permutación (un hash por shingle repartido en k bins, con
+  densificación de los bins vacíos) en lugar de k funciones hash
+- LSH (bandas de la firma) agrupa firmas parecidas en los mismos buckets,
+  así cada noticia solo se compara con unas pocas candidatas
+- Las candidatas se confirman con la Jaccard exacta de sus shingles y
+  con sus números: "Python 3.13" y "Python 3.14" comparten casi todos
+  los shingles pero son lanzamientos distintos, así que dos noticias con
+  números o versiones distintas nunca se consideran duplicadas
+"""
+
+import hashlib
+import re
+import struct
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Hashable, List, Optional, Set
+
+_NON_WORD = re.compile(r'[\W_]+', re.UNICODE)
+_NUMBER = re.compile(r'\d+(?:[.,]\d+)*')
+_EMPTY_BIN = 1 << 64
+
+# Jaccard mínima entre shingles para considerar dos titulares la misma historia
+DEFAULT_THRESHOLD = 0.6
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normaliza un texto para compararlo: minúsculas, sin acentos ni signos.
+
+    Args:
+        text: Texto original
+
+    Returns:
+        Texto normalizado
+    """
+    text = unicodedata.normalize('NFKD', text or '')
+    text = ''.join(char for char in text if not unicodedata.combining(char))
+    return _NON_WORD.sub(' ', text.lower()).strip()
+
+
+def shingles(text: str, size: int = 4) -> FrozenSet[str]:
+    """
+    Conjunto de n-gramas de caracteres de un texto normalizado.
+
+    Args:
+        text: Texto normalizado
+        size: Longitud de cada n-grama
+
+    Returns:
+        Set de shingles (vacío si el texto está vacío)
+    """
+    if len(text) <= size:
+        return frozenset([text]) if text else frozenset()
+    return frozenset(text[i:i + size] for i in range(len(text) - size + 1))
+
+
+def news_shingles(news_item: Dict, summary_chars: int = 120, size: int = 4) -> FrozenSet[str]:
+    """
+    Shingles de una noticia: su título (o el inicio del resumen si no tiene).
+
+    El resumen no se mezcla con el título: cada fuente lo redacta de
+    forma distinta y bajaría la similitud entre versiones de la misma
+    historia por debajo del umbral.
+
+    Args:
+        news_item: Noticia
+        summary_chars: Caracteres del resumen usados si no hay título
+        size: Longitud de cada n-grama
+
+    Returns:
+        Set de shingles
+    """
+    text = news_item.get('title') or (news_item.get('summary') or '')[:summary_chars]
+    return shingles(normalize_text(text), size)
+
+
+def news_numbers(news_item: Dict, summary_chars: int = 120) -> FrozenSet[str]:
+    """
+    Números y versiones de una noticia (del mismo texto que `news_shingles`).
+
+    Args:
+        news_item: Noticia
+        summary_chars: Caracteres del resumen usados si no hay título
+
+    Returns:
+        Set de números tal como aparecen (p.ej. {'15.1.0'}, {'5'})
+    """
+    text = news_item.get('title') or (news_item.get('summary') or '')[:summary_chars]
+    return frozenset(_NUMBER.findall(text))
+
+
+def jaccard(a: Set, b: Set) -> float:
+    """Similitud de Jaccard entre dos conjuntos."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashLSH:
+    """Índice LSH sobre firmas MinHash, con altas y bajas."""
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = 48,
+        bands: int = 16,
+        seed: int = 1
+    ):
+        """
+        Inicializa el índice.
+
+        Con b bandas de r filas, dos conjuntos con Jaccard s comparten algún
+        bucket con probabilidad 1 - (1 - s^r)^b: con 16 bandas de 3 filas,
+        ~97% para s=0.6 y ~12% para s=0.2.
+
+        Args:
+            threshold: Jaccard exacta mínima para considerar duplicado
+            num_perm: Número de bins (largo de la firma)
+            bands: Número de bandas (debe dividir a num_perm)
+            seed: Semilla del hash (firmas reproducibles)
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm debe ser múltiplo de bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+
+        self._hash_key = struct.pack('<Q', seed)
+
+        self._buckets: List[Dict[tuple, Set[Hashable]]] = [{} for _ in range(bands)]
+        self._band_keys: Dict[Hashable, List[tuple]] = {}
+        self._shingles: Dict[Hashable, FrozenSet[str]] = {}
+        self._numbers: Dict[Hashable, FrozenSet[str]] = {}
+
+    def signature(self, shingle_set: FrozenSet[str]) -> List[int]:
+        """
+        Firma MinHash de un conjunto de shingles.
+
+        Args:
+            shingle_set: Conjunto no vacío de shingles
+
+        Returns:
+            Lista de num_perm enteros
+        """
+        num_bins = self.num_perm
+        key = self._hash_key
+        signature = [_EMPTY_BIN] * num_bins
+
+        for shingle in shingle_set:
+            value = int.from_bytes(
+                hashlib.blake2b(shingle.encode(), digest_size=8, key=key).digest(),
+                'little'
+            )
+            # El hash elige el bin y el resto del valor compite por el mínimo
+            bin_index = value % num_bins
+            value //= num_bins
+            if value < signature[bin_index]:
+                signature[bin_index] = value
+
+        # Densificación: un bin vacío toma el valor del siguiente bin lleno,
+        # desplazado según la distancia para no confundirse con él
+        if _EMPTY_BIN in signature and len(set(signature)) > 1:
+            filled = signature[:]
+            for i in range(num_bins):
+                if filled[i] == _EMPTY_BIN:
+                    distance = 1
+                    while filled[(i + distance) % num_bins] == _EMPTY_BIN:
+                        distance += 1
+                    signature[i] = filled[(i + distance) % num_bins] + distance * _EMPTY_BIN
+        return signature
+
+    def band_keys(self, shingle_set: FrozenSet[str]) -> List[tuple]:
+        """Firma dividida en bandas (claves de bucket)."""
+        signature = self.signature(shingle_set)
+        rows = self.rows
+        return [tuple(signature[i * rows:(i + 1) * rows]) for i in range(self.bands)]
+
+    def query(
+        self,
+        shingle_set: FrozenSet[str],
+        band_keys: Optional[List[tuple]] = None,
+        numbers: FrozenSet[str] = frozenset()
+    ) -> List[Hashable]:
+        """
+        Busca claves casi duplicadas de un conjunto de shingles.
+
+        Args:
+            shingle_set: Shingles a buscar
+            band_keys: Bandas ya calculadas (evita recalcular la firma)
+            numbers: Números del texto (solo coinciden claves con los mismos)
+
+        Returns:
+            Claves con Jaccard >= threshold, de mayor a menor similitud
+        """
+        if not shingle_set:
+            return []
+
+        candidates = set()
+        for band, band_key in enumerate(band_keys or self.band_keys(shingle_set)):
+            candidates.update(self._buckets[band].get(band_key, ()))
+
+        scored = [
+            (jaccard(shingle_set, self._shingles[key]), key)
+            for key in candidates
+            if self._numbers[key] == numbers
+        ]
+        scored = [(score, key) for score, key in scored if score >= self.threshold]
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [key for _, key in scored]
+
+    def add(
+        self,
+        key: Hashable,
+        shingle_set: FrozenSet[str],
+        band_keys: Optional[List[tuple]] = None,
+        numbers: FrozenSet[str] = frozenset()
+    ):
+        """
+        Añade un conjunto al índice.
+
+        Args:
+            key: Clave única
+            shingle_set: Shingles (los conjuntos vacíos se ignoran)
+            band_keys: Bandas ya calculadas (evita recalcular la firma)
+            numbers: Números del texto
+        """
+        if not shingle_set or key in self._shingles:
+            return
+        band_keys = band_keys or self.band_keys(shingle_set)
+        for band, band_key in enumerate(band_keys):
+            self._buckets[band].setdefault(band_key, set()).add(key)
+        self._band_keys[key] = band_keys
+        self._shingles[key] = shingle_set
+        self._numbers[key] = numbers
+
+    def remove(self, key: Hashable):
+        """
+        Quita una clave del índice.
+
+        Args:
+            key: Clave a quitar
+        """
+        band_keys = self._band_keys.pop(key, None)
+        if band_keys is None:
+            return
+        del self._shingles[key]
+        del self._numbers[key]
+        for band, band_key in enumerate(band_keys):
+            bucket = self._buckets[band].get(band_key)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._buckets[band][band_key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._shingles
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+
+class NearDuplicateIndex:
+    """
+    Índice de noticias recientes para detectar casi duplicados entre
+    iteraciones (p.ej. en el agente continuo). Acotado: se olvidan las
+    noticias indexadas hace más de `ttl_hours` y, al superar `max_items`,
+    las más antiguas.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        max_items: int = 20_000,
+        ttl_hours: float = 24
+    ):
+        """
+        Inicializa el índice.
+
+        Args:
+            threshold: Jaccard mínima para considerar duplicado
+            max_items: Máximo de noticias recordadas
+            ttl_hours: Horas que se recuerda cada noticia
+        """
+        self.lsh = MinHashLSH(threshold=threshold)
+        self.max_items = max_items
+        self.ttl_seconds = ttl_hours * 3600
+        # Clave -> momento en que se indexó (en orden de inserción)
+        self._order: "OrderedDict[int, float]" = OrderedDict()
+        self._next_key = 0
+
+    def expire(self, now: Optional[float] = None) -> int:
+        """
+        Olvida las noticias indexadas hace más de `ttl_hours`.
+
+        Args:
+            now: Momento actual (por defecto time.time())
+
+        Returns:
+            Número de noticias olvidadas
+        """
+        cutoff = (now if now is not None else time.time()) - self.ttl_seconds
+        removed = 0
+        while self._order:
+            oldest, added_at = next(iter(self._order.items()))
+            if added_at >= cutoff:
+                break
+            del self._order[oldest]
+            self.lsh.remove(oldest)
+            removed += 1
+        return removed
+
+    def check_and_add(self, news_item: Dict) -> bool:
+        """
+        Verifica si una noticia se parece a alguna ya indexada y, si no,
+        la indexa.
+
+        Args:
+            news_item: Noticia
+
+        Returns:
+            True si es casi duplicada (en ese caso no se indexa)
+        """
+        item_shingles = news_shingles(news_item)
+        if not item_shingles:
+            return False
+
+        now = time.time()
+        self.expire(now)
+
+        numbers = news_numbers(news_item)
+        band_keys = self.lsh.band_keys(item_shingles)
+        if self.lsh.query(item_shingles, band_keys, numbers):
+            return True
+
+        key = self._next_key
+        self._next_key += 1
+        self.lsh.add(key, item_shingles, band_keys, numbers)
+        self._order[key] = now
+        while len(self._order) > self.max_items:
+            oldest, _ = self._order.popitem(last=False)
+            self.lsh.remove(oldest)
+        return False
+
+    def __len__(self) -> int:
+        return len(self.lsh)
+
+
+def representative_quality(news_item: Dict) -> tuple:
+    """
+    Criterio para elegir la mejor noticia de un grupo de duplicados:
+    con enlace, con fecha, con el resumen más completo.
+    """
+    return (
+        bool(news_item.get('link')),
+        bool(news_item.get('published')),
+        len(news_item.get('summary') or '')
+    )
+
+
+def cluster_near_duplicates(
+    news_list: List[Dict],
+    threshold: float = DEFAULT_THRESHOLD,
+    lsh: Optional[MinHashLSH] = None
+) -> List[List[int]]:
+    """
+    Agrupa noticias casi duplicadas.
+
+    Args:
+        news_list: Lista de noticias
+        threshold: Jaccard mínima para considerar duplicado
+        lsh: Índice a usar (por defecto uno nuevo)
+
+    Returns:
+        Grupos de índices (en orden de primera aparición)
+    """
+    lsh = lsh or MinHashLSH(threshold=threshold)
+    parent = list(range(len(news_list)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for index, news_item in enumerate(news_list):
+        item_shingles = news_shingles(news_item)
+        if not item_shingles:
+            continue
+        numbers = news_numbers(news_item)
+        band_keys = lsh.band_keys(item_shingles)
+        for other in lsh.query(item_shingles, band_keys, numbers):
+            root_a, root_b = find(index), find(other)
+            if root_a != root_b:
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+        lsh.add(index, item_shingles, band_keys, numbers)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(news_list)):
+        clusters.setdefault(find(index), []).append(index)
+    return list(clusters.values())
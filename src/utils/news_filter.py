@@ -2,19 +2,188 @@
 News Filter - Filtrado básico de noticias
 
 Este módulo realiza filtros básicos como:
-- Eliminar duplicados
+- Eliminar duplicados (exactos y casi duplicados entre fuentes)
 - Filtrar por antigüedad
 - Validar longitud de títulos
+
+Los filtros por noticia se combinan en un FilterPipeline que recorre la
+lista una sola vez (cada noticia pasa por todas las etapas antes de la
+siguiente) y cuenta cuántas descarta cada etapa.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 import hashlib
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.date_normalizer import ensure_published_ts
+from utils.near_duplicates import DEFAULT_THRESHOLD, cluster_near_duplicates, representative_quality
+
+
+class FilterPipeline:
+    """
+    Pipeline de filtros fusionados en una sola pasada.
+    
+    Cada etapa es un predicado (True = la noticia sigue). Las etapas se
+    evalúan en el orden en que se añaden, así que conviene añadir
+    primero las más baratas: una noticia descartada no paga las demás.
+    """
+    
+    def __init__(self):
+        """Inicializa el pipeline vacío."""
+        self.stages: List[Tuple[str, Callable[[Dict], bool], str]] = []
+        self.dropped: Dict[str, int] = {}
+        self.total = 0
+        self.passed = 0
+    
+    def add(self, name: str, predicate: Callable[[Dict], bool], message: str = "") -> 'FilterPipeline':
+        """
+        Añade una etapa.
+        
+        Args:
+            name: Nombre de la etapa (clave en `dropped`)
+            predicate: Función que recibe una noticia y devuelve si pasa
+            message: Mensaje del reporte, con `{count}` descartadas
+            
+        Returns:
+            El propio pipeline (para encadenar)
+        """
+        self.stages.append((name, predicate, message))
+        self.dropped[name] = 0
+        return self
+    
+    def run(self, news_iter: Iterable[Dict]) -> Iterator[Dict]:
+        """
+        Filtra noticias de forma perezosa.
+        
+        Args:
+            news_iter: Iterable (o generador) de noticias
+            
+        Returns:
+            Iterador de las noticias que pasan todas las etapas
+        """
+        stages = [(name, predicate) for name, predicate, _ in self.stages]
+        dropped = self.dropped
+        
+        for news in news_iter:
+            self.total += 1
+            for name, predicate in stages:
+                if not predicate(news):
+                    dropped[name] += 1
+                    break
+            else:
+                self.passed += 1
+                yield news
+    
+    def apply(self, news_iter: Iterable[Dict], report: bool = True) -> List[Dict]:
+        """
+        Filtra noticias y devuelve la lista resultante.
+        
+        Args:
+            news_iter: Iterable de noticias
+            report: Imprimir cuántas descartó cada etapa
+            
+        Returns:
+            Lista filtrada
+        """
+        filtered = list(self.run(news_iter))
+        if report:
+            self.print_report()
+        return filtered
+    
+    def print_report(self):
+        """Imprime las noticias descartadas por cada etapa."""
+        for name, _, message in self.stages:
+            count = self.dropped[name]
+            if count > 0 and message:
+                print(message.format(count=count))
+    
+    @staticmethod
+    def title_length_stage(min_length: int = 20, max_length: int = 200) -> Callable[[Dict], bool]:
+        """Predicado: título con longitud entre min_length y max_length."""
+        def predicate(news: Dict) -> bool:
+            return min_length <= len(news.get('title', '')) <= max_length
+        return predicate
+    
+    @staticmethod
+    def age_stage(max_hours: int = 24) -> Callable[[Dict], bool]:
+        """
+        Predicado: publicada dentro de las últimas max_hours.
+        
+        Compara el epoch `published_ts` que emiten los collectors (solo
+        se parsea `published` si falta). Las noticias sin fecha o con
+        fecha inválida pasan.
+        """
+        cutoff_ts = int(time.time()) - int(max_hours * 3600)
+        
+        def predicate(news: Dict) -> bool:
+            published_ts = news.get('published_ts')
+            if published_ts is None and 'published_ts' not in news:
+                published_ts = ensure_published_ts(news)
+            return published_ts is None or published_ts >= cutoff_ts
+        return predicate
+    
+    @staticmethod
+    def duplicate_stage() -> Callable[[Dict], bool]:
+        """Predicado con estado: la primera noticia con cada título normalizado."""
+        seen_titles = set()
+        
+        def predicate(news: Dict) -> bool:
+            # Crear hash del título normalizado
+            title_hash = hashlib.md5(
+                news['title'].lower().strip().encode()
+            ).digest()
+            if title_hash in seen_titles:
+                return False
+            seen_titles.add(title_hash)
+            return True
+        return predicate
+
 
 class NewsFilter:
     """Filtros básicos para noticias."""
     
+    @staticmethod
+    def build_pipeline(
+        max_age_hours: int = 24,
+        min_title_length: int = 20,
+        max_title_length: int = 200
+    ) -> FilterPipeline:
+        """
+        Pipeline con los filtros básicos, de más barato a más caro:
+        longitud del título, antigüedad y duplicados.
+        
+        Args:
+            max_age_hours: Máxima antigüedad en horas
+            min_title_length: Longitud mínima del título
+            max_title_length: Longitud máxima del título
+            
+        Returns:
+            FilterPipeline listo para usar
+        """
+        return (
+            FilterPipeline()
+            .add(
+                'title_length',
+                FilterPipeline.title_length_stage(min_title_length, max_title_length),
+                "   ✂️  Eliminadas {count} noticias con títulos muy cortos/largos"
+            )
+            .add(
+                'age',
+                FilterPipeline.age_stage(max_age_hours),
+                f"   ⏰ Eliminadas {{count}} noticias antiguas (>{max_age_hours}h)"
+            )
+            .add(
+                'duplicates',
+                FilterPipeline.duplicate_stage(),
+                "   🗑️  Eliminados {count} duplicados"
+            )
+        )
+    
     @staticmethod
     def remove_duplicates(news_list: List[Dict]) -> List[Dict]:
         """
@@ -26,22 +195,45 @@ class NewsFilter:
         Returns:
             Lista sin duplicados
         """
-        seen_titles = set()
-        unique_news = []
+        pipeline = FilterPipeline().add(
+            'duplicates', FilterPipeline.duplicate_stage(), "   🗑️  Eliminados {count} duplicados"
+        )
+        return pipeline.apply(news_list)
+    
+    @staticmethod
+    def remove_near_duplicates(news_list: List[Dict], threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+        """
+        Fusiona noticias casi duplicadas (la misma historia desde varias
+        fuentes con titulares ligeramente distintos).
         
-        for news in news_list:
-            # Crear hash del título normalizado
-            title_hash = hashlib.md5(
-                news['title'].lower().strip().encode()
-            ).hexdigest()
+        De cada grupo se conserva la noticia más completa, en la posición
+        del primer miembro del grupo; las fuentes de las demás quedan en
+        `also_reported_by`.
+        
+        Args:
+            news_list: Lista de noticias
+            threshold: Similitud de Jaccard mínima (0-1) entre shingles
             
-            if title_hash not in seen_titles:
-                seen_titles.add(title_hash)
-                unique_news.append(news)
+        Returns:
+            Lista sin casi duplicados
+        """
+        clusters = cluster_near_duplicates(news_list, threshold)
+        unique_news = []
+        
+        for cluster in clusters:
+            members = [news_list[i] for i in cluster]
+            best = max(members, key=representative_quality)
+            if len(members) > 1:
+                other_sources = {m.get('source') for m in members if m is not best}
+                other_sources.discard(best.get('source'))
+                other_sources.discard(None)
+                if other_sources:
+                    best['also_reported_by'] = sorted(other_sources)
+            unique_news.append(best)
         
         removed = len(news_list) - len(unique_news)
         if removed > 0:
-            print(f"   🗑️  Eliminados {removed} duplicados")
+            print(f"   🧬 Fusionadas {removed} noticias casi duplicadas")
         
         return unique_news
     
@@ -57,33 +249,12 @@ class NewsFilter:
         Returns:
             Lista filtrada
         """
-        from datetime import timezone
-        
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=max_hours)
-        filtered = []
-        
-        for news in news_list:
-            published = news.get('published')
-            if published:
-                try:
-                    pub_date = datetime.fromisoformat(published)
-                    # Hacer ambos datetimes timezone-aware para compararlos
-                    if pub_date.tzinfo is None:
-                        pub_date = pub_date.replace(tzinfo=timezone.utc)
-                    if pub_date >= cutoff:
-                        filtered.append(news)
-                except ValueError:
-                    # Si no se puede parsear, incluir la noticia
-                    filtered.append(news)
-            else:
-                # Si no tiene fecha, incluir la noticia
-                filtered.append(news)
-        
-        removed = len(news_list) - len(filtered)
-        if removed > 0:
-            print(f"   ⏰ Eliminadas {removed} noticias antiguas (>{max_hours}h)")
-        
-        return filtered
+        pipeline = FilterPipeline().add(
+            'age',
+            FilterPipeline.age_stage(max_hours),
+            f"   ⏰ Eliminadas {{count}} noticias antiguas (>{max_hours}h)"
+        )
+        return pipeline.apply(news_list)
     
     @staticmethod
     def filter_by_title_length(
@@ -102,25 +273,20 @@ class NewsFilter:
         Returns:
             Lista filtrada
         """
-        filtered = []
-        
-        for news in news_list:
-            title_len = len(news.get('title', ''))
-            if min_length <= title_len <= max_length:
-                filtered.append(news)
-        
-        removed = len(news_list) - len(filtered)
-        if removed > 0:
-            print(f"   ✂️  Eliminadas {removed} noticias con títulos muy cortos/largos")
-        
-        return filtered
+        pipeline = FilterPipeline().add(
+            'title_length',
+            FilterPipeline.title_length_stage(min_length, max_length),
+            "   ✂️  Eliminadas {count} noticias con títulos muy cortos/largos"
+        )
+        return pipeline.apply(news_list)
     
     @staticmethod
     def apply_all_filters(
         news_list: List[Dict],
         max_age_hours: int = 24,
         min_title_length: int = 20,
-        max_title_length: int = 200
+        max_title_length: int = 200,
+        near_duplicate_threshold: Optional[float] = DEFAULT_THRESHOLD
     ) -> List[Dict]:
         """
         Aplica todos los filtros básicos.
@@ -130,18 +296,20 @@ class NewsFilter:
             max_age_hours: Máxima antigüedad en horas
             min_title_length: Longitud mínima del título
             max_title_length: Longitud máxima del título
+            near_duplicate_threshold: Similitud para fusionar casi duplicados
+                (None para desactivarlo)
             
         Returns:
             Lista filtrada
         """
         print(f"🔍 Aplicando filtros a {len(news_list)} noticias...")
         
-        # Aplicar filtros en secuencia
-        filtered = NewsFilter.remove_duplicates(news_list)
-        filtered = NewsFilter.filter_by_age(filtered, max_age_hours)
-        filtered = NewsFilter.filter_by_title_length(
-            filtered, min_title_length, max_title_length
-        )
+        # Longitud, antigüedad y duplicados en una sola pasada
+        pipeline = NewsFilter.build_pipeline(max_age_hours, min_title_length, max_title_length)
+        filtered = pipeline.apply(news_list)
+        # El más costoso, al final: corre sobre menos noticias
+        if near_duplicate_threshold is not None:
+            filtered = NewsFilter.remove_near_duplicates(filtered, near_duplicate_threshold)
         
         print(f"✅ {len(filtered)} noticias pasaron los filtros básicos")
         
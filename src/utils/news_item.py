@@ -0,0 +1,206 @@
+"""
+News Item - Registro compacto de una noticia
+
+Cada noticia viajaba por todo el pipeline (collectors, filtros, scorer,
+modelo ML, generadores) como un dict, con su tabla hash propia por
+instancia. `NewsItem` guarda los campos conocidos en `__slots__` y solo
+los campos raros (validation, also_reported_by, reddit_id...) en un dict
+aparte que se crea cuando hace falta.
+
+Implementa la interfaz de un dict mutable (`item['title']`, `get`, `in`,
+`copy`, `items`...), así que el código que consumía dicts funciona sin
+cambios. En el límite JSON se convierte con `to_dict()` / `from_dict()`,
+o pasando `json_default` a `json.dump`.
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+# Campos que llevan (casi) todas las noticias, en el orden en que se serializan
+FIELDS = (
+    'title',
+    'link',
+    'summary',
+    'published',
+    'published_ts',
+    'source',
+    'category',
+    'author',
+    'score',
+    'collector',
+    'collected_at',
+    'full_content',
+    'relevance_score',
+)
+_FIELD_SET = frozenset(FIELDS)
+
+
+class NewsItem(MutableMapping):
+    """
+    Noticia con los campos conocidos en slots y el resto en `_extra`.
+
+    Un slot sin asignar equivale a una clave ausente: `'author' in item`
+    y `item.get('author')` se comportan igual que con un dict.
+    """
+
+    __slots__ = FIELDS + ('_extra',)
+
+    def __init__(self, data: Optional[Mapping] = None, **fields: Any):
+        """
+        Crea una noticia.
+
+        Args:
+            data: Campos iniciales (dict u otra noticia)
+            **fields: Campos adicionales
+        """
+        self._extra = None
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'NewsItem':
+        """
+        Convierte un dict (p.ej. leído de JSON) en noticia.
+
+        Si ya es un NewsItem se devuelve tal cual, sin copiar.
+
+        Args:
+            data: Dict de la noticia
+
+        Returns:
+            NewsItem
+        """
+        if isinstance(data, cls):
+            return data
+        item = cls.__new__(cls)
+        extra = None
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                setattr(item, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        item._extra = extra
+        return item
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Dict plano de la noticia (para serializar).
+
+        Returns:
+            Dict con los campos presentes
+        """
+        data = {}
+        for name in FIELDS:
+            try:
+                data[name] = getattr(self, name)
+            except AttributeError:
+                pass
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def copy(self) -> 'NewsItem':
+        """Copia superficial (igual que dict.copy)."""
+        item = NewsItem.__new__(NewsItem)
+        for name in FIELDS:
+            try:
+                setattr(item, name, getattr(self, name))
+            except AttributeError:
+                pass
+        item._extra = dict(self._extra) if self._extra else None
+        return item
+
+    def __getitem__(self, key: str) -> Any:
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key: str, value: Any):
+        if key in _FIELD_SET:
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in _FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+
+    def __contains__(self, key: object) -> bool:
+        if key in _FIELD_SET:
+            return hasattr(self, key)
+        return bool(self._extra) and key in self._extra
+
+    def __iter__(self) -> Iterator[str]:
+        for name in FIELDS:
+            if hasattr(self, name):
+                yield name
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        count = sum(1 for name in FIELDS if hasattr(self, name))
+        return count + (len(self._extra) if self._extra else 0)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Atajo sin excepciones: es el acceso más frecuente en filtros y scorer
+        if key in _FIELD_SET:
+            return getattr(self, key, default)
+        extra = self._extra
+        return extra.get(key, default) if extra else default
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self._extra = None
+        self.update(state)
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.to_dict()!r})"
+
+
+def to_news_items(news_list: Iterable[Mapping]) -> List[NewsItem]:
+    """
+    Convierte una lista de dicts (p.ej. leída de JSON) en noticias.
+
+    Args:
+        news_list: Noticias como dicts o NewsItem
+
+    Returns:
+        Lista de NewsItem
+    """
+    from_dict = NewsItem.from_dict
+    return [from_dict(news_item) for news_item in news_list]
+
+
+def json_default(obj: Any) -> Dict[str, Any]:
+    """
+    Hook `default` para json.dump: serializa NewsItem como dict.
+
+    Args:
+        obj: Objeto que json no sabe serializar
+
+    Returns:
+        Dict de la noticia
+    """
+    if isinstance(obj, NewsItem):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -5,11 +5,18 @@ Este módulo califica cada noticia según su relevancia e importancia.
 Es como un "agente" que decide qué noticias son más importantes.
 """
 
-import yaml
+import sys
+import heapq
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Tuple
 import re
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config_registry import ConfigRegistry, get_config_registry
+from utils.keyword_matcher import KeywordMatcher
+
 
 class NewsScorer:
     """
@@ -24,24 +31,58 @@ class NewsScorer:
     - Keywords excluidas: -50 puntos (descarta)
     """
     
-    def __init__(self, config_path: str = "config/priorities.yaml"):
+    # (lista de keywords, puntos) evaluadas en título y resumen
+    TIER_POINTS = (
+        ('ultra_high_priority_keywords', 25),
+        ('high_priority_keywords', 18),
+        ('medium_priority_keywords', 10),
+    )
+    LOW_PRIORITY_POINTS = 3
+    
+    def __init__(
+        self,
+        config_path: str = "config/priorities.yaml",
+        registry: ConfigRegistry = None
+    ):
         """
         Inicializa el scorer con la configuración de prioridades.
         
         Args:
             config_path: Ruta al archivo de configuración
+            registry: Registro de configuración (por defecto, el del proceso)
         """
         self.config_path = Path(config_path)
+        self.registry = registry or get_config_registry()
+        self._config_version = None
+        self.refresh()
+    
+    def refresh(self) -> bool:
+        """
+        Recarga la configuración si el archivo cambió desde la última vez.
+        
+        Las reglas compiladas se comparten (vía el registro) entre todos
+        los scorers que usan el mismo archivo.
+        
+        Returns:
+            True si se recargó
+        """
+        version = self.registry.version(self.config_path)
+        if version == self._config_version:
+            return False
+        
+        self._config_version = version
         self.config = self._load_config()
+        rules = self.registry.get_compiled(self.config_path, 'scoring_rules', self._compile_rules)
+        self._rules = rules if rules is not None else self._compile_rules(self.config)
+        return True
         
     def _load_config(self) -> Dict:
         """Carga la configuración de prioridades."""
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        except FileNotFoundError:
+        config = self.registry.load(self.config_path)
+        if config is None:
             print(f"⚠️  Archivo de configuración no encontrado: {self.config_path}")
             return self._get_default_config()
+        return config
     
     def _get_default_config(self) -> Dict:
         """Configuración por defecto si no existe el archivo."""
@@ -58,67 +99,116 @@ class NewsScorer:
             }
         }
     
+    @classmethod
+    def _compile_rules(cls, config: Dict) -> Dict:
+        """
+        Compila todas las keywords de la configuración en un único matcher.
+        
+        Cada regla de puntuación (keyword + tier + título/resumen) guarda
+        su posición en el orden en que se evaluaban una a una, para sumar
+        los puntos en el mismo orden y obtener exactamente el mismo score.
+        
+        Args:
+            config: Configuración de prioridades
+            
+        Returns:
+            Dict con el matcher y las reglas por ámbito
+        """
+        title_weight = config['scoring']['title_weight']
+        keyword_ids: Dict[str, int] = {}
+        
+        def keyword_id(keyword: str) -> int:
+            return keyword_ids.setdefault(keyword.lower(), len(keyword_ids))
+        
+        exclude_ids = {
+            keyword_id(keyword) for keyword in config.get('exclude_keywords', [])
+        }
+        
+        # Reglas por ámbito: {keyword_id: [índices de regla]}
+        summary_rules: Dict[int, List[int]] = {}
+        title_rules: Dict[int, List[int]] = {}
+        full_text_rules: Dict[int, List[int]] = {}
+        rule_points: List[float] = []
+        
+        def add_rule(rules: Dict[int, List[int]], kid: int, points: float):
+            rules.setdefault(kid, []).append(len(rule_points))
+            rule_points.append(points)
+        
+        for tier, points in cls.TIER_POINTS:
+            for keyword in config.get(tier, []):
+                kid = keyword_id(keyword)
+                add_rule(summary_rules, kid, points)
+                add_rule(title_rules, kid, points * title_weight)
+        
+        for keyword in config.get('low_priority_keywords', []):
+            add_rule(full_text_rules, keyword_id(keyword), cls.LOW_PRIORITY_POINTS)
+        
+        return {
+            'matcher': KeywordMatcher(keyword_ids),
+            'exclude_ids': exclude_ids,
+            'summary_rules': summary_rules,
+            'title_rules': title_rules,
+            'full_text_rules': full_text_rules,
+            'rule_points': rule_points
+        }
+    
     def score_news(self, news_item: Dict) -> float:
         """
         Calcula el puntaje de relevancia de una noticia.
         
+        El título y el resumen se recorren una sola vez con el autómata;
+        la posición de cada coincidencia indica si cayó en el título o en
+        el resumen.
+        
         Args:
             news_item: Diccionario con la información de la noticia
             
         Returns:
             Puntaje de relevancia (float)
         """
-        score = 0.0
         title = news_item.get('title', '').lower()
         summary = news_item.get('summary', '').lower()
         source = news_item.get('source', '')
         
         # Combinar título y resumen para análisis
         full_text = f"{title} {summary}"
+        title_end = len(title)
+        
+        rules = self._rules
+        matcher = rules['matcher']
+        
+        always = matcher.always_matched
+        in_title = set(always)
+        in_summary = set(always)
+        in_full_text = set(always)
+        
+        for kid, start, end in matcher.iter_matches(full_text):
+            in_full_text.add(kid)
+            if end <= title_end:
+                in_title.add(kid)
+            elif start > title_end:
+                in_summary.add(kid)
         
         # 1. Verificar palabras excluidas (descarta inmediatamente)
-        exclude_keywords = self.config.get('exclude_keywords', [])
-        for keyword in exclude_keywords:
-            if keyword.lower() in full_text:
-                return -100  # Puntaje muy negativo para descartar
-        
-        # 2. Keywords de ULTRA ALTA prioridad (lanzamientos, versiones)
-        ultra_high_keywords = self.config.get('ultra_high_priority_keywords', [])
-        for keyword in ultra_high_keywords:
-            keyword_lower = keyword.lower()
-            # Buscar en resumen
-            if keyword_lower in summary:
-                score += 25
-            # Buscar en título (vale MUCHO más)
-            if keyword_lower in title:
-                score += 25 * self.config['scoring']['title_weight']
-        
-        # 3. Keywords de ALTA prioridad
-        high_keywords = self.config.get('high_priority_keywords', [])
-        for keyword in high_keywords:
-            keyword_lower = keyword.lower()
-            # Buscar en resumen
-            if keyword_lower in summary:
-                score += 18
-            # Buscar en título (vale más)
-            if keyword_lower in title:
-                score += 18 * self.config['scoring']['title_weight']
-        
-        # 4. Keywords de MEDIA prioridad
-        medium_keywords = self.config.get('medium_priority_keywords', [])
-        for keyword in medium_keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in summary:
-                score += 10
-            if keyword_lower in title:
-                score += 10 * self.config['scoring']['title_weight']
-        
-        # 5. Keywords de BAJA prioridad
-        low_keywords = self.config.get('low_priority_keywords', [])
-        for keyword in low_keywords:
-            keyword_lower = keyword.lower()
-            if keyword_lower in full_text:
-                score += 3
+        if not in_full_text.isdisjoint(rules['exclude_ids']):
+            return -100  # Puntaje muy negativo para descartar
+        
+        # 2-5. Keywords por prioridad (ultra alta, alta, media en título y
+        # resumen; baja en el texto completo)
+        matched_rules = []
+        for matched, scope_rules in (
+            (in_summary, rules['summary_rules']),
+            (in_title, rules['title_rules']),
+            (in_full_text, rules['full_text_rules'])
+        ):
+            for kid in matched:
+                matched_rules.extend(scope_rules.get(kid, ()))
+        matched_rules.sort()
+        
+        rule_points = rules['rule_points']
+        score = 0.0
+        for rule in matched_rules:
+            score += rule_points[rule]
         
         # 6. Bonus por fuente prioritaria (fuentes oficiales)
         priority_sources = self.config.get('priority_sources', [])
@@ -132,6 +222,37 @@ class NewsScorer:
         
         return score
     
+    def score_batch(self, news_list: List[Dict]) -> List[float]:
+        """
+        Calcula el puntaje de una lista de noticias.
+        
+        Antes de puntuar comprueba si priorities.yaml cambió.
+        
+        Args:
+            news_list: Lista de noticias
+            
+        Returns:
+            Lista de puntajes en el mismo orden
+        """
+        self.refresh()
+        score_news = self.score_news
+        return [score_news(news_item) for news_item in news_list]
+    
+    def iter_scored(self, news_iter: Iterable[Dict]) -> Iterator[Tuple[float, Dict]]:
+        """
+        Puntúa noticias de forma perezosa (sirve con generadores).
+        
+        Args:
+            news_iter: Iterable de noticias
+            
+        Returns:
+            Iterador de (puntaje, noticia)
+        """
+        self.refresh()
+        score_news = self.score_news
+        for news_item in news_iter:
+            yield score_news(news_item), news_item
+    
     def score_multiple_news(self, news_list: List[Dict]) -> List[Dict]:
         """
         Califica múltiples noticias y las ordena por relevancia.
@@ -146,8 +267,7 @@ class NewsScorer:
         
         # Calcular score para cada noticia
         scored_news = []
-        for news_item in news_list:
-            score = self.score_news(news_item)
+        for news_item, score in zip(news_list, self.score_batch(news_list)):
             news_with_score = news_item.copy()
             news_with_score['relevance_score'] = score
             scored_news.append(news_with_score)
@@ -167,18 +287,49 @@ class NewsScorer:
         """
         Obtiene las mejores N noticias.
         
+        Selección top-k con un heap acotado: memoria O(limit) y tiempo
+        O(n log limit), sin copiar ni ordenar toda la lista. A igual
+        puntaje se conserva el orden original. Solo las noticias
+        seleccionadas reciben `relevance_score` (se añade sobre el
+        propio dict, sin copiarlo).
+        
         Args:
-            news_list: Lista de noticias
+            news_list: Lista (o generador) de noticias
             limit: Número máximo de noticias a retornar
             
         Returns:
-            Lista de las mejores noticias
+            Lista de las mejores noticias, de mayor a menor puntaje
         """
         if limit is None:
             limit = self.config['scoring'].get('max_tweets_per_run', 5)
         
-        scored_news = self.score_multiple_news(news_list)
-        top_news = scored_news[:limit]
+        self.refresh()
+        min_score = self.config['scoring'].get('min_score', 10)
+        
+        # Min-heap de (puntaje, -posición, noticia): la raíz es la peor seleccionada
+        heap = []
+        total = 0
+        passed = 0
+        for index, (score, news_item) in enumerate(self.iter_scored(news_list)):
+            total += 1
+            if score < min_score:
+                continue
+            passed += 1
+            if limit <= 0:
+                continue
+            entry = (score, -index, news_item)
+            if len(heap) < limit:
+                heapq.heappush(heap, entry)
+            elif entry[:2] > heap[0][:2]:
+                heapq.heapreplace(heap, entry)
+        
+        print(f"🧠 {total} noticias calificadas")
+        print(f"✅ {passed} noticias pasaron el filtro (score mínimo: {min_score})")
+        
+        top_news = []
+        for score, _, news_item in sorted(heap, key=lambda entry: entry[:2], reverse=True):
+            news_item['relevance_score'] = score
+            top_news.append(news_item)
         
         print(f"\n🏆 Top {len(top_news)} noticias seleccionadas:")
         for i, news in enumerate(top_news, 1):
@@ -190,10 +341,11 @@ class NewsScorer:
 # Ejemplo de uso
 if __name__ == "__main__":
     import json
+    from utils.news_item import json_default, to_news_items
     
     # Cargar noticias
     with open("data/news.json", 'r', encoding='utf-8') as f:
-        news = json.load(f)
+        news = to_news_items(json.load(f))
     
     # Crear scorer
     scorer = NewsScorer()
@@ -203,7 +355,7 @@ if __name__ == "__main__":
     
     # Guardar noticias filtradas
     with open("data/filtered_news.json", 'w', encoding='utf-8') as f:
-        json.dump(top_news, f, ensure_ascii=False, indent=2)
+        json.dump(top_news, f, ensure_ascii=False, indent=2, default=json_default)
     
     print(f"\n💾 Top noticias guardadas en: data/filtered_news.json")
 
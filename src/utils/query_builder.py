@@ -4,11 +4,16 @@ Query Builder - Construye queries específicas desde config
 Lee advanced_queries.yaml y construye búsquedas optimizadas
 """
 
-import yaml
+import sys
 from pathlib import Path
 from typing import List, Dict
 import random
 
+# Agregar src al path para imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.config_registry import ConfigRegistry, get_config_registry
+
 
 class QueryBuilder:
     """
@@ -17,24 +22,46 @@ class QueryBuilder:
     Usa config/advanced_queries.yaml para generar búsquedas específicas
     """
     
-    def __init__(self, config_path: str = "config/advanced_queries.yaml"):
+    # Categorías cuyas queries se consideran de alta prioridad
+    HIGH_PRIORITY_CATEGORIES = [
+        'ai_coding',
+        'hardware_ai',
+        'frameworks',
+        'databases'
+    ]
+    
+    def __init__(
+        self,
+        config_path: str = "config/advanced_queries.yaml",
+        registry: ConfigRegistry = None
+    ):
         """
         Inicializa el builder.
         
         Args:
             config_path: Ruta al archivo de configuración
+            registry: Registro de configuración (por defecto, el del proceso)
         """
         self.config_path = Path(config_path)
-        self.config = self._load_config()
-    
-    def _load_config(self) -> Dict:
-        """Carga configuración desde YAML."""
-        if not self.config_path.exists():
+        self.registry = registry or get_config_registry()
+        if self.registry.load(self.config_path) is None:
             print(f"⚠️  Config no encontrado: {self.config_path}")
-            return {"categories": {}}
-        
-        with open(self.config_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+    
+    @property
+    def config(self) -> Dict:
+        """Configuración actual (se recarga si el archivo cambia)."""
+        config = self.registry.load(self.config_path)
+        return config if config is not None else {"categories": {}}
+    
+    @classmethod
+    def _compile_high_priority_queries(cls, config: Dict) -> List[str]:
+        """Lista (sin mezclar) de queries de las categorías prioritarias."""
+        categories = config.get('categories', {})
+        queries = []
+        for category in cls.HIGH_PRIORITY_CATEGORIES:
+            if category in categories:
+                queries.extend(categories[category])
+        return queries
     
     def get_queries_by_category(
         self,
@@ -93,20 +120,13 @@ class QueryBuilder:
         Returns:
             Lista de queries prioritarias
         """
-        categories = self.config.get('categories', {})
-        
-        # Priorizar ciertas categorías
-        high_priority_categories = [
-            'ai_coding',
-            'hardware_ai',
-            'frameworks',
-            'databases'
-        ]
-        
-        queries = []
-        for category in high_priority_categories:
-            if category in categories:
-                queries.extend(categories[category])
+        compiled = self.registry.get_compiled(
+            self.config_path,
+            'high_priority_queries',
+            self._compile_high_priority_queries
+        )
+        # Copia: la lista compilada se comparte entre builders
+        queries = list(compiled or [])
         
         # Shuffle y limitar
         random.shuffle(queries)
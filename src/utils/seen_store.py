@@ -0,0 +1,206 @@
+"""
+Seen URL Store - Registro persistente de noticias ya vistas
+
+Reemplaza data/seen_urls.txt (un set en memoria que se reescribía entero
+en cada iteración) por una base SQLite:
+- Claves de ancho fijo: MD5 de 16 bytes (URL o título)
+- Lookups O(1) por índice, sin cargar todo en memoria al arrancar
+- Inserciones incrementales (solo se escribe lo nuevo)
+- Expiración por antigüedad y tamaño máximo acotado
+"""
+
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+
+class SeenURLStore:
+    """Almacén de claves vistas respaldado por SQLite."""
+
+    def __init__(
+        self,
+        db_path: str = "data/seen_urls.db",
+        ttl_days: float = 30,
+        max_entries: int = 500_000,
+        legacy_path: Optional[str] = "data/seen_urls.txt"
+    ):
+        """
+        Inicializa el almacén.
+
+        Args:
+            db_path: Ruta de la base SQLite
+            ttl_days: Días que una clave se considera vista
+            max_entries: Máximo de claves guardadas (se eliminan las más antiguas)
+            legacy_path: Archivo de texto antiguo a migrar (una sola vez)
+        """
+        self.db_path = Path(db_path)
+        self.ttl_seconds = ttl_days * 24 * 3600
+        self.max_entries = max_entries
+
+        self.db_path.parent.mkdir(exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " key BLOB PRIMARY KEY,"
+            " seen_at INTEGER NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS seen_at_idx ON seen (seen_at)")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+        )
+        self.conn.commit()
+
+        if legacy_path:
+            self._migrate_legacy_file(Path(legacy_path))
+
+    @staticmethod
+    def make_key(value: str) -> bytes:
+        """
+        Convierte una URL o título en una clave de 16 bytes.
+
+        Args:
+            value: Texto a convertir
+
+        Returns:
+            Digest MD5 (16 bytes)
+        """
+        return hashlib.md5(value.encode()).digest()
+
+    def contains(self, key: bytes) -> bool:
+        """
+        Verifica si una clave fue vista y no ha expirado.
+
+        Args:
+            key: Clave de 16 bytes
+
+        Returns:
+            True si ya fue vista
+        """
+        cutoff = int(time.time() - self.ttl_seconds)
+        row = self.conn.execute(
+            "SELECT 1 FROM seen WHERE key = ? AND seen_at >= ?",
+            (key, cutoff)
+        ).fetchone()
+        return row is not None
+
+    def add(self, key: bytes, seen_at: Optional[int] = None):
+        """
+        Marca una clave como vista (queda pendiente hasta `commit`).
+
+        Args:
+            key: Clave de 16 bytes
+            seen_at: Timestamp epoch (por defecto: ahora)
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)",
+            (key, int(seen_at if seen_at is not None else time.time()))
+        )
+
+    def add_many(self, keys: Iterable[bytes], seen_at: Optional[int] = None):
+        """
+        Marca varias claves como vistas.
+
+        Args:
+            keys: Claves de 16 bytes
+            seen_at: Timestamp epoch (por defecto: ahora)
+        """
+        timestamp = int(seen_at if seen_at is not None else time.time())
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO seen (key, seen_at) VALUES (?, ?)",
+            ((key, timestamp) for key in keys)
+        )
+
+    def iter_keys(self, since: int = 0) -> Iterator[bytes]:
+        """
+        Itera las claves vigentes (p.ej. para reconstruir un Bloom filter).
+
+        Args:
+            since: Solo claves marcadas a partir de este timestamp epoch
+
+        Returns:
+            Iterador de claves de 16 bytes
+        """
+        cutoff = max(int(time.time() - self.ttl_seconds), int(since))
+        for (key,) in self.conn.execute(
+            "SELECT key FROM seen WHERE seen_at >= ?", (cutoff,)
+        ):
+            yield key
+
+    def get_meta(self, name: str) -> Optional[str]:
+        """Lee un valor de metadatos guardado en la base."""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, name: str, value: str):
+        """Guarda un valor de metadatos (se persiste en el próximo `commit`)."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (name, value) VALUES (?, ?)", (name, value)
+        )
+
+    def commit(self):
+        """Persiste las claves añadidas y aplica expiración y tamaño máximo."""
+        self.prune()
+        self.conn.commit()
+
+    def prune(self) -> int:
+        """
+        Elimina claves expiradas y las más antiguas si se supera el máximo.
+
+        Returns:
+            Número de claves eliminadas
+        """
+        cutoff = int(time.time() - self.ttl_seconds)
+        removed = self.conn.execute(
+            "DELETE FROM seen WHERE seen_at < ?", (cutoff,)
+        ).rowcount
+
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            removed += self.conn.execute(
+                "DELETE FROM seen WHERE key IN ("
+                " SELECT key FROM seen ORDER BY seen_at ASC LIMIT ?"
+                ")",
+                (excess,)
+            ).rowcount
+
+        return removed
+
+    def close(self):
+        """Guarda cambios pendientes y cierra la base."""
+        self.commit()
+        self.conn.close()
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def _migrate_legacy_file(self, legacy_file: Path):
+        """Importa data/seen_urls.txt una única vez."""
+        if self.get_meta('legacy_imported') or not legacy_file.exists():
+            return
+
+        keys = []
+        with open(legacy_file, 'r') as f:
+            for line in f:
+                value = line.strip()
+                if not value:
+                    continue
+                # Las líneas de 32 hex son hashes MD5 de títulos ya calculados
+                if len(value) == 32:
+                    try:
+                        keys.append(bytes.fromhex(value))
+                        continue
+                    except ValueError:
+                        pass
+                keys.append(self.make_key(value))
+
+        self.add_many(keys)
+        self.set_meta('legacy_imported', str(int(time.time())))
+        self.commit()
+        print(f"   📦 Migradas {len(keys)} URLs vistas desde {legacy_file}")